@@ -0,0 +1,77 @@
+"""
+Benchmark MovieDatabaseFromAPI builds against a local TMDb stand-in server simulating latency.
+
+The stand-in server lives with the tests, so run the script from the
+repository root with `python -m scripts.benchmark_api_build`.
+"""
+
+import logging
+import time
+
+from hollywood_pub_sub.logger import logger
+from hollywood_pub_sub.movie import Movie
+from hollywood_pub_sub.movie_database_from_api import MovieDatabaseFromAPI
+from tests.tmdb_stub import TMDbStubServer
+
+
+COMPOSERS = 20
+MOVIES_PER_COMPOSER = 5
+LATENCY = 0.05  # Simulated round-trip to TMDb, in seconds
+RATE_LIMIT = 1000.0  # High enough for the rate limiter not to be the bottleneck
+WORKER_COUNTS = [1, 4, 8, 16, 32]
+
+
+def benchmark(server: TMDbStubServer, composers: list[str], max_workers: int) -> float:
+    """
+    Measure the duration of a database build.
+
+    Parameters
+    ----------
+    server : TMDbStubServer
+        Running stand-in server.
+    composers : list[str]
+        Composers to fetch.
+    max_workers : int
+        Number of concurrent requests.
+
+    Returns
+    -------
+    float
+        Duration of the build, in seconds.
+
+    """
+    start = time.perf_counter()
+    db = MovieDatabaseFromAPI(
+        api_key="benchmark",
+        max_movies_per_composer=MOVIES_PER_COMPOSER,
+        composers=composers,
+        max_workers=max_workers,
+        rate_limit=RATE_LIMIT,
+        BASE_URL=server.url,
+    )
+    duration = time.perf_counter() - start
+    db.close()
+    assert len(db.movies) == COMPOSERS * MOVIES_PER_COMPOSER
+    return duration
+
+
+def main() -> None:
+    """Print the build time for increasing concurrency."""
+    # Silence build logging so that only fetching is measured
+    logger.setLevel(logging.WARNING)
+    composers = [f"Composer {idx}" for idx in range(COMPOSERS)]
+    movies = [
+        Movie(title=f"Movie {idx}", director="Director", composer=composers[idx % COMPOSERS], cast=["Actor"], year=2000)
+        for idx in range(COMPOSERS * MOVIES_PER_COMPOSER)
+    ]
+    serial = None
+    print(f"{'workers':>8} {'total (s)':>10} {'speedup':>8}")
+    with TMDbStubServer.from_movies(movies, latency=LATENCY) as server:
+        for max_workers in WORKER_COUNTS:
+            duration = benchmark(server, composers, max_workers)
+            serial = serial or duration
+            print(f"{max_workers:>8} {duration:>10.3f} {serial / duration:>7.1f}x")
+
+
+if __name__ == "__main__":
+    main()
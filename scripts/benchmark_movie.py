@@ -0,0 +1,68 @@
+"""Benchmark Movie construction throughput: settings-based model, plain model and bulk TypeAdapter validation."""
+
+import sys
+import time
+
+from pydantic import ConfigDict
+from pydantic_settings import BaseSettings
+
+from hollywood_pub_sub.movie import Movie
+
+
+MOVIES = 1_000_000
+
+
+class SettingsMovie(BaseSettings):
+    """Former Movie definition, consulting settings sources on every instantiation."""
+
+    title: str
+    director: str
+    composer: str
+    cast: list[str]
+    year: int
+
+    model_config = ConfigDict(extra="forbid")
+
+
+def benchmark(label: str, build, data: list[dict]) -> None:
+    """
+    Print the construction throughput of one strategy.
+
+    Parameters
+    ----------
+    label : str
+        Name of the strategy.
+    build : Callable[[list[dict]], list]
+        Function building movies from raw fields.
+    data : list[dict]
+        Raw movie fields.
+
+    """
+    start = time.perf_counter()
+    movies = build(data)
+    duration = time.perf_counter() - start
+    assert len(movies) == len(data)
+    print(f"{label:>24} {duration:>10.2f} {len(data) / duration:>14,.0f}")
+
+
+def main() -> None:
+    """Print the construction time and throughput of each strategy for MOVIES movies (or argv[1])."""
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else MOVIES
+    data = [
+        {
+            "title": f"Movie {idx}",
+            "director": f"Director {idx % 1000}",
+            "composer": f"Composer {idx % 66}",
+            "cast": [f"Actor {idx % 5000}", f"Actor {(idx + 1) % 5000}"],
+            "year": 1950 + idx % 75,
+        }
+        for idx in range(count)
+    ]
+    print(f"{'construction':>24} {'total (s)':>10} {'movies/s':>14}")
+    benchmark("BaseSettings (before)", lambda rows: [SettingsMovie(**row) for row in rows], data)
+    benchmark("BaseModel", lambda rows: [Movie(**row) for row in rows], data)
+    benchmark("Movie.validate_many", Movie.validate_many, data)
+
+
+if __name__ == "__main__":
+    main()
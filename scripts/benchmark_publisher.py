@@ -0,0 +1,66 @@
+"""Benchmark Publisher.publish cost as the number of subscribers grows."""
+
+import logging
+import time
+
+from hollywood_pub_sub.logger import logger
+from hollywood_pub_sub.movie import Movie
+from hollywood_pub_sub.publisher import Publisher
+from hollywood_pub_sub.subscriber import Subscriber
+
+
+SUBSCRIBER_COUNTS = [66, 1_000, 10_000, 100_000]
+PUBLICATIONS = 1_000
+
+
+def benchmark(subscriber_count: int, keyed: bool) -> float:
+    """
+    Measure the mean cost of one publication.
+
+    Parameters
+    ----------
+    subscriber_count : int
+        Number of composer subscribers registered on the publisher.
+    keyed : bool
+        Whether subscribers register under their composer name or as broadcast listeners.
+
+    Returns
+    -------
+    float
+        Mean duration of a publication, in microseconds.
+
+    """
+    composers = [f"Composer {idx}" for idx in range(subscriber_count)]
+    movies = [
+        Movie(title=f"Movie {idx}", director="Director", composer=composers[idx % subscriber_count], cast=[], year=2000)
+        for idx in range(PUBLICATIONS)
+    ]
+    publisher = Publisher(movies=movies)
+    for composer in composers:
+        # Threshold is never reached so that the benchmark only measures dispatch
+        subscriber = Subscriber(name=composer, winning_threshold=PUBLICATIONS + 1)
+        publisher.subscribe(
+            subscriber.on_movie_published,
+            key=composer if keyed else None,
+            batch_callback=subscriber.on_movies_published,
+        )
+
+    start = time.perf_counter()
+    for movie in movies:
+        publisher.publish(movie)
+    return (time.perf_counter() - start) / PUBLICATIONS * 1e6
+
+
+def main() -> None:
+    """Print the mean publication cost for broadcast and keyed subscriptions."""
+    # Silence game logging so that only dispatch is measured
+    logger.setLevel(logging.WARNING)
+    print(f"{'subscribers':>12} {'broadcast (µs)':>16} {'keyed (µs)':>12}")
+    for subscriber_count in SUBSCRIBER_COUNTS:
+        broadcast = benchmark(subscriber_count, keyed=False)
+        keyed = benchmark(subscriber_count, keyed=True)
+        print(f"{subscriber_count:>12} {broadcast:>16.1f} {keyed:>12.1f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,71 @@
+"""Benchmark serial and pooled Publisher dispatch with mixed fast and slow callbacks."""
+
+import logging
+import time
+
+from hollywood_pub_sub.logger import logger
+from hollywood_pub_sub.movie import Movie
+from hollywood_pub_sub.publisher import Publisher
+
+
+FAST_CALLBACKS = 60
+SLOW_CALLBACKS = 6
+SLOW_CALLBACK_DELAY = 0.01  # Blocking work such as a disk write or a local service call
+PUBLICATIONS = 50
+POOL_SIZES = [None, 2, 4, 8, 16]
+
+
+def benchmark(max_workers: int | None) -> float:
+    """
+    Measure the total time spent publishing movies to mixed fast and slow callbacks.
+
+    Parameters
+    ----------
+    max_workers : int, optional
+        Number of dispatch lanes, or None for serial dispatch.
+
+    Returns
+    -------
+    float
+        Total duration of the publications, in seconds.
+
+    """
+    movies = [
+        Movie(title=f"Movie {idx}", director="Director", composer="Composer", cast=[], year=2000)
+        for idx in range(PUBLICATIONS)
+    ]
+    received = []
+
+    def slow_callback(movie: Movie) -> None:
+        time.sleep(SLOW_CALLBACK_DELAY)
+        received.append(movie)
+
+    with Publisher(movies=movies, max_workers=max_workers) as publisher:
+        for idx in range(FAST_CALLBACKS + SLOW_CALLBACKS):
+            # Distinct function objects so that each one is pinned to its own lane
+            if idx % 11 == 0:
+                publisher.subscribe(lambda movie: slow_callback(movie))
+            else:
+                publisher.subscribe(lambda movie: received.append(movie))
+
+        start = time.perf_counter()
+        for movie in movies:
+            publisher.publish(movie)
+        return time.perf_counter() - start
+
+
+def main() -> None:
+    """Print the publication time of serial and pooled dispatch."""
+    # Silence game logging so that only dispatch is measured
+    logger.setLevel(logging.WARNING)
+    serial = None
+    print(f"{'dispatch':>10} {'total (s)':>10} {'speedup':>8}")
+    for max_workers in POOL_SIZES:
+        duration = benchmark(max_workers)
+        serial = serial or duration
+        label = "serial" if max_workers is None else f"pool {max_workers}"
+        print(f"{label:>10} {duration:>10.3f} {serial / duration:>7.1f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -15,7 +15,7 @@ def main() -> None:
     None
 
     """
-    # Build movie database with movies from TMDb API
+    # Build movie database with movies from TMDb API, resuming an interrupted build from its journal
     api_key = os.getenv("TMDB_API_KEY")
     movie_db = MovieDatabaseFromAPI(
         api_key=api_key,
@@ -27,6 +27,7 @@ def main() -> None:
             "Michel Legrand",
         ],
         max_movies_per_composer=5,
+        journal_path=Path("movie_database.journal.jsonl"),
     )
     movie_db.to_json(path=Path("movie_database.json"))
 
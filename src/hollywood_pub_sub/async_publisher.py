@@ -0,0 +1,240 @@
+"""Module defining AsyncPublisher, which publishes movies to subscribers through bounded asyncio queues."""
+
+import asyncio
+from collections.abc import Awaitable, Callable
+import inspect
+from typing import Literal
+
+from hollywood_pub_sub.logger import logger
+from hollywood_pub_sub.movie import Movie
+from hollywood_pub_sub.publisher import Publisher
+
+
+Backpressure = Literal["block", "drop_oldest", "drop_newest"]
+BACKPRESSURE_POLICIES: tuple[Backpressure, ...] = ("block", "drop_oldest", "drop_newest")
+
+
+class AsyncSubscription:
+    """
+    Subscriber callback together with its own bounded queue and delivery task.
+
+    Attributes
+    ----------
+    callback : Callable[[Movie], None | Awaitable[None]]
+        Plain or coroutine function called with each delivered movie.
+    queue : asyncio.Queue
+        Movies waiting to be delivered to the callback.
+    dropped : int
+        Number of movies dropped because the queue was full.
+
+    """
+
+    def __init__(self, callback: Callable[[Movie], None | Awaitable[None]], maxsize: int):
+        """Initialize an AsyncSubscription."""
+        self.callback = callback
+        self.queue: asyncio.Queue[Movie] = asyncio.Queue(maxsize=maxsize)
+        self.dropped = 0
+        self._task: asyncio.Task | None = None
+
+    def start(self) -> None:
+        """Start delivering queued movies, if not already started."""
+        if self._task is None:
+            self._task = asyncio.get_running_loop().create_task(self._deliver())
+
+    async def stop(self) -> None:
+        """Stop delivering movies, leaving the queued ones undelivered."""
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+
+    async def _deliver(self) -> None:
+        """Call the callback with each queued movie, awaiting it if it is a coroutine."""
+        while True:
+            movie = await self.queue.get()
+            try:
+                result = self.callback(movie)
+                if inspect.isawaitable(result):
+                    await result
+            except Exception as e:
+                logger.warning(f"⚠️ Subscriber callback failed for movie {movie.title}: {e}")
+            finally:
+                self.queue.task_done()
+
+
+class AsyncPublisher:
+    """
+    Asynchronous publisher delivering movies to each subscriber through its own bounded queue.
+
+    Publishing only enqueues movies, so a slow subscriber does not delay the
+    others nor the publisher. When a subscriber queue is full, the backpressure
+    policy decides whether publishing waits for room ("block"), evicts the
+    oldest queued movie ("drop_oldest") or discards the new one ("drop_newest").
+    Subscriptions are routed like Publisher ones: keyed subscribers only
+    receive the movies of their composer, the others receive every movie.
+
+    Attributes
+    ----------
+    movies : List[Movie]
+        List of Movie instances to publish.
+    maxsize : int
+        Capacity of each subscriber queue.
+    backpressure : Backpressure
+        Policy applied when a subscriber queue is full.
+    subscriptions : List[AsyncSubscription]
+        Broadcast subscriptions.
+    keyed_subscriptions : Dict[str, List[AsyncSubscription]]
+        Subscriptions indexed by routing key (composer name).
+
+    """
+
+    def __init__(self, movies: list[Movie], maxsize: int = 100, backpressure: Backpressure = "block"):
+        """
+        Initialize AsyncPublisher.
+
+        Parameters
+        ----------
+        movies : List[Movie]
+            List of Movie instances to be published.
+        maxsize : int
+            Capacity of each subscriber queue. Defaults to 100.
+        backpressure : Backpressure
+            Policy applied when a subscriber queue is full. Defaults to "block".
+
+        Raises
+        ------
+        ValueError
+            If the queue capacity is not strictly positive or the policy is unknown.
+
+        """
+        if maxsize < 1:
+            raise ValueError("Subscriber queue capacity must be strictly positive.")
+        if backpressure not in BACKPRESSURE_POLICIES:
+            raise ValueError(
+                f"Unknown backpressure policy '{backpressure}', expected one of {', '.join(BACKPRESSURE_POLICIES)}."
+            )
+        self.movies = movies
+        self.maxsize = maxsize
+        self.backpressure = backpressure
+        self.subscriptions: list[AsyncSubscription] = []
+        self.keyed_subscriptions: dict[str, list[AsyncSubscription]] = {}
+
+    @property
+    def dropped(self) -> int:
+        """Return the total number of movies dropped by backpressure."""
+        return sum(subscription.dropped for subscription in self._all_subscriptions())
+
+    def subscribe(self, callback: Callable[[Movie], None | Awaitable[None]], key: str | None = None) -> None:
+        """
+        Subscribe a plain or coroutine callback function to the publisher.
+
+        Parameters
+        ----------
+        callback : Callable[[Movie], None | Awaitable[None]]
+            Function to be called when a movie is delivered.
+            It should accept a single argument: the Movie instance.
+        key : str, optional
+            Routing key (composer name) the callback is interested in.
+            If omitted, the callback receives every published movie.
+
+        """
+        subscription = AsyncSubscription(callback, maxsize=self.maxsize)
+        if key is None:
+            self.subscriptions.append(subscription)
+        else:
+            self.keyed_subscriptions.setdefault(key, []).append(subscription)
+
+    async def publish(self, movie: Movie) -> None:
+        """
+        Enqueue a movie for its keyed subscribers and all broadcast subscribers.
+
+        With the "block" policy, waits until every target queue has room.
+
+        Parameters
+        ----------
+        movie : Movie
+            Movie instance to publish.
+
+        """
+        self._log(movie)
+        for subscription in self._targets(movie):
+            subscription.start()
+            if self.backpressure == "block":
+                await subscription.queue.put(movie)
+            else:
+                self._put_or_drop(subscription, movie)
+
+    def publish_nowait(self, movie: Movie) -> None:
+        """
+        Enqueue a movie without waiting, from a coroutine running in the event loop.
+
+        Parameters
+        ----------
+        movie : Movie
+            Movie instance to publish.
+
+        Raises
+        ------
+        asyncio.QueueFull
+            If the policy is "block" and a target queue is full. Earlier targets keep the movie.
+
+        """
+        self._log(movie)
+        for subscription in self._targets(movie):
+            subscription.start()
+            if self.backpressure == "block":
+                subscription.queue.put_nowait(movie)
+            else:
+                self._put_or_drop(subscription, movie)
+
+    async def join(self) -> None:
+        """Wait until every published movie has been delivered."""
+        for subscription in self._all_subscriptions():
+            await subscription.queue.join()
+
+    async def close(self) -> None:
+        """Wait for pending deliveries, then stop every subscriber task."""
+        await self.join()
+        for subscription in self._all_subscriptions():
+            await subscription.stop()
+
+    async def __aenter__(self) -> "AsyncPublisher":
+        """Return the publisher, to be closed when leaving the context."""
+        return self
+
+    async def __aexit__(self, *exc_info) -> None:
+        """Close the publisher."""
+        await self.close()
+
+    def _targets(self, movie: Movie) -> list[AsyncSubscription]:
+        """Return the subscriptions a movie must be delivered to."""
+        return [*self.keyed_subscriptions.get(Publisher.routing_key(movie), ()), *self.subscriptions]
+
+    def _all_subscriptions(self) -> list[AsyncSubscription]:
+        """Return every keyed and broadcast subscription."""
+        return [
+            *(subscription for subscriptions in self.keyed_subscriptions.values() for subscription in subscriptions),
+            *self.subscriptions,
+        ]
+
+    def _put_or_drop(self, subscription: AsyncSubscription, movie: Movie) -> None:
+        """Enqueue a movie, applying the drop policy if the queue is full."""
+        if subscription.queue.full():
+            subscription.dropped += 1
+            if self.backpressure == "drop_newest":
+                return
+            subscription.queue.get_nowait()
+            subscription.queue.task_done()
+        subscription.queue.put_nowait(movie)
+
+    @staticmethod
+    def _log(movie: Movie) -> None:
+        """Log the publication of a movie."""
+        logger.info(
+            f"📣 Publisher director {movie.director}:\n"
+            f"We are about to start shooting the movie {movie.title} ({movie.year})!\n"
+            "Who wants to score it?"
+        )
@@ -0,0 +1,57 @@
+"""Module providing atomic_write, which replaces a file only once its new content is complete and on disk."""
+
+from collections.abc import Iterator
+from contextlib import contextmanager
+import os
+from pathlib import Path
+import secrets
+import stat
+from typing import TextIO
+
+
+@contextmanager
+def atomic_write(path: Path, encoding: str = "utf-8") -> Iterator[TextIO]:
+    """
+    Write a text file through a temporary file renamed over it once complete.
+
+    The temporary file is created next to `path`, with the permissions of
+    the file it replaces, or else the default permissions of new files.
+    Its content is synced to disk before the rename, so that `path` holds
+    either its previous content or the complete new one, even after a
+    crash. If the block raises, the temporary file is deleted and `path`
+    is left untouched.
+
+    Parameters
+    ----------
+    path : Path
+        Path of the file to write.
+    encoding : str
+        Text encoding. Defaults to UTF-8.
+
+    Yields
+    ------
+    TextIO
+        Temporary file to write the content to.
+
+    """
+    path = Path(path)
+    while True:
+        temp_path = path.with_name(f".{path.name}.{secrets.token_hex(4)}.tmp")
+        try:
+            # Created like any new file, with the permissions allowed by the umask
+            descriptor = os.open(temp_path, os.O_WRONLY | os.O_CREAT | os.O_EXCL, 0o666)
+            break
+        except FileExistsError:
+            continue
+
+    try:
+        with os.fdopen(descriptor, "w", encoding=encoding) as file:
+            yield file
+            file.flush()
+            os.fsync(file.fileno())
+        if path.exists():
+            os.chmod(temp_path, stat.S_IMODE(path.stat().st_mode))
+        temp_path.replace(path)
+    except BaseException:
+        temp_path.unlink(missing_ok=True)
+        raise
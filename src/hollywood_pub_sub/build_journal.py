@@ -0,0 +1,130 @@
+"""Module defining BuildJournal, an append-only checkpoint journal of MovieDatabaseFromAPI builds."""
+
+import json
+from pathlib import Path
+import threading
+from typing import Any
+
+from hollywood_pub_sub.logger import logger
+
+
+class BuildJournal:
+    """
+    Append-only JSON lines journal recording the progress of a database build.
+
+    The first line holds the build parameters. Each following line records
+    either the TMDb ids of the movies credited to a composer or the fields
+    fetched for a movie, and is flushed as soon as it is written, so that a
+    build interrupted at any point can be resumed from the journal. A last
+    line truncated by a crash is ignored.
+
+    Parameters
+    ----------
+    path : Path
+        Path to the journal file, created if needed.
+    parameters : dict[str, Any]
+        Build parameters; resuming a journal written with other parameters raises a ValueError.
+
+    Attributes
+    ----------
+    path : Path
+        Path to the journal file.
+    parameters : dict[str, Any]
+        Build parameters.
+    credits : dict[str, list[int] | None]
+        Journaled TMDb movie ids by composer, None for composers not found.
+    movies : dict[int, dict]
+        Journaled movie fields by TMDb movie id.
+
+    """
+
+    def __init__(self, path: Path, parameters: dict[str, Any]):
+        """Load the journal if it exists, then open it for appending."""
+        self.path = Path(path)
+        self.parameters = parameters
+        self.credits: dict[str, list[int] | None] = {}
+        self.movies: dict[int, dict] = {}
+        self._lock = threading.Lock()
+        if self.path.exists() and self.path.stat().st_size:
+            self._load()
+            self._file = self.path.open("a", encoding="utf-8")
+        else:
+            self._file = self.path.open("w", encoding="utf-8")
+            self._append({"kind": "parameters", "parameters": parameters})
+
+    def record_credits(self, composer: str, credits: list[int] | None) -> None:
+        """
+        Record the TMDb ids of the movies credited to a composer.
+
+        Parameters
+        ----------
+        composer : str
+            Name of the composer.
+        credits : list[int], optional
+            TMDb ids of the movies of the composer, or None if the composer was not found.
+
+        """
+        with self._lock:
+            self.credits[composer] = credits
+            self._append({"kind": "credits", "composer": composer, "credits": credits})
+
+    def record_movie(self, movie_id: int, fields: dict) -> None:
+        """
+        Record the fields fetched for a movie.
+
+        Parameters
+        ----------
+        movie_id : int
+            TMDb movie id.
+        fields : dict
+            Movie fields, except the composer.
+
+        """
+        with self._lock:
+            self.movies[movie_id] = fields
+            self._append({"kind": "movie", "id": movie_id, "fields": fields})
+
+    def close(self) -> None:
+        """Close the journal file."""
+        self._file.close()
+
+    def discard(self) -> None:
+        """Close and delete the journal file, once the build is complete."""
+        self.close()
+        self.path.unlink(missing_ok=True)
+
+    def _append(self, record: dict) -> None:
+        """Write a record on its own line and flush it."""
+        self._file.write(json.dumps(record, ensure_ascii=False) + "\n")
+        self._file.flush()
+
+    def _load(self) -> None:
+        """
+        Read the records of an existing journal.
+
+        Raises
+        ------
+        ValueError
+            If the journal was written with other build parameters.
+
+        """
+        with self.path.open(encoding="utf-8") as file:
+            lines = file.read().split("\n")
+        truncated = bool(lines[-1])
+        records = [json.loads(line) for line in lines[:-1] if line]
+        if truncated:
+            # The last write was interrupted: drop the partial record so that appends start on a new line
+            logger.warning(f"⚠️ Ignoring truncated last record of build journal {self.path}")
+            with self.path.open("r+", encoding="utf-8") as file:
+                file.truncate(sum(len(line.encode()) + 1 for line in lines[:-1]))
+
+        if not records or records[0].get("kind") != "parameters" or records[0]["parameters"] != self.parameters:
+            raise ValueError(f"Build journal {self.path} was written with other parameters")
+        for record in records[1:]:
+            if record["kind"] == "credits":
+                self.credits[record["composer"]] = record["credits"]
+            elif record["kind"] == "movie":
+                self.movies[record["id"]] = record["fields"]
+        logger.info(
+            f"📒 Resuming build from {self.path}: {len(self.credits)} composers and {len(self.movies)} movies done"
+        )
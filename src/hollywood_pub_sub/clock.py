@@ -0,0 +1,181 @@
+"""Module defining the clocks pacing movie publications during a game."""
+
+from abc import ABC, abstractmethod
+import time
+
+
+class Clock(ABC):
+    """
+    Abstract base class pacing publications and keeping the game timestamp.
+
+    Timestamps are expressed in seconds since the clock was started, or
+    created if it was never started.
+    """
+
+    @abstractmethod
+    def start(self) -> None:
+        """Restart the timestamps from zero, when publishing begins."""
+        raise NotImplementedError("Subclasses must implement 'start'.")
+
+    @abstractmethod
+    def now(self) -> float:
+        """Return the current timestamp of the game, in seconds."""
+        raise NotImplementedError("Subclasses must implement 'now'.")
+
+    @abstractmethod
+    def tick(self) -> float:
+        """
+        Wait until the next publication is due.
+
+        Returns
+        -------
+        float
+            Timestamp of the next publication, in seconds.
+
+        """
+        raise NotImplementedError("Subclasses must implement 'tick'.")
+
+
+class RealTimeClock(Clock):
+    """
+    Clock sleeping a fixed interval between publications.
+
+    Parameters
+    ----------
+    interval : float
+        Pause after each publication, in seconds. Defaults to 0.5.
+
+    """
+
+    def __init__(self, interval: float = 0.5):
+        """Initialize a RealTimeClock."""
+        self.interval = interval
+        self._start = time.monotonic()
+
+    def start(self) -> None:
+        """Restart the timestamps from the current wall time."""
+        self._start = time.monotonic()
+
+    def now(self) -> float:
+        """Return the wall time elapsed since the clock was started."""
+        return time.monotonic() - self._start
+
+    def tick(self) -> float:
+        """Sleep for the configured interval and return the current timestamp."""
+        time.sleep(self.interval)
+        return self.now()
+
+
+class RateClock(Clock):
+    """
+    Clock pacing publications at a fixed rate, whatever the time spent publishing.
+
+    Publications are scheduled at `n / rate` seconds after the clock was started,
+    so that a slow publication is caught up on instead of delaying all the next ones.
+
+    Parameters
+    ----------
+    rate : float
+        Number of publications per second.
+
+    Raises
+    ------
+    ValueError
+        If `rate` is not strictly positive.
+
+    """
+
+    def __init__(self, rate: float):
+        """Initialize a RateClock."""
+        if rate <= 0:
+            raise ValueError("Publication rate must be strictly positive.")
+        self.rate = rate
+        self._start = time.monotonic()
+        self._ticks = 0
+
+    def start(self) -> None:
+        """Restart the schedule from the current wall time, so that no publication is overdue."""
+        self._start = time.monotonic()
+        self._ticks = 0
+
+    def now(self) -> float:
+        """Return the wall time elapsed since the clock was started."""
+        return time.monotonic() - self._start
+
+    def tick(self) -> float:
+        """Sleep until the next scheduled publication and return its timestamp."""
+        self._ticks += 1
+        due = self._ticks / self.rate
+        delay = due - self.now()
+        if delay > 0:
+            time.sleep(delay)
+        return due
+
+
+class VirtualClock(Clock):
+    """
+    Clock advancing a logical timestamp without ever sleeping.
+
+    Parameters
+    ----------
+    interval : float
+        Logical time between two publications, in seconds. Defaults to 0.5.
+
+    """
+
+    def __init__(self, interval: float = 0.5):
+        """Initialize a VirtualClock."""
+        self.interval = interval
+        self._now = 0.0
+
+    def start(self) -> None:
+        """Restart the logical timestamp from zero."""
+        self._now = 0.0
+
+    def now(self) -> float:
+        """Return the logical timestamp of the game."""
+        return self._now
+
+    def tick(self) -> float:
+        """Advance the logical timestamp by one interval and return it."""
+        self._now += self.interval
+        return self._now
+
+
+CLOCK_MODES = ("realtime", "rate", "virtual")
+
+
+def clock_factory(mode: str = "realtime", rate: float = 2.0) -> Clock:
+    """
+    Create a Clock from a CLI mode name.
+
+    Parameters
+    ----------
+    mode : str
+        One of "realtime" (fixed pause of 1 / rate seconds after each publication),
+        "rate" (publications scheduled at `rate` per second) or
+        "virtual" (no pause, logical timestamps spaced by 1 / rate seconds).
+    rate : float
+        Number of publications per second. Defaults to 2.0.
+
+    Returns
+    -------
+    Clock
+        The clock matching the mode.
+
+    Raises
+    ------
+    ValueError
+        If the mode is unknown or the rate is not strictly positive.
+
+    """
+    if rate <= 0:
+        raise ValueError("Publication rate must be strictly positive.")
+    if mode == "realtime":
+        return RealTimeClock(interval=1 / rate)
+    elif mode == "rate":
+        return RateClock(rate=rate)
+    elif mode == "virtual":
+        return VirtualClock(interval=1 / rate)
+    else:
+        raise ValueError(f"Unknown clock mode '{mode}', expected one of {', '.join(CLOCK_MODES)}.")
@@ -0,0 +1,154 @@
+"""Module resolving a shuffled game in closed form with NumPy, without dispatching any event."""
+
+from collections.abc import Sequence
+
+import numpy as np
+from pydantic import BaseModel
+
+from hollywood_pub_sub.movie import Movie
+
+
+# Length of the first publication prefix scanned for a winner, doubled until one is found
+_MIN_PREFIX = 4096
+
+
+class GameResult(BaseModel):
+    """
+    Outcome of a game played over a fixed publication order.
+
+    Attributes
+    ----------
+    winner : str, optional
+        Name of the winning composer, or None if nobody reached the threshold.
+    stop_index : int, optional
+        Index in the publication order of the movie that made the winner reach the threshold,
+        or None if nobody reached it.
+    standings : dict[str, int]
+        Number of movies collected by each composer when the game stopped,
+        sorted by decreasing count then by name.
+
+    """
+
+    winner: str | None
+    stop_index: int | None
+    standings: dict[str, int]
+
+
+def encode_composers(order: Sequence[Movie] | Sequence[str]) -> tuple[list[str], np.ndarray]:
+    """
+    Encode the composers of a publication order as integer ids.
+
+    Empty composer names have no subscriber in the game, as the database
+    aggregates leave them out: their movies are encoded as `len(names)`,
+    which `resolve_encoded` counts for no composer.
+
+    Parameters
+    ----------
+    order : Sequence[Movie] or Sequence[str]
+        Movies in publication order, or directly their composer names.
+
+    Returns
+    -------
+    tuple[list[str], np.ndarray]
+        The non-empty composer names indexed by id (in order of first appearance) and the id of each publication.
+
+    """
+    names = order if len(order) and isinstance(order[0], str) else [movie.composer for movie in order]
+    ids: dict[str, int] = {}
+    for name in names:
+        if name:
+            ids.setdefault(name, len(ids))
+    unsubscribed = len(ids)
+    codes = np.fromiter((ids.get(name, unsubscribed) for name in names), dtype=np.int64, count=len(names))
+    return list(ids), codes
+
+
+def resolve_encoded(codes: np.ndarray, threshold: int, n_composers: int) -> tuple[int | None, int | None, np.ndarray]:
+    """
+    Resolve a game over integer-encoded composers.
+
+    The winner is the composer whose `threshold`-th movie comes first in the order.
+    Per-composer counts are computed over a growing prefix of the order until one
+    reaches the threshold; positions in that prefix are then grouped by composer
+    with a stable sort, the position of each composer's `threshold`-th occurrence
+    is read from its group, and the argmin over these positions gives the winner
+    and the stopping index.
+
+    Parameters
+    ----------
+    codes : np.ndarray
+        Composer id of each publication, in publication order. Ids from `n_composers` on mark
+        publications without subscriber, counted for no composer.
+    threshold : int
+        Number of movies a composer must collect to win.
+    n_composers : int
+        Number of distinct composer ids (ids range from 0 to n_composers - 1).
+
+    Returns
+    -------
+    tuple[int | None, int | None, np.ndarray]
+        Winner id, stopping index, and per-composer counts at the stopping index.
+        Winner and stopping index are None if nobody reaches the threshold.
+
+    Raises
+    ------
+    ValueError
+        If `threshold` is lower than 1.
+
+    """
+    if threshold < 1:
+        raise ValueError("Winning threshold must be at least 1.")
+
+    # Grow a prefix until some composer reaches the threshold: the stopping index lies within it
+    prefix = min(codes.size, _MIN_PREFIX)
+    while True:
+        totals = np.bincount(codes[:prefix], minlength=n_composers)[:n_composers]
+        if totals.size and totals.max() >= threshold:
+            break
+        if prefix == codes.size:
+            return None, None, totals
+        prefix = min(codes.size, prefix * 2)
+
+    # Smallest unsigned ids let NumPy use a radix sort for the stable argsort
+    # Publications without subscriber sort after every composer group, so the group starts are unaffected
+    compact_codes = codes[:prefix].astype(np.min_scalar_type(n_composers), copy=False)
+    eligible = np.flatnonzero(totals >= threshold)
+    positions_by_composer = np.argsort(compact_codes, kind="stable")
+    group_starts = np.concatenate(([0], np.cumsum(totals)[:-1]))
+    kth_positions = positions_by_composer[group_starts[eligible] + threshold - 1]
+    best = int(np.argmin(kth_positions))
+    stop_index = int(kth_positions[best])
+    counts = np.bincount(codes[: stop_index + 1], minlength=n_composers)[:n_composers]
+    return int(eligible[best]), stop_index, counts
+
+
+def resolve_game(order: Sequence[Movie] | Sequence[str], threshold: int) -> GameResult:
+    """
+    Compute the outcome of a game from its publication order, without publishing anything.
+
+    The result is identical to publishing the movies one by one to composer
+    subscribers and stopping at the first one that reaches the threshold.
+    Movies with an empty composer name reach no subscriber, so they only
+    count in the stopping index.
+
+    Parameters
+    ----------
+    order : Sequence[Movie] or Sequence[str]
+        Movies in publication order (e.g. the shuffled movie list), or directly their composer names.
+    threshold : int
+        Number of movies a composer must collect to win.
+
+    Returns
+    -------
+    GameResult
+        Winner, stopping index and standings of the game.
+
+    """
+    names, codes = encode_composers(order)
+    winner, stop_index, counts = resolve_encoded(codes, threshold, len(names))
+    ranking = sorted(range(len(names)), key=lambda code: (-counts[code], names[code]))
+    return GameResult(
+        winner=names[winner] if winner is not None else None,
+        stop_index=stop_index,
+        standings={names[code]: int(counts[code]) for code in ranking},
+    )
@@ -1,17 +1,24 @@
 """Main CLI entry point for the Hollywood Publisher-Subscriber movie game."""
 
 import argparse
+from collections.abc import Iterable
+from contextlib import ExitStack
 import os
 from pathlib import Path
 import random
-import time
 
 from pydantic import FilePath
 
+from hollywood_pub_sub.clock import CLOCK_MODES, Clock, RealTimeClock, clock_factory
 from hollywood_pub_sub.logger import logger
+from hollywood_pub_sub.movie import Movie
+from hollywood_pub_sub.movie_database import MovieDatabase
 from hollywood_pub_sub.movie_database_factory import movie_database_factory
+from hollywood_pub_sub.movie_database_from_api import MovieDatabaseFromAPI
+from hollywood_pub_sub.movie_stream import window_shuffle
 from hollywood_pub_sub.publisher import Publisher
 from hollywood_pub_sub.settings import ComposerSettings
+from hollywood_pub_sub.simulation import simulate
 from hollywood_pub_sub.subscriber import Subscriber
 
 
@@ -20,6 +27,8 @@ def run_game(
     api_key: str | None = os.getenv("TMDB_API_KEY"),
     max_movies_per_composer: int | None = 5,
     winning_threshold: int | None = 3,
+    clock: Clock | None = None,
+    stream_window: int | None = None,
 ) -> None:
     """
     Run the Publisher-Subscriber movie game simulation.
@@ -34,39 +43,171 @@ def run_game(
         Maximum number of movies to fetch per composer from the API. Defaults to 5.
     winning_threshold : int, optional
         Number of collected movies needed by a subscriber to win. Defaults to 3.
+    clock : Clock, optional
+        Clock pacing the publications. Defaults to a RealTimeClock pausing 0.5 s after each movie.
+    stream_window : int, optional
+        When fetching from the API, publish movies while they are still being fetched, each one
+        drawn among the next `stream_window` fetched movies. Defaults to fetching every movie first.
+        Ignored when `json_path` is provided.
 
     """
     if json_path is None and api_key is None:
         logger.error("❌ You must provide either --json_path or --api_key (or set TMDB_API_KEY).")
         exit(1)
 
-    movie_db = movie_database_factory(
-        max_movies_per_composer=max_movies_per_composer,
-        api_key=api_key,
-        json_path=json_path,
-    )
+    with ExitStack() as stack:
+        if stream_window is not None and json_path is None:
+            # Movies are published as they arrive, so subscribers are the composers being fetched
+            movie_db = MovieDatabaseFromAPI(
+                api_key=api_key, max_movies_per_composer=max_movies_per_composer, streaming=True
+            )
+            stack.callback(movie_db.close)
+            composers = sorted(set(movie_db.composers))
+            movies = window_shuffle(stack.enter_context(movie_db.stream()), stream_window)
+        else:
+            movie_db = movie_database_factory(
+                max_movies_per_composer=max_movies_per_composer,
+                api_key=api_key,
+                json_path=json_path,
+            )
+            close_on_exit(stack, movie_db)
+            # Composers actually found in the database, from its cached aggregates
+            composers = movie_db.aggregates().composers
+            # Shuffle a copy, leaving the database order (and its cached indexes) untouched
+            movies = list(movie_db.movies)
+            random.shuffle(movies)
+
+        play(movies=movies, composers=composers, winning_threshold=winning_threshold, clock=clock)
+
+
+def play(
+    movies: Iterable[Movie], composers: list[str], winning_threshold: int | None = 3, clock: Clock | None = None
+) -> None:
+    """
+    Publish movies to one subscriber per composer until one of them wins.
 
-    random.shuffle(movie_db.movies)
+    Parameters
+    ----------
+    movies : Iterable[Movie]
+        Movies to publish, in order; they may still be being fetched.
+    composers : list[str]
+        Composers taking part in the game.
+    winning_threshold : int, optional
+        Number of collected movies needed by a subscriber to win. Defaults to 3.
+    clock : Clock, optional
+        Clock pacing the publications. Defaults to a RealTimeClock pausing 0.5 s after each movie.
 
-    publisher = Publisher(movies=movie_db.movies)
-    subscribers = [Subscriber(name=composer, winning_threshold=winning_threshold) for composer in movie_db.composers]
+    """
+    # A streamed game does not know its movies in advance
+    publisher = Publisher(movies=movies if isinstance(movies, list) else [])
+    # Subscribers report themselves here when crossing the threshold, so the loop never scans them
+    winners: list[Subscriber] = []
+    subscribers = [
+        Subscriber(name=composer, winning_threshold=winning_threshold, on_win=winners.append) for composer in composers
+    ]
 
     for subscriber in subscribers:
-        publisher.subscribe(subscriber.on_movie_published)
+        publisher.subscribe(
+            subscriber.on_movie_published, key=subscriber.name, batch_callback=subscriber.on_movies_published
+        )
 
+    clock = clock if clock is not None else RealTimeClock()
+    # Time spent loading the database is neither paced nor part of the game
+    clock.start()
     logger.info("🚀 Starting publishing announcements for new movies...\n")
 
-    for movie in movie_db.movies:
+    for movie in movies:
         publisher.publish(movie)
-        time.sleep(0.5)
+        clock.tick()
 
-        winners = [s for s in subscribers if s.has_won()]
         if winners:
             winner = winners[0]
             logger.info(f"🏆 Winner is subscriber composer {winner.name} with {winner.movies_count} movies!")
             break
     else:
         logger.info("👎 No winner reached the threshold.")
+    logger.info(f"⏱️ Game over at t={clock.now():.2f}s")
+
+
+def run_simulation(
+    n_games: int,
+    json_path: FilePath | None = None,
+    api_key: str | None = os.getenv("TMDB_API_KEY"),
+    max_movies_per_composer: int | None = None,
+    winning_threshold: int = 3,
+    seed: int | None = None,
+    workers: int | None = None,
+) -> None:
+    """
+    Run a Monte Carlo tournament of the movie game and log its results.
+
+    Parameters
+    ----------
+    n_games : int
+        Number of games to simulate.
+    json_path : FilePath, optional
+        Path to a local JSON file to load movies from. If provided, overrides API.
+    api_key : str, optional
+        TMDb API key. Used only if `json_path` is not provided. Defaults to environment variable TMDB_API_KEY.
+    max_movies_per_composer : int, optional
+        Maximum number of movies kept per composer. Also limits API fetching, which defaults to 5.
+    winning_threshold : int
+        Number of collected movies needed by a subscriber to win. Defaults to 3.
+    seed : int, optional
+        Seed of the tournament, for reproducible results.
+    workers : int, optional
+        Number of worker processes. Defaults to the number of CPU cores.
+
+    """
+    if json_path is None and api_key is None:
+        logger.error("❌ You must provide either --json_path or --api_key (or set TMDB_API_KEY).")
+        exit(1)
+
+    with ExitStack() as stack:
+        movie_db = movie_database_factory(
+            max_movies_per_composer=max_movies_per_composer or 5,
+            api_key=api_key,
+            json_path=json_path,
+        )
+        close_on_exit(stack, movie_db)
+
+        logger.info(f"🎲 Simulating {n_games} games...")
+        result = simulate(
+            movie_db=movie_db,
+            n_games=n_games,
+            winning_threshold=winning_threshold,
+            max_movies_per_composer=max_movies_per_composer,
+            seed=seed,
+            max_workers=workers,
+        )
+
+    logger.info(
+        "🏆 Win probabilities:\n"
+        + "\n".join(f"🎶 {composer}: {probability:.2%}" for composer, probability in result.win_probabilities.items())
+        + f"\n👎 No winner: {result.no_winner_probability:.2%}"
+    )
+    if result.mean_stopping_time is not None:
+        logger.info(
+            f"⏱️ Mean stopping time: {result.mean_stopping_time:.2f} movies\n"
+            + "\n".join(f"{movies} movies: {games} games" for movies, games in result.stopping_times.items())
+        )
+
+
+def close_on_exit(stack: ExitStack, movie_db: MovieDatabase) -> None:
+    """
+    Close a movie database when leaving an ExitStack, if it holds a resource.
+
+    Parameters
+    ----------
+    stack : ExitStack
+        Stack closing the database on exit.
+    movie_db : MovieDatabase
+        Database whose HTTP session, SQLite connection or memory map, if any, is released.
+
+    """
+    close = getattr(movie_db, "close", None)
+    if close is not None:
+        stack.callback(close)
 
 
 def print_composers() -> None:
@@ -75,6 +216,88 @@ def print_composers() -> None:
     logger.info("List of composers:\n" + "\n".join(f"🎶 {composer}" for composer in composers))
 
 
+def validate_json_path(json_path: str | None) -> FilePath | None:
+    """
+    Validate a JSON path given on the command line, exiting if it is not an existing file.
+
+    Parameters
+    ----------
+    json_path : str, optional
+        Path given by the user.
+
+    Returns
+    -------
+    FilePath, optional
+        Resolved path, or None if no path was given.
+
+    """
+    if not json_path:
+        return None
+    path_obj = Path(json_path).expanduser().resolve()
+    if not path_obj.exists() or not path_obj.is_file():
+        logger.error(f"❌ JSON path does not exist or is not a file: {path_obj}")
+        exit(1)
+    return FilePath(path_obj)
+
+
+def positive_float(value: str) -> float:
+    """
+    Parse a strictly positive number given on the command line.
+
+    Parameters
+    ----------
+    value : str
+        Value given by the user.
+
+    Returns
+    -------
+    float
+        Parsed number.
+
+    Raises
+    ------
+    argparse.ArgumentTypeError
+        If the value is not a strictly positive number.
+
+    """
+    try:
+        number = float(value)
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"invalid number: {value!r}") from None
+    if not number > 0:
+        raise argparse.ArgumentTypeError(f"must be strictly positive: {value!r}")
+    return number
+
+
+def positive_int(value: str) -> int:
+    """
+    Parse a strictly positive integer given on the command line.
+
+    Parameters
+    ----------
+    value : str
+        Value given by the user.
+
+    Returns
+    -------
+    int
+        Parsed integer.
+
+    Raises
+    ------
+    argparse.ArgumentTypeError
+        If the value is not a strictly positive integer.
+
+    """
+    try:
+        number = int(value)
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"invalid integer: {value!r}") from None
+    if number < 1:
+        raise argparse.ArgumentTypeError(f"must be strictly positive: {value!r}")
+    return number
+
+
 def main() -> None:
     """Run the CLI for the Publisher-Subscriber movie game."""
     parser = argparse.ArgumentParser(description="🎬 Hollywood Publisher-Subscriber CLI")
@@ -91,28 +314,72 @@ def main() -> None:
     )
     run_parser.add_argument(
         "--winning_threshold",
+        type=positive_int,
+        default=3,
+        help="Movies needed by a subscriber to win",
+    )
+    run_parser.add_argument(
+        "--clock",
+        choices=CLOCK_MODES,
+        default="realtime",
+        help="Publication pacing: fixed pause, fixed rate, or virtual time without pause",
+    )
+    run_parser.add_argument(
+        "--rate",
+        type=positive_float,
+        default=2.0,
+        help="Publications per second (pause is 1 / rate in realtime mode)",
+    )
+    run_parser.add_argument(
+        "--stream_window",
+        type=positive_int,
+        default=None,
+        help="With the API, publish movies while fetching, shuffled within this many movies",
+    )
+
+    simulate_parser = subparsers.add_parser("simulate", help="Estimate win probabilities over many games")
+    simulate_parser.add_argument("--api_key", type=str, help="TMDb API key (or set TMDB_API_KEY env var)")
+    simulate_parser.add_argument("--json_path", type=str, help="Path to a JSON file with preloaded movies")
+    simulate_parser.add_argument("--n_games", type=int, default=10_000, help="Number of games to simulate")
+    simulate_parser.add_argument(
+        "--max_movies_per_composer",
         type=int,
+        default=None,
+        help="Maximum movies kept per composer (API fetch defaults to 5)",
+    )
+    simulate_parser.add_argument(
+        "--winning_threshold",
+        type=positive_int,
         default=3,
         help="Movies needed by a subscriber to win",
     )
+    simulate_parser.add_argument("--seed", type=int, default=None, help="Seed for reproducible simulations")
+    simulate_parser.add_argument("--workers", type=int, default=None, help="Worker processes (default: CPU cores)")
 
     subparsers.add_parser("db", help="Print list of composers")
 
     args = parser.parse_args()
 
     if args.command == "run":
-        validated_path: FilePath | None = None
-        if args.json_path:
-            path_obj = Path(args.json_path).expanduser().resolve()
-            if not path_obj.exists() or not path_obj.is_file():
-                logger.error(f"❌ JSON path does not exist or is not a file: {path_obj}")
-                exit(1)
-            validated_path = FilePath(path_obj)
-
+        if args.stream_window is not None and args.json_path:
+            run_parser.error("--stream_window only applies when fetching from the API, not with --json_path")
         run_game(
             max_movies_per_composer=args.max_movies_per_composer,
             winning_threshold=args.winning_threshold,
-            json_path=validated_path,
+            json_path=validate_json_path(args.json_path),
+            api_key=args.api_key,
+            clock=clock_factory(mode=args.clock, rate=args.rate),
+            stream_window=args.stream_window,
+        )
+
+    elif args.command == "simulate":
+        run_simulation(
+            n_games=args.n_games,
+            max_movies_per_composer=args.max_movies_per_composer,
+            winning_threshold=args.winning_threshold,
+            seed=args.seed,
+            workers=args.workers,
+            json_path=validate_json_path(args.json_path),
             api_key=args.api_key,
         )
 
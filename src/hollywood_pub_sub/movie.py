@@ -1,11 +1,21 @@
 """Module defining the Movie model used to represent film entries."""
 
-from pydantic import ConfigDict
-from pydantic_settings import BaseSettings
+from collections.abc import Iterable
+from functools import cache
+from typing import Any
 
+from pydantic import BaseModel, ConfigDict, TypeAdapter
 
-class Movie(BaseSettings):
-    """Movie model representing a single film entry."""
+
+class Movie(BaseModel):
+    """
+    Movie model representing a single film entry.
+
+    A plain pydantic model: unlike settings, building a movie does not
+    consult environment variables or other settings sources. Movies are
+    frozen, since databases cache indexes of their fields: replace a movie
+    (e.g. with `model_copy(update=...)`) instead of modifying it.
+    """
 
     title: str
     director: str
@@ -13,4 +23,33 @@ class Movie(BaseSettings):
     cast: list[str]
     year: int
 
-    model_config = ConfigDict(extra="forbid")  # Disallow unexpected fields
+    model_config = ConfigDict(extra="forbid", frozen=True)  # Disallow unexpected fields and modifications
+
+    @classmethod
+    def validate_many(cls, data: Iterable[dict[str, Any]]) -> list["Movie"]:
+        """
+        Validate many movies at once through a cached TypeAdapter.
+
+        Parameters
+        ----------
+        data : Iterable[dict[str, Any]]
+            Raw movie fields, one mapping per movie.
+
+        Returns
+        -------
+        list[Movie]
+            Validated Movie instances, in input order.
+
+        Raises
+        ------
+        pydantic.ValidationError
+            If any movie is invalid, including unexpected fields.
+
+        """
+        return movies_adapter().validate_python(data if isinstance(data, list) else list(data))
+
+
+@cache
+def movies_adapter() -> TypeAdapter[list[Movie]]:
+    """Return the TypeAdapter validating lists of movies, built once."""
+    return TypeAdapter(list[Movie])
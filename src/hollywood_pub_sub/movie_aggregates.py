@@ -0,0 +1,165 @@
+"""Module defining MovieAggregates, movie counts by composer, director and year, maintained incrementally."""
+
+from collections import Counter
+from collections.abc import Callable, Iterable
+
+import numpy as np
+
+from hollywood_pub_sub.movie import Movie
+
+
+class MovieAggregates:
+    """
+    Aggregates of a collection of movies, updated incrementally.
+
+    Movie counts are kept per composer, per director and per year. Adding or
+    removing movies only updates the counts of those movies; the sorted
+    composer and director lists are cached and only sorted again when a name
+    appears or disappears.
+
+    Parameters
+    ----------
+    movies : Iterable[Movie]
+        Movies to aggregate.
+
+    Attributes
+    ----------
+    composer_counts : Counter[str]
+        Number of movies of each composer; must not be modified.
+    director_counts : Counter[str]
+        Number of movies of each director; must not be modified.
+    year_counts : Counter[int]
+        Number of movies released each year; must not be modified.
+
+    """
+
+    def __init__(self, movies: Iterable[Movie] = ()):
+        """Aggregate the given movies."""
+        self.composer_counts: Counter[str] = Counter()
+        self.director_counts: Counter[str] = Counter()
+        self.year_counts: Counter[int] = Counter()
+        self._composers: list[str] | None = None
+        self._directors: list[str] | None = None
+        self.add(movies)
+
+    @classmethod
+    def from_columns(
+        cls, name_of: Callable[[int], str], composers: np.ndarray, directors: np.ndarray, years: np.ndarray
+    ) -> "MovieAggregates":
+        """
+        Aggregate integer-coded movie columns without building movies.
+
+        Parameters
+        ----------
+        name_of : Callable[[int], str]
+            Function returning the name of a composer or director id.
+        composers : np.ndarray
+            Composer id of each movie.
+        directors : np.ndarray
+            Director id of each movie.
+        years : np.ndarray
+            Release year of each movie.
+
+        Returns
+        -------
+        MovieAggregates
+            Aggregates of the movies described by the columns.
+
+        """
+
+        def count(column: np.ndarray, label: Callable[[int], str | int]) -> Counter:
+            values, counts = np.unique(column, return_counts=True)
+            return Counter({label(value): count for value, count in zip(values.tolist(), counts.tolist(), strict=True)})
+
+        return cls.from_counts(count(composers, name_of), count(directors, name_of), count(years, int))
+
+    @classmethod
+    def from_counts(
+        cls, composer_counts: dict[str, int], director_counts: dict[str, int], year_counts: dict[int, int]
+    ) -> "MovieAggregates":
+        """
+        Build aggregates from precomputed movie counts.
+
+        Parameters
+        ----------
+        composer_counts : dict[str, int]
+            Number of movies of each composer.
+        director_counts : dict[str, int]
+            Number of movies of each director.
+        year_counts : dict[int, int]
+            Number of movies released each year.
+
+        Returns
+        -------
+        MovieAggregates
+            Aggregates holding the given counts.
+
+        """
+        aggregates = cls()
+        aggregates.composer_counts = Counter(composer_counts)
+        aggregates.director_counts = Counter(director_counts)
+        aggregates.year_counts = Counter(year_counts)
+        return aggregates
+
+    @property
+    def composers(self) -> list[str]:
+        """Return the sorted composers having at least one movie."""
+        if self._composers is None:
+            self._composers = sorted(composer for composer in self.composer_counts if composer)
+        return self._composers
+
+    @property
+    def directors(self) -> list[str]:
+        """Return the sorted directors having at least one movie."""
+        if self._directors is None:
+            self._directors = sorted(director for director in self.director_counts if director)
+        return self._directors
+
+    @property
+    def year_histogram(self) -> dict[int, int]:
+        """Return the number of movies per release year, by increasing year."""
+        return dict(sorted(self.year_counts.items()))
+
+    def add(self, movies: Iterable[Movie]) -> None:
+        """Count the given movies in the aggregates."""
+        for movie in movies:
+            if self.composer_counts[movie.composer] == 0:
+                self._composers = None
+            if self.director_counts[movie.director] == 0:
+                self._directors = None
+            self.composer_counts[movie.composer] += 1
+            self.director_counts[movie.director] += 1
+            self.year_counts[movie.year] += 1
+
+    def remove(self, movies: Iterable[Movie]) -> None:
+        """Uncount the given movies from the aggregates."""
+        for movie in movies:
+            if self._decrement(self.composer_counts, movie.composer):
+                self._composers = None
+            if self._decrement(self.director_counts, movie.director):
+                self._directors = None
+            self._decrement(self.year_counts, movie.year)
+
+    def update(self, added: list[Movie], removed: list[Movie]) -> None:
+        """
+        Apply a modification of the aggregated movies, as a MovieList observer.
+
+        Parameters
+        ----------
+        added : list[Movie]
+            Movies added to the collection.
+        removed : list[Movie]
+            Movies removed from the collection.
+
+        """
+        self.add(added)
+        self.remove(removed)
+
+    @staticmethod
+    def _decrement(counts: Counter, key: str | int) -> bool:
+        """Decrement a count, dropping the key when it reaches zero; return whether it was dropped."""
+        counts[key] -= 1
+        if counts[key] <= 0:
+            del counts[key]
+            return True
+        return False
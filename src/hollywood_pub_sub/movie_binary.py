@@ -0,0 +1,372 @@
+"""Module defining the compact binary movie database format, read through a memory map."""
+
+from collections.abc import Iterable, MutableSequence
+import mmap
+from pathlib import Path
+import struct
+from typing import Self
+
+import numpy as np
+
+from hollywood_pub_sub.movie import Movie
+from hollywood_pub_sub.movie_aggregates import MovieAggregates
+from hollywood_pub_sub.movie_list import MovieObserver
+
+
+BINARY_SUFFIX = ".bin"
+MAGIC = b"HPSMDB01"
+# Magic, then numbers of movies, strings, cast entries and string bytes
+HEADER = struct.Struct("<8sQQQQ")
+RECORD_DTYPE = np.dtype([("title", "<u4"), ("director", "<u4"), ("composer", "<u4"), ("year", "<i4")])
+
+
+def write_movies_binary(movies: Iterable[Movie], path: Path) -> None:
+    """
+    Write movies to a binary movie database file.
+
+    The file holds, after a fixed header: the offsets of the interned strings,
+    the offsets of each movie's cast entries, one fixed-width record per movie
+    (string ids of title, director and composer, and year), the string ids of
+    the cast entries, and finally the UTF-8 bytes of the strings.
+
+    Parameters
+    ----------
+    movies : Iterable[Movie]
+        Movies to write, in order.
+    path : Path
+        Path of the file to create or overwrite.
+
+    """
+    string_ids: dict[str, int] = {}
+
+    def intern(value: str) -> int:
+        return string_ids.setdefault(value, len(string_ids))
+
+    records: list[tuple[int, int, int, int]] = []
+    cast_ids: list[int] = []
+    cast_offsets = [0]
+    for movie in movies:
+        records.append((intern(movie.title), intern(movie.director), intern(movie.composer), movie.year))
+        cast_ids.extend(intern(actor) for actor in movie.cast)
+        cast_offsets.append(len(cast_ids))
+
+    encoded = [value.encode("utf-8") for value in string_ids]
+    string_offsets = np.zeros(len(encoded) + 1, dtype="<u8")
+    np.cumsum([len(value) for value in encoded], out=string_offsets[1:])
+    string_bytes = b"".join(encoded)
+
+    with path.open("wb") as file:
+        file.write(HEADER.pack(MAGIC, len(records), len(encoded), len(cast_ids), len(string_bytes)))
+        file.write(string_offsets.tobytes())
+        file.write(np.asarray(cast_offsets, dtype="<u8").tobytes())
+        file.write(np.array(records, dtype=RECORD_DTYPE).tobytes())
+        file.write(np.asarray(cast_ids, dtype="<u4").tobytes())
+        file.write(string_bytes)
+
+
+class BinaryMovieFile:
+    """
+    Read-only view of a binary movie database file through a memory map.
+
+    Opening the file only maps it and wraps its sections in numpy arrays;
+    strings are decoded and movies built on demand. The map is released by
+    `close`, or when leaving the file used as a context manager.
+
+    Parameters
+    ----------
+    path : Path
+        Path of a file written by `write_movies_binary`.
+
+    Raises
+    ------
+    ValueError
+        If the file is not a binary movie database or is truncated.
+
+    """
+
+    def __init__(self, path: Path):
+        """Map the file and locate its sections."""
+        if path.stat().st_size < HEADER.size:
+            raise ValueError(f"File {path} is too short to be a binary movie database.")
+        with path.open("rb") as file:
+            # The map stays valid once the file is closed
+            self._mmap = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+        layout = self._layout(path)
+        offset = HEADER.size
+        sections = {}
+        for name, dtype, count in layout:
+            sections[name] = np.frombuffer(self._mmap, dtype=dtype, count=count, offset=offset)
+            offset += dtype.itemsize * count
+
+        self.string_offsets: np.ndarray = sections["string_offsets"]
+        self.cast_offsets: np.ndarray = sections["cast_offsets"]
+        self.records: np.ndarray = sections["records"]
+        self.cast_ids: np.ndarray = sections["cast_ids"]
+        self.string_bytes: np.ndarray = sections["string_bytes"]
+        self._strings_start = offset - len(self.string_bytes)
+        self._strings: dict[int, str] = {}
+        self._string_ids: dict[str, int] = {}
+        self._cast_rows: np.ndarray | None = None
+
+    def _layout(self, path: Path) -> list[tuple[str, np.dtype, int]]:
+        """Return the name, dtype and length of each array section, closing the map if the file is invalid."""
+        magic, n_movies, n_strings, n_cast, n_string_bytes = HEADER.unpack_from(self._mmap)
+        layout = [
+            ("string_offsets", np.dtype("<u8"), n_strings + 1),
+            ("cast_offsets", np.dtype("<u8"), n_movies + 1),
+            ("records", RECORD_DTYPE, n_movies),
+            ("cast_ids", np.dtype("<u4"), n_cast),
+            ("string_bytes", np.dtype("u1"), n_string_bytes),
+        ]
+        size = HEADER.size + sum(dtype.itemsize * count for _, dtype, count in layout)
+        # Checked before wrapping any section, as the map cannot be closed once arrays use it
+        if magic != MAGIC or size != len(self._mmap):
+            self._mmap.close()
+            reason = "is not a binary movie database" if magic != MAGIC else "is truncated or corrupted"
+            raise ValueError(f"File {path} {reason}.")
+        return layout
+
+    def __len__(self) -> int:
+        """Return the number of movies in the file."""
+        return len(self.records)
+
+    @property
+    def closed(self) -> bool:
+        """Return whether the memory map was released by `close`."""
+        return self._mmap.closed
+
+    def close(self) -> None:
+        """Release the memory map; the movies already built stay valid."""
+        if self.closed:
+            return
+        # The arrays export the map's buffer, which cannot be closed while they are alive
+        for name in ("string_offsets", "cast_offsets", "records", "cast_ids", "string_bytes"):
+            setattr(self, name, np.empty(0, dtype=getattr(self, name).dtype))
+        self._cast_rows = None
+        self._mmap.close()
+
+    def __enter__(self) -> Self:
+        """Return the file."""
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        """Close the file."""
+        self.close()
+
+    def string(self, string_id: int) -> str:
+        """Return an interned string, decoding it on first access."""
+        value = self._strings.get(string_id)
+        if value is None:
+            start = self._strings_start + int(self.string_offsets[string_id])
+            stop = self._strings_start + int(self.string_offsets[string_id + 1])
+            value = self._strings[string_id] = self._mmap[start:stop].decode("utf-8")
+        return value
+
+    def string_id(self, value: str) -> int:
+        """
+        Return the id of an interned string, comparing bytes without decoding the other strings.
+
+        Parameters
+        ----------
+        value : str
+            String to look up.
+
+        Returns
+        -------
+        int
+            Id of the string, or -1 if the file does not hold it.
+
+        """
+        string_id = self._string_ids.get(value)
+        if string_id is None:
+            encoded = np.frombuffer(value.encode("utf-8"), dtype="u1")
+            starts = self.string_offsets[:-1]
+            # Strings are interned once, so at most one candidate of the same length holds the same bytes
+            candidates = np.flatnonzero(np.diff(self.string_offsets) == len(encoded))
+            if len(encoded):
+                window = starts[candidates, None] + np.arange(len(encoded), dtype=starts.dtype)
+                candidates = candidates[(self.string_bytes[window] == encoded).all(axis=1)]
+            string_id = self._string_ids[value] = int(candidates[0]) if len(candidates) else -1
+        return string_id
+
+    def select(
+        self,
+        title: str | None = None,
+        director: str | None = None,
+        composer: str | None = None,
+        year: int | None = None,
+        cast: list[str] | None = None,
+    ) -> np.ndarray:
+        """
+        Return the record positions matching all the given criteria, computed on the records.
+
+        Parameters
+        ----------
+        title : str, optional
+            Exact title to match.
+        director : str, optional
+            Exact director name to match.
+        composer : str, optional
+            Exact composer name to match.
+        year : int, optional
+            Release year to match.
+        cast : list[str], optional
+            Cast members that must all appear in the movie.
+
+        Returns
+        -------
+        np.ndarray
+            Matching record positions, in increasing order.
+
+        Raises
+        ------
+        ValueError
+            If the file is closed.
+
+        """
+        self._check_open()
+        mask = np.ones(len(self), dtype=bool)
+        for field, name in (("title", title), ("director", director), ("composer", composer)):
+            if name is not None:
+                mask &= self.records[field] == self.string_id(name)
+        if year is not None:
+            mask &= self.records["year"] == year
+        for actor in cast or ():
+            actor_mask = np.zeros(len(self), dtype=bool)
+            actor_mask[self._entry_rows()[self.cast_ids == self.string_id(actor)]] = True
+            mask &= actor_mask
+        return np.flatnonzero(mask)
+
+    def movie(self, position: int) -> Movie:
+        """Build the Movie stored at a record position."""
+        self._check_open()
+        title, director, composer, year = self.records[position].tolist()
+        cast_ids = self.cast_ids[self.cast_offsets[position] : self.cast_offsets[position + 1]].tolist()
+        return Movie(
+            title=self.string(title),
+            director=self.string(director),
+            composer=self.string(composer),
+            cast=[self.string(actor) for actor in cast_ids],
+            year=year,
+        )
+
+    def aggregates(self) -> MovieAggregates:
+        """Return the aggregates of the movies of the file, computed on the records without building movies."""
+        return MovieAggregates.from_columns(
+            self.string, self.records["composer"], self.records["director"], self.records["year"]
+        )
+
+    def _check_open(self) -> None:
+        """Raise a ValueError if the memory map was released."""
+        if self.closed:
+            raise ValueError("I/O operation on a closed binary movie file.")
+
+    def _entry_rows(self) -> np.ndarray:
+        """Return the record position of each cast entry, computed once."""
+        if self._cast_rows is None:
+            self._cast_rows = np.repeat(np.arange(len(self)), np.diff(self.cast_offsets).astype(np.intp))
+        return self._cast_rows
+
+
+class BinaryMovieList(MutableSequence[Movie]):
+    """
+    Mutable list of movies backed by a binary movie database file.
+
+    Each slot holds either the record position of a movie not built yet or
+    the Movie itself; movies are built the first time they are accessed.
+    Like MovieList, every modification increments `version` and notifies
+    the observers registered with `add_observer`.
+
+    Parameters
+    ----------
+    source : BinaryMovieFile
+        File the movies are read from.
+
+    Attributes
+    ----------
+    version : int
+        Number of modifications since the list was created.
+
+    """
+
+    def __init__(self, source: BinaryMovieFile):
+        """Initialize the list with every movie of the file, in file order."""
+        self.source = source
+        self._slots: list[int | Movie] = list(range(len(source)))
+        self.version = 0
+        self._observers: list[MovieObserver] = []
+
+    def add_observer(self, observer: MovieObserver) -> None:
+        """Register a callback notified of the movies added and removed by each modification."""
+        self._observers.append(observer)
+
+    def remove_observer(self, observer: MovieObserver) -> None:
+        """Unregister a callback registered with `add_observer`."""
+        self._observers.remove(observer)
+
+    def close(self) -> None:
+        """Close the source file; the movies already built stay accessible."""
+        self.source.close()
+
+    def __enter__(self) -> Self:
+        """Return the list."""
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        """Close the list."""
+        self.close()
+
+    def __len__(self) -> int:
+        """Return the number of movies."""
+        return len(self._slots)
+
+    def __getitem__(self, index):
+        """Return a movie, or a list of movies for a slice, building them if needed."""
+        if isinstance(index, slice):
+            return [self._materialize(position) for position in range(*index.indices(len(self._slots)))]
+        return self._materialize(index)
+
+    def __setitem__(self, index, value) -> None:
+        """Assign a movie or a slice of movies, then bump the version."""
+        if isinstance(index, slice):
+            value = list(value)
+            removed, added = self[index] if self._observers else [], value
+        else:
+            removed, added = [self[index]] if self._observers else [], [value]
+        self._slots[index] = value
+        self._modified(added, removed)
+
+    def __delitem__(self, index) -> None:
+        """Delete a movie or a slice of movies, then bump the version."""
+        removed = [] if not self._observers else self[index] if isinstance(index, slice) else [self[index]]
+        del self._slots[index]
+        self._modified([], removed)
+
+    def insert(self, index: int, value: Movie) -> None:
+        """Insert a movie, then bump the version."""
+        self._slots.insert(index, value)
+        self._modified([value], [])
+
+    def __eq__(self, other) -> bool:
+        """Compare movies with another sequence of movies."""
+        if not isinstance(other, (list, BinaryMovieList)):
+            return NotImplemented
+        return len(self) == len(other) and all(mine == theirs for mine, theirs in zip(self, other, strict=True))
+
+    def __repr__(self) -> str:
+        """Return the representation of the list, building every movie."""
+        return f"{type(self).__name__}({list(self)!r})"
+
+    def _modified(self, added: list[Movie], removed: list[Movie]) -> None:
+        """Bump the version and notify the observers."""
+        self.version += 1
+        for observer in self._observers:
+            observer(added, removed)
+
+    def _materialize(self, index: int) -> Movie:
+        """Return the movie of a slot, building and caching it if needed."""
+        slot = self._slots[index]
+        if isinstance(slot, int):
+            # Cached in place: the slot keeps its position, so the version is unchanged
+            slot = self._slots[index] = self.source.movie(slot)
+        return slot
@@ -1,24 +1,53 @@
 """Module defining the abstract MovieDatabase base class for handling movie collections."""
 
 from abc import ABC, abstractmethod
+from collections.abc import Iterator
+from contextlib import suppress
+from itertools import islice
 import json
 from pathlib import Path
+from typing import TextIO
 
-from pydantic import BaseModel, ConfigDict, validate_call
+from pydantic import BaseModel, ConfigDict, PrivateAttr, validate_call
 
+from hollywood_pub_sub.atomic_file import atomic_write
 from hollywood_pub_sub.movie import Movie
+from hollywood_pub_sub.movie_aggregates import MovieAggregates
+from hollywood_pub_sub.movie_binary import write_movies_binary
+from hollywood_pub_sub.movie_index import MovieIndex
+from hollywood_pub_sub.movie_sqlite import write_movies_sqlite
+
+
+JSON_BATCH_SIZE = 1000
 
 
 class MovieDatabase(BaseModel, ABC):
     """
     Abstract base class representing a collection of Movie instances.
 
-    Provides filtering and JSON export methods based on a `movies` property
-    that must be implemented by subclasses.
+    Provides filtering, aggregates and JSON export methods based on a
+    `movies` property that must be implemented by subclasses.
+
+    Filtering relies on inverted indexes built lazily from `movies` and cached
+    until the movie list changes. Changes are detected through the version of
+    a MovieList (or any list with a `version` counter), so subclasses should
+    wrap plain lists in a MovieList when they are constructed; other sequences
+    are only considered changed when they are replaced or resized.
+
+    Aggregates (composers, directors, movie counts) are computed once and,
+    for lists accepting observers such as MovieList, updated incrementally
+    as movies are added or removed.
     """
 
     model_config = ConfigDict(arbitrary_types_allowed=True)
 
+    _movie_index: MovieIndex | None = PrivateAttr(default=None)
+    _movie_index_source: list[Movie] | None = PrivateAttr(default=None)
+    _movie_index_key: tuple | None = PrivateAttr(default=None)
+    _aggregates: MovieAggregates | None = PrivateAttr(default=None)
+    _aggregates_source: list[Movie] | None = PrivateAttr(default=None)
+    _aggregates_key: tuple | None = PrivateAttr(default=None)
+
     @property
     @abstractmethod
     def movies(self) -> list[Movie]:
@@ -58,32 +87,149 @@ class MovieDatabase(BaseModel, ABC):
         """
         cast_filter: list[str] | None = [cast] if isinstance(cast, str) else cast
 
-        def match(movie: Movie) -> bool:
-            if title and movie.title != title:
-                return False
-            if director and movie.director != director:
-                return False
-            if composer and movie.composer != composer:
-                return False
-            if year and movie.year != year:
-                return False
-            if cast_filter and not all(actor in movie.cast for actor in cast_filter):
-                return False
-            return True
-
-        return [movie for movie in self.movies if match(movie)]
+        # Falsy criteria are ignored, as when they are not provided
+        criteria: list[tuple[str, str | int]] = [
+            (field, value)
+            for field, value in (("title", title), ("director", director), ("composer", composer), ("year", year))
+            if value
+        ]
+        if cast_filter:
+            criteria.extend(("cast", actor) for actor in cast_filter)
+
+        movies = self.movies
+        if not criteria:
+            return list(movies)
+        return [movies[position] for position in self.movie_index().query(criteria)]
+
+    def movie_index(self) -> MovieIndex:
+        """
+        Return the inverted indexes of the movies, rebuilding them if the movie list changed.
+
+        Returns
+        -------
+        MovieIndex
+            Indexes whose positions refer to the current `movies`.
+
+        """
+        movies = self.movies
+        version = getattr(movies, "version", None)
+        # MovieList or other list tracking its modifications; other sequences are assumed unmodified in place
+        key = (version, len(movies))
+        if self._movie_index is None or self._movie_index_source is not movies or self._movie_index_key != key:
+            self._movie_index = MovieIndex(movies)
+            self._movie_index_source = movies
+            self._movie_index_key = key
+        return self._movie_index
+
+    def aggregates(self) -> MovieAggregates:
+        """
+        Return the aggregates of the movies, computing them on first access.
+
+        When `movies` accepts observers, the aggregates are then kept up to
+        date incrementally; otherwise they are recomputed when the movies change,
+        as detected through their `version` counter or their length. Observed
+        lists are also compared against the version of their last notification,
+        so a copied list, which does not copy its observers, is re-aggregated
+        once modified.
+
+        Returns
+        -------
+        MovieAggregates
+            Composers, directors and movie counts of the current `movies`.
+
+        """
+        movies = self.movies
+        # Sequences are compared against their version if they track modifications, and their length;
+        # observed lists advance the key on each notification, in `_update_aggregates`
+        key = (getattr(movies, "version", None), len(movies))
+        if self._aggregates is None or self._aggregates_source is not movies or self._aggregates_key != key:
+            if self._aggregates is not None and hasattr(self._aggregates_source, "remove_observer"):
+                # A copied list does not hold the observer registered on the original
+                with suppress(ValueError):
+                    self._aggregates_source.remove_observer(self._update_aggregates)
+            self._aggregates = self._build_aggregates()
+            self._aggregates_source = movies
+            self._aggregates_key = key
+            if hasattr(movies, "add_observer"):
+                movies.add_observer(self._update_aggregates)
+        return self._aggregates
+
+    def _update_aggregates(self, added: list[Movie], removed: list[Movie]) -> None:
+        """Apply a modification of the observed movies to the aggregates, and record the version it leads to."""
+        self._aggregates.update(added, removed)
+        movies = self._aggregates_source
+        self._aggregates_key = (getattr(movies, "version", None), len(movies))
+
+    def _build_aggregates(self) -> MovieAggregates:
+        """Compute the aggregates of the current movies; subclasses may use a faster source."""
+        return MovieAggregates(self.movies)
+
+    def iter_json_chunks(self, indent: int = 4, batch_size: int = JSON_BATCH_SIZE) -> Iterator[str]:
+        """
+        Yield the JSON export of the movies in chunks.
+
+        The concatenated chunks are identical to the output of `to_json`, but
+        only one batch of movies is serialized at a time.
+
+        Parameters
+        ----------
+        indent : int
+            Indentation level for JSON formatting.
+        batch_size : int
+            Number of movies serialized per chunk.
+
+        Yields
+        ------
+        str
+            Successive pieces of the JSON document.
+
+        """
+        encoder = json.JSONEncoder(indent=indent, ensure_ascii=False)
+        padding = " " * indent
+        # JSON strings never contain raw newlines, so nesting an element only needs its line breaks re-indented
+        separator = ",\n" + padding
+        movies = iter(self.movies)
+        first_batch = True
+        while batch := list(islice(movies, batch_size)):
+            items = separator.join(encoder.encode(movie.model_dump()).replace("\n", "\n" + padding) for movie in batch)
+            yield ("[\n" + padding if first_batch else separator) + items
+            first_batch = False
+        yield "[]" if first_batch else "\n]"
+
+    def write_json(self, file: TextIO, indent: int = 4, batch_size: int = JSON_BATCH_SIZE) -> None:
+        """
+        Stream the JSON export of the movies to a text file object.
+
+        Parameters
+        ----------
+        file : TextIO
+            Writable text file object.
+        indent : int
+            Indentation level for JSON formatting.
+        batch_size : int
+            Number of movies serialized per write.
+
+        """
+        for chunk in self.iter_json_chunks(indent=indent, batch_size=batch_size):
+            file.write(chunk)
 
     @validate_call
-    def to_json(self, path: Path | None = None, indent: int = 4) -> str | None:
+    def to_json(self, path: Path | None = None, indent: int = 4, atomic: bool = False) -> str | None:
         """
         Export movies to JSON format.
 
+        When writing to a file, movies are streamed in chunks so that memory
+        use does not grow with the size of the database.
+
         Parameters
         ----------
         path : Optional[Path]
             Path to save the JSON file. If not provided, returns the JSON string.
         indent : int
             Indentation level for JSON formatting.
+        atomic : bool
+            Write to a temporary file next to `path`, synced then renamed over it,
+            so that `path` never holds a partial export. Defaults to False.
 
         Returns
         -------
@@ -91,10 +237,40 @@ class MovieDatabase(BaseModel, ABC):
             JSON string if no path is provided, otherwise None.
 
         """
-        data = [movie.model_dump() for movie in self.movies]
-        json_str = json.dumps(data, indent=indent, ensure_ascii=False)
+        if path is None:
+            return "".join(self.iter_json_chunks(indent=indent))
 
-        if path is not None:
-            path.write_text(json_str, encoding="utf-8")
+        if not atomic:
+            with path.open("w", encoding="utf-8") as file:
+                self.write_json(file, indent=indent)
             return None
-        return json_str
+
+        with atomic_write(path) as file:
+            self.write_json(file, indent=indent)
+        return None
+
+    @validate_call
+    def to_binary(self, path: Path) -> None:
+        """
+        Export movies to the compact binary format read by MovieDatabaseFromBinary.
+
+        Parameters
+        ----------
+        path : Path
+            Path to save the binary file, usually with the `.bin` extension.
+
+        """
+        write_movies_binary(self.movies, path)
+
+    @validate_call
+    def to_sqlite(self, path: Path) -> None:
+        """
+        Export movies to a normalized SQLite database read by MovieDatabaseFromSQLite.
+
+        Parameters
+        ----------
+        path : Path
+            Path to save the SQLite file, usually with the `.sqlite` extension; an existing file is replaced.
+
+        """
+        write_movies_sqlite(self.movies, path)
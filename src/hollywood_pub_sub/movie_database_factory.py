@@ -1,10 +1,14 @@
-"""Module for constructing a MovieDatabase from a JSON file or the TMDb API."""
+"""Module for constructing a MovieDatabase from a JSON, binary or SQLite file, or the TMDb API."""
 
 from pathlib import Path
 
+from hollywood_pub_sub.movie_binary import BINARY_SUFFIX
 from hollywood_pub_sub.movie_database import MovieDatabase
 from hollywood_pub_sub.movie_database_from_api import MovieDatabaseFromAPI
+from hollywood_pub_sub.movie_database_from_binary import MovieDatabaseFromBinary
 from hollywood_pub_sub.movie_database_from_json import MovieDatabaseFromJSON
+from hollywood_pub_sub.movie_database_from_sqlite import MovieDatabaseFromSQLite
+from hollywood_pub_sub.movie_sqlite import SQLITE_SUFFIXES
 
 
 def movie_database_factory(
@@ -13,29 +17,35 @@ def movie_database_factory(
     json_path: str | Path | None = None,
 ) -> MovieDatabase:
     """
-    Create a MovieDatabase from either a JSON file or the TMDb API.
+    Create a MovieDatabase from either a JSON file, a binary file, a SQLite file or the TMDb API.
 
     Parameters
     ----------
     max_movies_per_composer : int
         Number of movies to fetch per composer (used with API).
     json_path : str or Path, optional
-        Path to the local JSON file. If provided, it takes precedence over API fetching.
+        Path to the local JSON file, to a binary file if it has the `.bin` extension,
+        or to a SQLite file if it has the `.sqlite` or `.sqlite3` extension.
+        If provided, it takes precedence over API fetching.
     api_key : str, optional
         TMDb API key. Required if `json_path` is not provided.
 
     Returns
     -------
     MovieDatabase
-        A MovieDatabase instance built from JSON or API.
+        A MovieDatabase instance built from the file or the API.
 
     Raises
     ------
     ValueError
-        If neither `json_path` nor `api_key` is provided.
+        If neither `json_path` nor `api_key` is provided, or if the SQLite file is not a movie database.
 
     """
-    if json_path is not None:
+    if json_path is not None and Path(json_path).suffix == BINARY_SUFFIX:
+        return MovieDatabaseFromBinary.from_binary(Path(json_path))
+    elif json_path is not None and Path(json_path).suffix in SQLITE_SUFFIXES:
+        return MovieDatabaseFromSQLite(path=Path(json_path))
+    elif json_path is not None:
         return MovieDatabaseFromJSON.from_json(Path(json_path))
     elif api_key is not None:
         return MovieDatabaseFromAPI(
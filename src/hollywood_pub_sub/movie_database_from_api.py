@@ -1,14 +1,312 @@
 """Module defining MovieDatabaseFromAPI for fetching and building a movie database from TMDb API."""
 
+from collections import deque
+from collections.abc import Iterator
+from concurrent.futures import Future, ThreadPoolExecutor
+from contextlib import suppress
+from datetime import UTC, datetime, timedelta
+from email.utils import parsedate_to_datetime
+from itertools import islice
+from pathlib import Path
+import threading
 import time
 
-from pydantic import Field, PositiveInt
+from pydantic import BaseModel, Field, NonNegativeInt, PositiveFloat, PositiveInt, PrivateAttr
 import requests
+from requests.adapters import HTTPAdapter
 
+from hollywood_pub_sub.build_journal import BuildJournal
 from hollywood_pub_sub.logger import logger
 from hollywood_pub_sub.movie import Movie
 from hollywood_pub_sub.movie_database import MovieDatabase
+from hollywood_pub_sub.movie_list import MovieList
+from hollywood_pub_sub.movie_stream import DEFAULT_STREAM_SIZE, MovieStream
+from hollywood_pub_sub.person_id_table import PersonIdTable
+from hollywood_pub_sub.rate_limiter import TokenBucket, backoff_delay
 from hollywood_pub_sub.settings import ComposerSettings
+from hollywood_pub_sub.single_flight import SingleFlight
+from hollywood_pub_sub.tmdb_cache import CacheMissError, ResponseCache
+
+
+DEFAULT_POOL_SIZE = 10
+DEFAULT_TIMEOUT = (3.05, 30.0)
+DEFAULT_MAX_WORKERS = 16
+DEFAULT_RATE_LIMIT = 40.0
+DEFAULT_BURST = 20
+DEFAULT_MAX_RETRIES = 5
+DEFAULT_BACKOFF = 0.5
+THROTTLING_STATUSES = {429, 503}
+RETRYABLE_STATUSES = THROTTLING_STATUSES | {500, 502, 504}
+COMPOSER_JOBS = ("Original Music Composer", "Music", "Composer")
+# Longest period accepted by the TMDb change feeds
+CHANGES_WINDOW = timedelta(days=14)
+
+
+def create_session(pool_size: int = DEFAULT_POOL_SIZE) -> requests.Session:
+    """
+    Create an HTTP session keeping up to `pool_size` connections alive for reuse.
+
+    Parameters
+    ----------
+    pool_size : int
+        Maximum number of pooled connections per host.
+
+    Returns
+    -------
+    requests.Session
+        Session whose connections are reused across requests.
+
+    """
+    session = requests.Session()
+    adapter = HTTPAdapter(pool_connections=pool_size, pool_maxsize=pool_size)
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+    session.headers["Connection"] = "keep-alive"
+    return session
+
+
+class _FetchScheduler:
+    """
+    Thread pool of a build, requesting the details of each movie once as soon as its composer's credits arrive.
+
+    Parameters
+    ----------
+    database : MovieDatabaseFromAPI
+        Database being built.
+
+    Attributes
+    ----------
+    executor : ThreadPoolExecutor
+        Pool running the requests.
+    movie_fields : dict[int, Future]
+        Pending or completed movie fields by TMDb movie id.
+
+    """
+
+    def __init__(self, database: "MovieDatabaseFromAPI"):
+        """Start the thread pool of the build."""
+        self.database = database
+        self.executor = ThreadPoolExecutor(max_workers=database.max_workers, thread_name_prefix="tmdb")
+        self.movie_fields: dict[int, Future] = {}
+        self._lock = threading.Lock()
+
+    def submit_composer(self, composer: str) -> tuple[str, Future]:
+        """Request the movie ids of a composer, then the fields of these movies once they arrive."""
+        future = self.executor.submit(self.database._fetch_composer_movie_ids, composer)
+        future.add_done_callback(self._on_movie_ids)
+        return composer, future
+
+    def submit_movies(self, movie_ids: list[int] | None) -> None:
+        """Request the fields of the movies that were not requested yet."""
+        with self._lock:
+            for movie_id in movie_ids or ():
+                if movie_id not in self.movie_fields:
+                    self.movie_fields[movie_id] = self.executor.submit(self.database._fetch_movie_fields, movie_id)
+
+    def _on_movie_ids(self, future: Future) -> None:
+        """Request the movies of a composer as soon as their ids arrive."""
+        if not future.cancelled() and future.exception() is None:
+            with suppress(RuntimeError):  # The executor was shut down after a failure
+                self.submit_movies(future.result())
+
+
+class _UpdatePlan:
+    """
+    Changes to apply to a database, found by matching its movies with the credits of the composers.
+
+    Movies do not hold their TMDb id, so they are matched with the credits
+    of their composer by title. The movies of composers whose credits
+    changed are reconciled with them; only the changed movies of the other
+    composers are re-fetched. Since their credits may hold another title
+    than the database, e.g. when cached, their changed movies left unmatched
+    are matched with `match` once fetched.
+
+    Parameters
+    ----------
+    movies : list[Movie]
+        Movies of the database.
+    changed_movies : set[int]
+        TMDb ids of the changed movies.
+
+    Attributes
+    ----------
+    matched : dict[int, int]
+        Index in the database of the movie of each matched TMDb movie id.
+    to_fetch : dict[int, str]
+        Composer of each TMDb movie id to fetch, in credit order.
+    unmatched : set[int]
+        TMDb ids of changed movies of unchanged composers to match by their fetched title.
+    removals : list[int]
+        Indexes in the database of the movies no longer credited to their changed composer.
+
+    """
+
+    def __init__(self, movies: list[Movie], changed_movies: set[int]):
+        """Index the movies of the database by composer and title."""
+        self.movies = movies
+        self.changed_movies = changed_movies
+        self.matched: dict[int, int] = {}
+        self.to_fetch: dict[int, str] = {}
+        self.unmatched: set[int] = set()
+        self.removals: list[int] = []
+        self._positions: dict[tuple[str, str], deque[int]] = {}
+        for index, movie in enumerate(movies):
+            self._positions.setdefault((movie.composer, movie.title), deque()).append(index)
+        self._seen_ids: set[int] = set()
+
+    def add_credits(self, composer: str, credits: list[dict], changed: bool) -> None:
+        """Match the credits of a composer, in composer order, each movie being kept for its first composer."""
+        for credit in credits:
+            movie_id = credit["id"]
+            if movie_id in self._seen_ids:
+                continue
+            self._seen_ids.add(movie_id)
+            positions = self._positions.get((composer, credit.get("title")))
+            if positions:
+                self.matched[movie_id] = positions.popleft()
+                if movie_id in self.changed_movies:
+                    self.to_fetch[movie_id] = composer
+            elif changed:
+                self.to_fetch[movie_id] = composer
+            elif movie_id in self.changed_movies:
+                self.to_fetch[movie_id] = composer
+                self.unmatched.add(movie_id)
+        if changed:
+            self.removals.extend(
+                index for (name, _), positions in self._positions.items() if name == composer for index in positions
+            )
+
+    def apply(self, movies: list[Movie], fields: dict[int, dict | None]) -> tuple[int, int]:
+        """
+        Patch the movies with the fetched fields, then remove the uncredited movies and append the new ones.
+
+        Parameters
+        ----------
+        movies : list[Movie]
+            Movies of the database, modified in place.
+        fields : dict[int, dict | None]
+            Fetched fields of the movies to fetch, None for failed requests.
+
+        Returns
+        -------
+        tuple[int, int]
+            Numbers of replaced and added movies.
+
+        """
+        updated = 0
+        added: list[Movie] = []
+        for movie_id, composer in self.to_fetch.items():
+            if fields[movie_id] is None:
+                continue
+            movie = Movie(**fields[movie_id], composer=composer)
+            if movie_id in self.unmatched:
+                index = self.match(movie)
+                if index is None:
+                    continue
+            elif movie_id in self.matched:
+                index = self.matched[movie_id]
+            else:
+                added.append(movie)
+                continue
+            if movies[index] != movie:
+                movies[index] = movie
+                updated += 1
+        for index in sorted(self.removals, reverse=True):
+            del movies[index]
+        movies.extend(added)
+        return updated, len(added)
+
+    def match(self, movie: Movie) -> int | None:
+        """
+        Return the index of the unmatched movie of the same composer with the same title, or else director and year.
+
+        Parameters
+        ----------
+        movie : Movie
+            Fetched movie.
+
+        Returns
+        -------
+        Optional[int]
+            Index in the database of the matched movie, or None if no movie or several movies match.
+
+        """
+        positions = self._positions.get((movie.composer, movie.title))
+        if positions:
+            return positions.popleft()
+        candidates = [
+            (positions, index)
+            for (composer, _), positions in self._positions.items()
+            for index in positions
+            if composer == movie.composer
+            and (self.movies[index].director, self.movies[index].year) == (movie.director, movie.year)
+        ]
+        if len(candidates) != 1:
+            return None
+        positions, index = candidates[0]
+        positions.remove(index)
+        return index
+
+    @property
+    def changed_credited(self) -> int:
+        """Return the number of changed movies credited to the composers."""
+        return len(self._seen_ids & self.changed_movies)
+
+
+class DatabaseUpdate(BaseModel):
+    """
+    Summary of an incremental update of a movie database from the TMDb change feeds.
+
+    Attributes
+    ----------
+    synced_at : datetime
+        End of the applied period, to pass as `since` to the next update.
+    changed_people : int
+        Number of composers whose credits changed.
+    changed_movies : int
+        Number of changed movies credited to the composers.
+    updated : int
+        Number of movies replaced by their new version.
+    added : int
+        Number of movies newly credited to a composer.
+    removed : int
+        Number of movies no longer credited to their composer.
+
+    """
+
+    synced_at: datetime
+    changed_people: int = 0
+    changed_movies: int = 0
+    updated: int = 0
+    added: int = 0
+    removed: int = 0
+
+
+def parse_retry_after(value: str | None) -> float | None:
+    """
+    Parse a `Retry-After` header into a delay.
+
+    Parameters
+    ----------
+    value : str, optional
+        Header value, either a number of seconds or an HTTP date.
+
+    Returns
+    -------
+    Optional[float]
+        Delay in seconds, or None if the header is missing or invalid.
+
+    """
+    if value is None:
+        return None
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+    try:
+        return max(0.0, parsedate_to_datetime(value).timestamp() - time.time())
+    except (TypeError, ValueError):
+        return None
 
 
 class MovieDatabaseFromAPI(MovieDatabase):
@@ -24,6 +322,36 @@ class MovieDatabaseFromAPI(MovieDatabase):
     composers : List[str], optional
         List of composer names to fetch movies for.
         Defaults to the list from ComposerSettings().
+    session : requests.Session, optional
+        HTTP session used for all requests, e.g. to reach a local stand-in server.
+        Defaults to a pooled keep-alive session created with `create_session`.
+    pool_size : PositiveInt
+        Number of connections kept alive by the default session. Defaults to 10.
+    timeout : float or tuple of float
+        Connect and read timeouts of each request, in seconds. Defaults to (3.05, 30).
+    max_workers : PositiveInt
+        Number of requests sent concurrently while building. Defaults to 16.
+    rate_limiter : TokenBucket, optional
+        Rate limiter shared by all requests, e.g. across several databases.
+        Defaults to a TokenBucket built from `rate_limit` and `burst`.
+    rate_limit : PositiveFloat
+        Maximum number of requests per second of the default rate limiter. Defaults to 40.
+    burst : PositiveInt
+        Number of requests the default rate limiter sends without waiting. Defaults to 20.
+    max_retries : NonNegativeInt
+        Number of retries of a request failing with a throttling, server or connection error. Defaults to 5.
+    backoff : PositiveFloat
+        Delay before the first retry without `Retry-After`, doubled at each retry and jittered. Defaults to 0.5 s.
+    cache : ResponseCache, optional
+        On-disk cache of the responses, consulted before sending requests. Defaults to no cache.
+    journal_path : Path, optional
+        Path to a checkpoint journal, making the build resumable after a failure. Defaults to no journal.
+    streaming : bool
+        Whether movies are fetched on demand through `stream` or `iter_build` instead of on initialization,
+        e.g. to only `update` another database. Defaults to False.
+    person_ids : PersonIdTable, optional
+        Persistent table of composer person ids, consulted before searching and saved after each build.
+        Defaults to searching every composer.
 
     Attributes
     ----------
@@ -33,6 +361,18 @@ class MovieDatabaseFromAPI(MovieDatabase):
         Maximum number of movies to fetch per composer.
     composers : List[str]
         List of composers to fetch.
+    session : requests.Session
+        HTTP session used for all requests.
+    rate_limiter : TokenBucket
+        Rate limiter shared by all requests, counting throttled and retried requests.
+    cache : ResponseCache, optional
+        On-disk cache of the responses.
+    journal_path : Path, optional
+        Path to the checkpoint journal of the build.
+    streaming : bool
+        Whether movies are fetched on demand rather than on initialization.
+    person_ids : PersonIdTable, optional
+        Persistent table of composer person ids.
     BASE_URL : str
         Base URL for TMDb API.
     _movies : List[Movie]
@@ -43,12 +383,29 @@ class MovieDatabaseFromAPI(MovieDatabase):
     api_key: str = Field(..., description="TMDb API key")
     max_movies_per_composer: PositiveInt = Field(..., description="Max movies to fetch per composer")
     composers: list[str] = Field(default_factory=lambda: ComposerSettings().composers)
+    session: requests.Session | None = Field(default=None, exclude=True, description="HTTP session")
+    pool_size: PositiveInt = Field(DEFAULT_POOL_SIZE, description="Connections kept alive by the default session")
+    timeout: float | tuple[float, float] = Field(DEFAULT_TIMEOUT, description="Connect and read timeouts")
+    max_workers: PositiveInt = Field(DEFAULT_MAX_WORKERS, description="Concurrent requests while building")
+    rate_limiter: TokenBucket | None = Field(default=None, exclude=True, description="Shared rate limiter")
+    rate_limit: PositiveFloat = Field(DEFAULT_RATE_LIMIT, description="Requests per second")
+    burst: PositiveInt = Field(DEFAULT_BURST, description="Requests sent without waiting")
+    max_retries: NonNegativeInt = Field(DEFAULT_MAX_RETRIES, description="Retries of failed requests")
+    backoff: PositiveFloat = Field(DEFAULT_BACKOFF, description="Delay before the first retry, in seconds")
+    cache: ResponseCache | None = Field(default=None, exclude=True, description="On-disk response cache")
+    journal_path: Path | None = Field(default=None, description="Checkpoint journal of the build")
+    streaming: bool = Field(default=False, description="Fetch movies on demand instead of on initialization")
+    person_ids: PersonIdTable | None = Field(default=None, exclude=True, description="Composer person id table")
 
     BASE_URL: str = "https://api.themoviedb.org/3"
 
+    _owns_session: bool = PrivateAttr(default=False)
+    _journal: BuildJournal | None = PrivateAttr(default=None)
+    _single_flight: SingleFlight = PrivateAttr(default_factory=SingleFlight)
+
     def __init__(self, **data):
         """
-        Initialize MovieDatabaseFromAPI instance and build movie list.
+        Initialize MovieDatabaseFromAPI instance and build movie list, unless streaming.
 
         Parameters
         ----------
@@ -57,8 +414,15 @@ class MovieDatabaseFromAPI(MovieDatabase):
 
         """
         super().__init__(**data)
-        self._movies = []
-        self._build()
+        if self.session is None:
+            # Enough connections for every worker to keep its own alive
+            self.session = create_session(max(self.pool_size, self.max_workers))
+            self._owns_session = True
+        if self.rate_limiter is None:
+            self.rate_limiter = TokenBucket(rate=self.rate_limit, burst=self.burst)
+        self._movies = MovieList()
+        if not self.streaming:
+            self._build()
 
     @property
     def movies(self) -> list[Movie]:
@@ -73,63 +437,307 @@ class MovieDatabaseFromAPI(MovieDatabase):
         """
         return self._movies
 
+    @property
+    def single_flight(self) -> SingleFlight:
+        """Return the coalescer of concurrent credits and details requests, counting the saved requests."""
+        return self._single_flight
+
+    def close(self) -> None:
+        """Close the HTTP session if it was created by this database rather than injected."""
+        if self._owns_session:
+            self.session.close()
+
     def _build(self) -> None:
+        """Fetch movies from TMDb API for all composers and populate internal movie list."""
+        for movie in self.iter_build():
+            self._movies.append(movie)
+
+    def stream(self, maxsize: int = DEFAULT_STREAM_SIZE) -> MovieStream:
+        """
+        Start fetching movies in the background, to consume them while the fetching continues.
+
+        Streamed movies are not added to `movies`, so memory stays bounded by
+        `maxsize` whatever the number of fetched movies.
+
+        Parameters
+        ----------
+        maxsize : int
+            Maximum number of fetched movies waiting to be consumed. Defaults to 64.
+
+        Returns
+        -------
+        MovieStream
+            Iterator over the movies in build order; closing it stops the fetching.
+
+        """
+        return MovieStream(self.iter_build(), maxsize=maxsize)
+
+    def iter_build(self) -> Iterator[Movie]:
         """
-        Fetch movies from TMDb API for all composers and populate internal movie list.
+        Fetch movies from TMDb API for all composers, yielding them as soon as they are available.
+
+        Requests run concurrently on `max_workers` threads. Composer searches
+        and credits are requested up to `max_workers` composers ahead, and
+        the details of their movies are requested as soon as their credits
+        arrive, each distinct movie once. Movies are yielded in composer and
+        credit order, each movie being kept for the first composer crediting
+        it, so the result does not depend on the completion order.
+
+        With a `journal_path`, fetched credits and movies are journaled as
+        they arrive and reused when the build is restarted after a failure
+        or an early stop; the journal is deleted once the build completes.
+
+        Yields
+        ------
+        Movie
+            Fetched movies, in composer and credit order.
 
         Raises
         ------
         ValueError
-            If the composers list is empty.
+            If the composers list is empty, or if the journal was written with other parameters.
 
         """
         if not self.composers:
             raise ValueError("Composers list must be set before calling _build()")
 
-        seen_ids: set[int] = set()
-        for composer in self.composers:
-            logger.info(f"🎼 Fetching movies for composer: {composer}")
-            composer_id: int | None = self.search_person(composer)
-            if composer_id is None:
-                logger.warning(f"⚠️ No ID found for composer {composer}")
-                continue
+        if self.journal_path is not None:
+            self._journal = BuildJournal(self.journal_path, {"max_movies_per_composer": self.max_movies_per_composer})
+        scheduler = _FetchScheduler(self)
+        pending = iter(self.composers)
+        # Credits are fetched ahead, so that movie details are requested before they are needed
+        credit_futures = deque(scheduler.submit_composer(composer) for composer in islice(pending, self.max_workers))
+        completed = False
+        try:
+            seen_ids: set[int] = set()
+            while credit_futures:
+                composer, future = credit_futures.popleft()
+                if (next_composer := next(pending, None)) is not None:
+                    credit_futures.append(scheduler.submit_composer(next_composer))
+                movie_ids = future.result()
+                scheduler.submit_movies(movie_ids)
+                for movie_id in movie_ids or ():
+                    if movie_id in seen_ids:
+                        continue
+
+                    try:
+                        movie = Movie(**scheduler.movie_fields[movie_id].result(), composer=composer)
+                    except Exception as e:
+                        logger.warning(f"⚠️ Could not fetch movie {movie_id}: {e}")
+                        continue
+                    seen_ids.add(movie_id)
+                    logger.info(f"✅ Added movie: {movie.title}")
+                    yield movie
+            completed = True
+        finally:
+            # After a failure or an early stop, queued requests are dropped and the journal is kept
+            scheduler.executor.shutdown(cancel_futures=not completed)
+            if self._journal is not None:
+                self._journal.discard() if completed else self._journal.close()
+            self._journal = None
+            if self.person_ids is not None:
+                self.person_ids.save()
+
+    def _fetch_composer_movie_ids(self, composer: str) -> list[int] | None:
+        """
+        Fetch the ids of the movies scored by a composer, limited to `max_movies_per_composer`.
 
-            credits = self.get_person_credits(composer_id)
-            crew = credits.get("crew", [])
+        Parameters
+        ----------
+        composer : str
+            Name of the composer.
 
-            film_credits = [
-                credit for credit in crew if credit.get("job") in ("Original Music Composer", "Music", "Composer")
-            ][: self.max_movies_per_composer]
+        Returns
+        -------
+        Optional[List[int]]
+            TMDb ids of the movies of the composer, or None if the composer was not found.
 
-            for credit in film_credits:
-                movie_id = credit["id"]
-                if movie_id in seen_ids:
-                    continue
+        """
+        if self._journal is not None and composer in self._journal.credits:
+            return self._journal.credits[composer]
+
+        logger.info(f"🎼 Fetching movies for composer: {composer}")
+        movie_ids: list[int] | None = None
+        composer_id: int | None = self.resolve_person(composer)
+        if composer_id is None:
+            logger.warning(f"⚠️ No ID found for composer {composer}")
+        else:
+            movie_ids = [credit["id"] for credit in self._select_credits(self.get_person_credits(composer_id))]
+
+        if self._journal is not None:
+            self._journal.record_credits(composer, movie_ids)
+        return movie_ids
+
+    def _select_credits(self, credits: dict) -> list[dict]:
+        """Return the composer credits of a person, limited to `max_movies_per_composer`."""
+        crew = credits.get("crew", [])
+        return [credit for credit in crew if credit.get("job") in COMPOSER_JOBS][: self.max_movies_per_composer]
+
+    def _fetch_movie_fields(self, movie_id: int, refresh: bool = False) -> dict:
+        """
+        Fetch the fields of a movie, except its composer.
 
-                try:
-                    details = self.get_movie_details(movie_id)
-                    seen_ids.add(movie_id)
+        Parameters
+        ----------
+        movie_id : int
+            TMDb movie ID.
+        refresh : bool
+            Whether to bypass the cached details. Defaults to False.
 
-                    movie = Movie(
-                        title=details.get("title", "Unknown"),
-                        director=self.extract_director(details),
-                        composer=composer,
-                        cast=self.extract_main_cast(
-                            credits=details.get("credits", {}),
-                            max_cast=self.max_movies_per_composer,
-                        ),
-                        year=(int(details["release_date"][:4]) if details.get("release_date") else None),
-                    )
-                    self._movies.append(movie)
-                    logger.info(f"✅ Added movie: {movie.title}")
-                except Exception as e:
-                    logger.warning(f"⚠️ Could not fetch movie {movie_id}: {e}")
+        Returns
+        -------
+        dict
+            Title, director, main cast and release year of the movie.
 
-                time.sleep(0.25)  # Rate limit pause
+        """
+        if self._journal is not None and movie_id in self._journal.movies:
+            return self._journal.movies[movie_id]
+
+        details = self.get_movie_details(movie_id, refresh=True) if refresh else self.get_movie_details(movie_id)
+        fields = {
+            "title": details.get("title", "Unknown"),
+            "director": self.extract_director(details),
+            "cast": self.extract_main_cast(
+                credits=details.get("credits", {}),
+                max_cast=self.max_movies_per_composer,
+            ),
+            "year": (int(details["release_date"][:4]) if details.get("release_date") else None),
+        }
+        if self._journal is not None:
+            self._journal.record_movie(movie_id, fields)
+        return fields
+
+    def update(
+        self, since: datetime, database: MovieDatabase | None = None, until: datetime | None = None
+    ) -> DatabaseUpdate:
+        """
+        Patch a database built for the composers with the TMDb changes of a period, re-fetching only the changed ids.
+
+        The person and movie change feeds list the ids changed since
+        `since`. The movies of composers whose credits changed are
+        reconciled with their new credits: new movies are fetched and added,
+        uncredited ones removed. Changed movies are re-fetched and replaced.
+        Changed credits and movies bypass the cache; the credits of the other
+        composers take one request each unless they are cached.
+
+        Movies do not hold their TMDb id, so they are matched with the
+        credits of their composer by title. Since the credits may hold
+        another title than the database, e.g. when cached, a changed movie
+        left unmatched is then matched by its fetched title, or else by its
+        director and year among the unmatched movies of its composer. A
+        movie changing its title along with its director or year is left
+        as is.
+
+        Parameters
+        ----------
+        since : datetime
+            Last synchronization, timezone-aware, e.g. the `synced_at` of the previous update.
+        database : MovieDatabase, optional
+            Database to patch, whose `movies` must be a mutable list. Defaults to this database.
+        until : datetime, optional
+            End of the period, timezone-aware. Defaults to now.
 
-    def tmdb_get(self, endpoint: str, params: dict[str, str | int]) -> dict:
+        Returns
+        -------
+        DatabaseUpdate
+            Numbers of changes found and applied, and end of the applied period.
+
+        Raises
+        ------
+        ValueError
+            If `since` or `until` is a naive datetime.
+
+        """
+        until = until if until is not None else datetime.now(UTC)
+        if since.tzinfo is None or until.tzinfo is None:
+            raise ValueError("since and until must be timezone-aware datetimes, e.g. in UTC")
+        database = database if database is not None else self
+        changed_people = self.get_changes("person", since, until)
+        plan = _UpdatePlan(database.movies, self.get_changes("movie", since, until))
+        with ThreadPoolExecutor(max_workers=self.max_workers, thread_name_prefix="tmdb") as executor:
+            person_ids = {
+                composer: person_id
+                for composer, person_id in zip(
+                    self.composers, executor.map(self.resolve_person, self.composers), strict=True
+                )
+                if person_id is not None
+            }
+            credits = executor.map(
+                lambda person_id: self.get_person_credits(person_id, refresh=person_id in changed_people),
+                person_ids.values(),
+            )
+            for (composer, person_id), person_credits in zip(person_ids.items(), credits, strict=True):
+                plan.add_credits(composer, self._select_credits(person_credits), person_id in changed_people)
+            fields = dict(zip(plan.to_fetch, executor.map(self._try_fetch_movie_fields, plan.to_fetch), strict=True))
+        if self.person_ids is not None:
+            self.person_ids.save()
+
+        report = DatabaseUpdate(
+            synced_at=until,
+            changed_people=len(changed_people & set(person_ids.values())),
+            changed_movies=plan.changed_credited,
+            removed=len(plan.removals),
+        )
+        report.updated, report.added = plan.apply(database.movies, fields)
+        logger.info(
+            f"🔄 Updated database since {since:%Y-%m-%d}: "
+            f"{report.updated} updated, {report.added} added, {report.removed} removed"
+        )
+        return report
+
+    def _try_fetch_movie_fields(self, movie_id: int) -> dict | None:
+        """Fetch the fresh fields of a movie, or return None if the request fails."""
+        try:
+            return self._fetch_movie_fields(movie_id, refresh=True)
+        except Exception as e:
+            logger.warning(f"⚠️ Could not fetch movie {movie_id}: {e}")
+            return None
+
+    def get_changes(self, kind: str, since: datetime, until: datetime) -> set[int]:
         """
-        Send a GET request to TMDb API.
+        Return the ids of the people or movies changed during a period, from the TMDb change feed.
+
+        The feed is read page by page, over windows of at most 14 days, the
+        longest period TMDb accepts, and is never served from the cache.
+
+        Parameters
+        ----------
+        kind : str
+            Kind of the changed items, `person` or `movie`.
+        since : datetime
+            Start of the period.
+        until : datetime
+            End of the period.
+
+        Returns
+        -------
+        set[int]
+            TMDb ids of the changed items.
+
+        """
+        changed: set[int] = set()
+        start = since
+        while start < until:
+            end = min(start + CHANGES_WINDOW, until)
+            page = total_pages = 1
+            while page <= total_pages:
+                params = {"start_date": f"{start:%Y-%m-%d}", "end_date": f"{end:%Y-%m-%d}", "page": page}
+                data = self.tmdb_get(f"/{kind}/changes", params, refresh=True)
+                changed.update(result["id"] for result in data.get("results", []))
+                total_pages = data.get("total_pages", 1)
+                page += 1
+            start = end
+        return changed
+
+    def tmdb_get(self, endpoint: str, params: dict[str, str | int], refresh: bool = False) -> dict:
+        """
+        Send a GET request to TMDb API through the pooled session, unless the response is cached.
+
+        Requests are paced by the rate limiter. Throttled (429, 503), server
+        error and connection failures are retried up to `max_retries` times,
+        after the `Retry-After` delay if given or else a jittered exponential
+        backoff; throttled responses also slow down the rate limiter.
+        Successful responses are stored in the cache, if any.
 
         Parameters
         ----------
@@ -137,6 +745,8 @@ class MovieDatabaseFromAPI(MovieDatabase):
             API endpoint path (e.g., "/search/person").
         params : dict
             Query parameters for the request.
+        refresh : bool
+            Whether to send the request even if the response is cached, updating the cache. Defaults to False.
 
         Returns
         -------
@@ -145,15 +755,74 @@ class MovieDatabaseFromAPI(MovieDatabase):
 
         Raises
         ------
+        CacheMissError
+            If the cache is offline and does not hold the response, or if a refresh is requested.
         requests.HTTPError
-            If the HTTP request returned an unsuccessful status code.
+            If the HTTP request returned an unsuccessful status code, after retries if it was retryable.
+        requests.ConnectionError, requests.Timeout
+            If the request still failed to complete after all retries.
+
+        """
+        if self.cache is not None:
+            cached = None if refresh else self.cache.get(endpoint, params)
+            if cached is not None:
+                return cached
+            if self.cache.offline:
+                reason = "Cannot refresh offline" if refresh else "No cached response for"
+                raise CacheMissError(f"{reason} {self.cache.key(endpoint, params)}")
+
+        payload = self._send(endpoint, params).json()
+        if self.cache is not None:
+            self.cache.put(endpoint, params, payload)
+        return payload
+
+    def _send(self, endpoint: str, params: dict[str, str | int]) -> requests.Response:
+        """
+        Send a GET request to TMDb API, pacing and retrying it as described in `tmdb_get`.
+
+        Parameters
+        ----------
+        endpoint : str
+            API endpoint path.
+        params : dict
+            Query parameters for the request, without the API key.
+
+        Returns
+        -------
+        requests.Response
+            Successful response.
 
         """
-        params["api_key"] = self.api_key
         url = f"{self.BASE_URL}{endpoint}"
-        response = requests.get(url, params=params)
+        query = {**params, "api_key": self.api_key}
+        for attempt in range(self.max_retries + 1):
+            if attempt:
+                self.rate_limiter.record_retry()
+            self.rate_limiter.acquire()
+            try:
+                response = self.session.get(url, params=query, timeout=self.timeout)
+            except (requests.ConnectionError, requests.Timeout) as e:
+                if attempt == self.max_retries:
+                    raise
+                delay = backoff_delay(attempt, self.backoff)
+                logger.debug(f"🔁 Retrying {endpoint} in {delay:.2f}s after {e!r}")
+                time.sleep(delay)
+                continue
+
+            if response.status_code not in RETRYABLE_STATUSES or attempt == self.max_retries:
+                break
+            retry_after = parse_retry_after(response.headers.get("Retry-After"))
+            delay = retry_after if retry_after is not None else backoff_delay(attempt, self.backoff)
+            logger.debug(f"🔁 Retrying {endpoint} in {delay:.2f}s after HTTP {response.status_code}")
+            if response.status_code in THROTTLING_STATUSES:
+                # Every worker waits, since the limit is shared by the API key
+                self.rate_limiter.throttle(delay)
+            else:
+                time.sleep(delay)
+
         response.raise_for_status()
-        return response.json()
+        self.rate_limiter.succeed()
+        return response
 
     def search_person(self, name: str) -> int | None:
         """
@@ -178,14 +847,38 @@ class MovieDatabaseFromAPI(MovieDatabase):
             return None
         return max(candidates, key=lambda p: p.get("popularity", 0))["id"]
 
-    def get_person_credits(self, person_id: int) -> dict:
+    def resolve_person(self, name: str) -> int | None:
+        """
+        Return the TMDb ID of a composer, from the person id table if it knows the name, else by searching.
+
+        Parameters
+        ----------
+        name : str
+            Name of the person.
+
+        Returns
+        -------
+        Optional[int]
+            TMDb person ID if found, else None.
+
+        """
+        if self.person_ids is not None and name in self.person_ids:
+            return self.person_ids.get(name)
+        person_id = self.search_person(name)
+        if self.person_ids is not None:
+            self.person_ids.record(name, person_id)
+        return person_id
+
+    def get_person_credits(self, person_id: int, refresh: bool = False) -> dict:
         """
-        Retrieve movie credits for a given person.
+        Retrieve movie credits for a given person, sharing a request already in flight for them.
 
         Parameters
         ----------
         person_id : int
             TMDb person ID.
+        refresh : bool
+            Whether to bypass the cached credits. Defaults to False.
 
         Returns
         -------
@@ -193,16 +886,20 @@ class MovieDatabaseFromAPI(MovieDatabase):
             Dictionary containing movie credits data.
 
         """
-        return self.tmdb_get(f"/person/{person_id}/movie_credits", {})
+        return self._single_flight.do(
+            ("credits", person_id, refresh), self.tmdb_get, f"/person/{person_id}/movie_credits", {}, refresh
+        )
 
-    def get_movie_details(self, movie_id: int) -> dict:
+    def get_movie_details(self, movie_id: int, refresh: bool = False) -> dict:
         """
-        Retrieve detailed movie information including credits.
+        Retrieve detailed movie information including credits, sharing a request already in flight for it.
 
         Parameters
         ----------
         movie_id : int
             TMDb movie ID.
+        refresh : bool
+            Whether to bypass the cached details. Defaults to False.
 
         Returns
         -------
@@ -210,7 +907,13 @@ class MovieDatabaseFromAPI(MovieDatabase):
             Dictionary containing detailed movie information.
 
         """
-        return self.tmdb_get(f"/movie/{movie_id}", {"append_to_response": "credits"})
+        return self._single_flight.do(
+            ("movie", movie_id, refresh),
+            self.tmdb_get,
+            f"/movie/{movie_id}",
+            {"append_to_response": "credits"},
+            refresh,
+        )
 
     def extract_director(self, details: dict) -> str:
         """
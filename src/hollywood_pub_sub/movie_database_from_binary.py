@@ -0,0 +1,147 @@
+"""Module providing MovieDatabaseFromBinary, a movie database memory-mapped from a compact binary file."""
+
+from typing import Self
+
+from pydantic import FilePath, PrivateAttr, validate_call
+
+from hollywood_pub_sub.movie import Movie
+from hollywood_pub_sub.movie_aggregates import MovieAggregates
+from hollywood_pub_sub.movie_binary import BinaryMovieFile, BinaryMovieList
+from hollywood_pub_sub.movie_database import MovieDatabase
+
+
+class MovieDatabaseFromBinary(MovieDatabase):
+    """
+    Movie database read from a binary file written by `MovieDatabase.to_binary`.
+
+    The file is memory-mapped, so loading does not parse or validate
+    anything: movies are built the first time they are accessed. `filter`
+    and `composers` work on the records while `movies` is unmodified, so
+    only the matching movies are built. Call `close`, or use the database
+    as a context manager, to release the map.
+
+    Parameters
+    ----------
+    path : FilePath
+        Path to the binary movie database file.
+
+    Attributes
+    ----------
+    path : FilePath
+        Path to the binary movie database file.
+    _source : BinaryMovieFile
+        Memory-mapped view of the file.
+    _movies : BinaryMovieList
+        Lazily built list of movies.
+
+    """
+
+    path: FilePath
+
+    _source: BinaryMovieFile = PrivateAttr()
+    _movies: BinaryMovieList = PrivateAttr()
+
+    def model_post_init(self, context) -> None:
+        """Map the binary file."""
+        super().model_post_init(context)
+        self._source = BinaryMovieFile(self.path)
+        self._movies = BinaryMovieList(self._source)
+
+    @property
+    def movies(self) -> list[Movie]:
+        """Return the movies, built lazily from the binary file."""
+        return self._movies
+
+    def close(self) -> None:
+        """Release the memory map of the file; the movies already built stay accessible."""
+        self._source.close()
+
+    def __enter__(self) -> Self:
+        """Return the database, to be closed when leaving the context."""
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        """Close the database."""
+        self.close()
+
+    @property
+    def composers(self) -> list[str]:
+        """Return a sorted list of unique composers, maintained by the aggregates."""
+        return self.aggregates().composers
+
+    def _build_aggregates(self) -> MovieAggregates:
+        """Compute the aggregates from the file records while the movie list is unmodified."""
+        if self._movies.version == 0:
+            return self._source.aggregates()
+        return super()._build_aggregates()
+
+    @validate_call
+    def filter(
+        self,
+        title: str | None = None,
+        director: str | None = None,
+        composer: str | None = None,
+        year: int | None = None,
+        cast: str | list[str] | None = None,
+    ) -> list[Movie]:
+        """
+        Filter movies based on various attributes, directly on the file records while `movies` is unmodified.
+
+        Parameters
+        ----------
+        title : Optional[str]
+            Exact title to match.
+        director : Optional[str]
+            Exact director name to match.
+        composer : Optional[str]
+            Exact composer name to match.
+        year : Optional[int]
+            Release year to match.
+        cast : Optional[Union[str, List[str]]]
+            One or more cast members that must appear in the movie.
+
+        Returns
+        -------
+        List[Movie]
+            Movies of `movies` matching all specified criteria, in list order.
+
+        """
+        movies = self._movies
+        if movies.version:
+            # The records no longer reflect the list
+            return super().filter(title=title, director=director, composer=composer, year=year, cast=cast)
+
+        cast_filter: list[str] | None = [cast] if isinstance(cast, str) else cast
+        # Falsy criteria are ignored, as in MovieDatabase.filter
+        positions = self._source.select(
+            title=title or None,
+            director=director or None,
+            composer=composer or None,
+            year=year or None,
+            cast=cast_filter or None,
+        )
+        return [movies[position] for position in positions.tolist()]
+
+    @classmethod
+    @validate_call
+    def from_binary(cls, path: FilePath) -> Self:
+        """
+        Load the movie database from a binary file.
+
+        Parameters
+        ----------
+        path : FilePath
+            Path to the binary file.
+
+        Returns
+        -------
+        Self
+            An instance of MovieDatabaseFromBinary mapping the file.
+
+        Raises
+        ------
+        ValueError
+            If the file is not a binary movie database.
+
+        """
+        return cls(path=path)
@@ -1,20 +1,133 @@
 """Module providing MovieDatabaseFromJSON, a root model for movies loaded from JSON."""
 
-from typing import Self
+from collections.abc import Iterator
+import json
+from typing import Any, Self, TextIO
 
-from pydantic import FilePath, RootModel, validate_call
+from pydantic import FilePath, RootModel, ValidationError, validate_call
 
 from hollywood_pub_sub.movie import Movie
 from hollywood_pub_sub.movie_database import MovieDatabase
+from hollywood_pub_sub.movie_list import MovieList
+
+
+CHUNK_SIZE = 1 << 16
+_WHITESPACE = " \t\n\r"
+
+
+class MovieRecordError(ValueError):
+    """
+    Error raised when a record of a streamed JSON movie array is malformed or is not a valid movie.
+
+    Attributes
+    ----------
+    offset : int
+        Byte offset, in the file, of the start of the faulty record (or of the unexpected character).
+    index : int
+        Position of the faulty record in the array.
+
+    """
+
+    def __init__(self, message: str, offset: int, index: int):
+        """Initialize the error with the location of the faulty record."""
+        super().__init__(f"{message} (record {index} at byte offset {offset})")
+        self.offset = offset
+        self.index = index
+
+
+class _JSONArrayReader:
+    """Incremental reader of the elements of a top-level JSON array, holding one element in memory at a time."""
+
+    def __init__(self, file: TextIO, chunk_size: int):
+        """Prepare reading the given text file."""
+        self.file = file
+        self.chunk_size = chunk_size
+        self.decoder = json.JSONDecoder()
+        self.buffer = ""
+        self.offset = 0  # Byte offset of buffer[0] in the file
+        self.eof = False
+
+    def __iter__(self) -> Iterator[tuple[Any, int]]:
+        """Yield each element of the array with the byte offset where it starts."""
+        position = self._skip_whitespace(0)
+        if self.buffer[position : position + 1] != "[":
+            raise MovieRecordError("Expected a JSON array of movies", self._byte_offset(position), 0)
+        position = self._skip_whitespace(position + 1)
+        if self.buffer[position : position + 1] == "]":
+            self._expect_end(position + 1, 0)
+            return
+
+        index = 0
+        while True:
+            data, end = self._decode(position, index)
+            yield data, self._byte_offset(position)
+
+            end = self._skip_whitespace(end)
+            delimiter = self.buffer[end : end + 1]
+            if delimiter not in (",", "]"):
+                raise MovieRecordError("Expected ',' or ']' after a movie", self._byte_offset(end), index + 1)
+            # Drop the consumed prefix so that memory stays bounded by a single element
+            self.offset = self._byte_offset(end + 1)
+            self.buffer = self.buffer[end + 1 :]
+            if delimiter == "]":
+                self._expect_end(0, index + 1)
+                return
+            position = self._skip_whitespace(0)
+            index += 1
+
+    def _expect_end(self, position: int, index: int) -> None:
+        """Check that only whitespace follows the closing bracket of the array, as `from_json` requires."""
+        position = self._skip_whitespace(position)
+        if position < len(self.buffer):
+            raise MovieRecordError("Unexpected data after the JSON array", self._byte_offset(position), index)
+
+    def _read_more(self) -> None:
+        """Append the next chunk of the file to the buffer."""
+        chunk = self.file.read(self.chunk_size)
+        self.eof = not chunk
+        self.buffer += chunk
+
+    def _skip_whitespace(self, position: int) -> int:
+        """Return the position of the next significant character, reading more data if needed."""
+        while True:
+            while position < len(self.buffer) and self.buffer[position] in _WHITESPACE:
+                position += 1
+            if position < len(self.buffer) or self.eof:
+                return position
+            self._read_more()
+
+    def _decode(self, position: int, index: int) -> tuple[Any, int]:
+        """Decode the element starting at position, reading until it is complete and followed by a delimiter."""
+        while True:
+            try:
+                data, end = self.decoder.raw_decode(self.buffer, position)
+            except json.JSONDecodeError as error:
+                if self.eof:
+                    raise MovieRecordError(f"Malformed JSON: {error.msg}", self._byte_offset(position), index) from None
+            else:
+                # A number could be cut at the end of the buffer: only trust values followed by more data
+                if end < len(self.buffer) or self.eof:
+                    return data, end
+            self._read_more()
+
+    def _byte_offset(self, position: int) -> int:
+        """Return the byte offset, in the file, of a buffer position."""
+        return self.offset + len(self.buffer[:position].encode("utf-8"))
 
 
 class MovieDatabaseFromJSON(RootModel[list[Movie]], MovieDatabase):
     """
     A root model representing a database of movies.
 
-    Uses a list of Movie instances as its root.
+    Uses a list of Movie instances as its root, stored as a MovieList so that
+    modifications are tracked.
     """
 
+    def model_post_init(self, context) -> None:
+        """Wrap the validated movies in a MovieList."""
+        super().model_post_init(context)
+        self.root = MovieList(self.root)
+
     @property
     def movies(self) -> list[Movie]:
         """Return the list of movies stored in the root."""
@@ -22,9 +135,8 @@ class MovieDatabaseFromJSON(RootModel[list[Movie]], MovieDatabase):
 
     @property
     def composers(self) -> list[str]:
-        """Return a sorted list of unique composers from the movies."""
-        composers_set: set[str] = {movie.composer for movie in self.root if movie.composer}
-        return sorted(composers_set)
+        """Return a sorted list of unique composers from the movies, maintained by the aggregates."""
+        return self.aggregates().composers
 
     @classmethod
     @validate_call
@@ -44,3 +156,65 @@ class MovieDatabaseFromJSON(RootModel[list[Movie]], MovieDatabase):
 
         """
         return cls.model_validate_json(path.read_bytes())
+
+    @classmethod
+    @validate_call
+    def iter_json(cls, path: FilePath, chunk_size: int = CHUNK_SIZE) -> Iterator[Movie]:
+        """
+        Stream and validate the movies of a JSON array file, one element at a time.
+
+        The file is read in chunks and only the element being decoded is held
+        in memory, so arbitrarily large catalogues can be processed.
+
+        Parameters
+        ----------
+        path : FilePath
+            Path to the JSON file, holding a top-level array of movies.
+        chunk_size : int, optional
+            Number of characters read from the file at a time.
+
+        Yields
+        ------
+        Movie
+            Validated movies, in file order.
+
+        Raises
+        ------
+        MovieRecordError
+            If the file is not a JSON array, a record is malformed or invalid, or
+            data follows the array, with the byte offset of the first faulty record.
+
+        """
+        with path.open(encoding="utf-8") as file:
+            reader = _JSONArrayReader(file, chunk_size)
+            for index, (data, offset) in enumerate(reader):
+                try:
+                    yield Movie.model_validate(data)
+                except ValidationError as error:
+                    raise MovieRecordError(f"Invalid movie: {error}", offset, index) from error
+
+    @classmethod
+    @validate_call
+    def from_json_stream(cls, path: FilePath, chunk_size: int = CHUNK_SIZE) -> Self:
+        """
+        Load the movie database from a JSON file without reading it whole into memory.
+
+        Parameters
+        ----------
+        path : FilePath
+            Path to the JSON file.
+        chunk_size : int, optional
+            Number of characters read from the file at a time.
+
+        Returns
+        -------
+        Self
+            An instance of MovieDatabaseFromJSON with validated movies.
+
+        Raises
+        ------
+        MovieRecordError
+            If a record is malformed or invalid, or data follows the array, with its byte offset.
+
+        """
+        return cls(MovieList(cls.iter_json(path, chunk_size=chunk_size)))
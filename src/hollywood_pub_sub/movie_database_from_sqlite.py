@@ -0,0 +1,293 @@
+"""Module providing MovieDatabaseFromSQLite, a movie database stored in a normalized SQLite file."""
+
+from collections.abc import Iterable, Iterator, Sequence
+from itertools import groupby
+from pathlib import Path
+import sqlite3
+from typing import Self
+
+from pydantic import FilePath, PrivateAttr, validate_call
+
+from hollywood_pub_sub.movie import Movie
+from hollywood_pub_sub.movie_aggregates import MovieAggregates
+from hollywood_pub_sub.movie_database import MovieDatabase
+from hollywood_pub_sub.movie_database_from_json import MovieDatabaseFromJSON
+from hollywood_pub_sub.movie_sqlite import connect, insert_movies
+
+
+_SELECT_MOVIES = """
+SELECT m.id, m.title, d.name, c.name, m.year
+FROM movies m JOIN people d ON d.id = m.director_id JOIN people c ON c.id = m.composer_id
+WHERE {where}
+ORDER BY m.id
+"""
+_SELECT_CAST = """
+SELECT cm.movie_id, p.name
+FROM cast_members cm JOIN people p ON p.id = cm.person_id JOIN movies m ON m.id = cm.movie_id
+WHERE {where}
+ORDER BY cm.movie_id, cm.position
+"""
+_PERSON = "(SELECT id FROM people WHERE name = ?)"
+
+
+class SQLiteMovies(Sequence[Movie]):
+    """
+    Read-only sequence of the movies of a SQLite movie database, in insertion order.
+
+    Iterating streams the rows through cursors instead of loading every
+    movie. Movies have consecutive ids from 1 in insertion order, so the
+    length and each position are primary key lookups. `version` is bumped whenever movies are added through the
+    database, so that cached derived data is refreshed.
+
+    Parameters
+    ----------
+    database : MovieDatabaseFromSQLite
+        Database whose movies are exposed.
+
+    Attributes
+    ----------
+    version : int
+        Number of modifications of the database through this sequence's owner.
+
+    """
+
+    def __init__(self, database: "MovieDatabaseFromSQLite"):
+        """Initialize the sequence of the movies of a database."""
+        self.database = database
+        self.version = 0
+
+    def __len__(self) -> int:
+        """Return the number of movies, which is the largest movie id."""
+        (count,) = self.database.connection.execute("SELECT COALESCE(MAX(id), 0) FROM movies").fetchone()
+        return count
+
+    def __iter__(self) -> Iterator[Movie]:
+        """Stream the movies, in insertion order."""
+        return self.database.iter_movies()
+
+    def __getitem__(self, index):
+        """Return the movie at a position, or a list of movies for a slice."""
+        if isinstance(index, slice):
+            positions = range(*index.indices(len(self)))
+            if not positions:
+                return []
+            # Read the covered id range with a single query
+            first, last = min(positions), max(positions)
+            movies = list(self.database.iter_movies("m.id BETWEEN ? AND ?", (first + 1, last + 1)))
+            return [movies[position - first] for position in positions]
+        length = len(self)
+        position = index + length if index < 0 else index
+        if not 0 <= position < length:
+            raise IndexError("movie index out of range")
+        return next(self.database.iter_movies("m.id = ?", (position + 1,)))
+
+
+class MovieDatabaseFromSQLite(MovieDatabase):
+    """
+    Movie database stored in a SQLite file with normalized, indexed tables.
+
+    Movies reference people (directors, composers and cast members) stored
+    once in a `people` table, and cast entries live in a `cast_members`
+    table. `filter` is translated into SQL using the indexes on title,
+    director, composer, year and cast, and `movies` streams rows with a
+    cursor, so catalogues larger than memory can be used.
+
+    Parameters
+    ----------
+    path : FilePath
+        Path to the SQLite file.
+
+    Attributes
+    ----------
+    path : FilePath
+        Path to the SQLite file.
+    connection : sqlite3.Connection
+        Connection to the database.
+
+    """
+
+    path: FilePath
+
+    _connection: sqlite3.Connection = PrivateAttr()
+    _movies: SQLiteMovies = PrivateAttr()
+
+    def model_post_init(self, context) -> None:
+        """Connect to the database, creating its tables and indexes if needed."""
+        super().model_post_init(context)
+        self._connection = connect(self.path)
+        self._movies = SQLiteMovies(self)
+
+    @property
+    def connection(self) -> sqlite3.Connection:
+        """Return the connection to the database."""
+        return self._connection
+
+    @property
+    def movies(self) -> list[Movie]:
+        """Return the read-only sequence of the movies, streamed from the database."""
+        return self._movies
+
+    @property
+    def composers(self) -> list[str]:
+        """Return a sorted list of unique composers, maintained by the aggregates."""
+        return self.aggregates().composers
+
+    def close(self) -> None:
+        """Close the connection to the database."""
+        self._connection.close()
+
+    def iter_movies(self, where: str = "1", params: Sequence = ()) -> Iterator[Movie]:
+        """
+        Stream the movies matching an SQL condition, in insertion order.
+
+        Movies and cast entries are read with two cursors ordered by movie id
+        and merged, so only one movie is built at a time.
+
+        Parameters
+        ----------
+        where : str
+            SQL condition on the movies table, aliased `m`.
+        params : Sequence
+            Parameters of the condition.
+
+        Yields
+        ------
+        Movie
+            Matching movies.
+
+        """
+        movie_rows = self._connection.execute(_SELECT_MOVIES.format(where=where), params)
+        cast_groups = groupby(
+            self._connection.execute(_SELECT_CAST.format(where=where), params), key=lambda row: row[0]
+        )
+        cast_movie_id, cast_rows = next(cast_groups, (None, iter(())))
+        for movie_id, title, director, composer, year in movie_rows:
+            cast: list[str] = []
+            if cast_movie_id == movie_id:
+                cast = [name for _, name in cast_rows]
+                cast_movie_id, cast_rows = next(cast_groups, (None, iter(())))
+            yield Movie(title=title, director=director, composer=composer, cast=cast, year=year)
+
+    def add_movies(self, movies: Iterable[Movie]) -> int:
+        """
+        Append movies to the database.
+
+        Parameters
+        ----------
+        movies : Iterable[Movie]
+            Movies to insert, in order.
+
+        Returns
+        -------
+        int
+            Number of inserted movies.
+
+        """
+        count = insert_movies(self._connection, movies)
+        self._movies.version += 1
+        return count
+
+    @validate_call
+    def filter(
+        self,
+        title: str | None = None,
+        director: str | None = None,
+        composer: str | None = None,
+        year: int | None = None,
+        cast: str | list[str] | None = None,
+    ) -> list[Movie]:
+        """
+        Filter movies based on various attributes, with an indexed SQL query.
+
+        Parameters
+        ----------
+        title : Optional[str]
+            Exact title to match.
+        director : Optional[str]
+            Exact director name to match.
+        composer : Optional[str]
+            Exact composer name to match.
+        year : Optional[int]
+            Release year to match.
+        cast : Optional[Union[str, List[str]]]
+            One or more cast members that must appear in the movie.
+
+        Returns
+        -------
+        List[Movie]
+            Filtered list of movies matching all specified criteria, in insertion order.
+
+        """
+        cast_filter: list[str] | None = [cast] if isinstance(cast, str) else cast
+
+        # Falsy criteria are ignored, as in MovieDatabase.filter
+        conditions: list[str] = []
+        params: list[str | int] = []
+        for condition, value in (
+            ("m.title = ?", title),
+            (f"m.director_id = {_PERSON}", director),
+            (f"m.composer_id = {_PERSON}", composer),
+            ("m.year = ?", year),
+        ):
+            if value:
+                conditions.append(condition)
+                params.append(value)
+        for actor in cast_filter or ():
+            conditions.append(f"EXISTS (SELECT 1 FROM cast_members WHERE movie_id = m.id AND person_id = {_PERSON})")
+            params.append(actor)
+        return list(self.iter_movies(" AND ".join(conditions) or "1", params))
+
+    def _build_aggregates(self) -> MovieAggregates:
+        """Compute the aggregates with grouped SQL counts."""
+
+        def counts(query: str) -> dict:
+            return dict(self._connection.execute(query))
+
+        return MovieAggregates.from_counts(
+            counts("SELECT p.name, COUNT(*) FROM movies m JOIN people p ON p.id = m.composer_id GROUP BY p.id"),
+            counts("SELECT p.name, COUNT(*) FROM movies m JOIN people p ON p.id = m.director_id GROUP BY p.id"),
+            counts("SELECT year, COUNT(*) FROM movies GROUP BY year"),
+        )
+
+    @classmethod
+    def from_sqlite(cls, path: Path) -> Self:
+        """
+        Open a SQLite movie database, creating an empty one if the file does not exist.
+
+        Parameters
+        ----------
+        path : Path
+            Path to the SQLite file.
+
+        Returns
+        -------
+        Self
+            An instance of MovieDatabaseFromSQLite connected to the file.
+
+        """
+        path.touch(exist_ok=True)
+        return cls(path=path)
+
+    @classmethod
+    @validate_call
+    def from_json(cls, json_path: FilePath, path: Path) -> Self:
+        """
+        Import a JSON movie database into a new SQLite file, streaming the JSON file.
+
+        Parameters
+        ----------
+        json_path : FilePath
+            Path to the JSON file.
+        path : Path
+            Path of the SQLite file to create; an existing file is replaced.
+
+        Returns
+        -------
+        Self
+            An instance of MovieDatabaseFromSQLite holding the imported movies.
+
+        """
+        path.unlink(missing_ok=True)
+        database = cls.from_sqlite(path)
+        database.add_movies(MovieDatabaseFromJSON.iter_json(json_path))
+        return database
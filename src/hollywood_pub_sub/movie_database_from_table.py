@@ -0,0 +1,119 @@
+"""Module providing MovieDatabaseFromTable, a movie database backed by a columnar MovieTable."""
+
+from collections.abc import Iterable
+from typing import Self
+
+from pydantic import PrivateAttr, validate_call
+
+from hollywood_pub_sub.movie import Movie
+from hollywood_pub_sub.movie_aggregates import MovieAggregates
+from hollywood_pub_sub.movie_database import MovieDatabase
+from hollywood_pub_sub.movie_list import MovieList
+from hollywood_pub_sub.movie_table import MovieTable, MovieView
+
+
+class MovieDatabaseFromTable(MovieDatabase):
+    """
+    Movie database storing its movies in a columnar MovieTable.
+
+    Names are interned once and movies are rows of integer columns, which
+    takes several times less memory than one Movie object per movie.
+    `movies` is a list of lightweight MovieView objects reading the table,
+    while `filter` and `composers` work directly on the columns until the
+    list is modified, and on the list afterwards.
+
+    Attributes
+    ----------
+    table : MovieTable
+        Columnar store of the movies.
+    _movies : MovieList
+        Views of the table rows, created on first access.
+
+    """
+
+    table: MovieTable
+
+    _movies: MovieList | None = PrivateAttr(default=None)
+
+    @property
+    def movies(self) -> list[Movie]:
+        """Return the views of the movies, in table order until the list is modified."""
+        if self._movies is None:
+            self._movies = MovieList(MovieView(self.table, row) for row in range(len(self.table)))
+        return self._movies
+
+    @property
+    def composers(self) -> list[str]:
+        """Return a sorted list of unique composers, maintained by the aggregates."""
+        return self.aggregates().composers
+
+    def _build_aggregates(self) -> MovieAggregates:
+        """Compute the aggregates from the table columns while the list of views is unmodified."""
+        if self._movies is None or self._movies.version == 0:
+            return self.table.aggregates()
+        return super()._build_aggregates()
+
+    @validate_call
+    def filter(
+        self,
+        title: str | None = None,
+        director: str | None = None,
+        composer: str | None = None,
+        year: int | None = None,
+        cast: str | list[str] | None = None,
+    ) -> list[Movie]:
+        """
+        Filter movies based on various attributes, directly on the table columns while `movies` is unmodified.
+
+        Parameters
+        ----------
+        title : Optional[str]
+            Exact title to match.
+        director : Optional[str]
+            Exact director name to match.
+        composer : Optional[str]
+            Exact composer name to match.
+        year : Optional[int]
+            Release year to match.
+        cast : Optional[Union[str, List[str]]]
+            One or more cast members that must appear in the movie.
+
+        Returns
+        -------
+        List[Movie]
+            Movies of `movies` matching all specified criteria, in list order.
+
+        """
+        movies = self.movies
+        if movies.version:
+            # The table no longer reflects the list
+            return super().filter(title=title, director=director, composer=composer, year=year, cast=cast)
+
+        cast_filter: list[str] | None = [cast] if isinstance(cast, str) else cast
+        # Falsy criteria are ignored, as in MovieDatabase.filter
+        rows = self.table.select(
+            title=title or None,
+            director=director or None,
+            composer=composer or None,
+            year=year or None,
+            cast=cast_filter or None,
+        )
+        return [movies[row] for row in rows.tolist()]
+
+    @classmethod
+    def from_movies(cls, movies: Iterable[Movie]) -> Self:
+        """
+        Build a table-backed database from movies.
+
+        Parameters
+        ----------
+        movies : Iterable[Movie]
+            Movies to store, in order.
+
+        Returns
+        -------
+        Self
+            An instance of MovieDatabaseFromTable holding the movies.
+
+        """
+        return cls(table=MovieTable(movies))
@@ -0,0 +1,96 @@
+"""Module defining MovieIndex, inverted indexes from movie attributes to movie positions."""
+
+from collections import defaultdict
+from collections.abc import Sequence
+
+from hollywood_pub_sub.movie import Movie
+
+
+INDEXED_FIELDS = ("title", "director", "composer", "year", "cast")
+
+
+class MovieIndex:
+    """
+    Inverted indexes mapping attribute values to the positions of the movies holding them.
+
+    One posting set of positions is kept per title, director, composer, year
+    and cast member. The index of a field is only built the first time that
+    field is queried. Queries intersect posting sets instead of scanning movies.
+
+    Parameters
+    ----------
+    movies : Sequence[Movie]
+        Movies to index; positions refer to this sequence.
+
+    Attributes
+    ----------
+    postings : dict[str, dict[str | int, set[int]]]
+        Posting sets of movie positions, by field then by value, for the fields built so far.
+
+    """
+
+    def __init__(self, movies: Sequence[Movie]):
+        """Prepare the indexes of the given movies, without building them yet."""
+        self.movies = movies
+        self.postings: dict[str, dict[str | int, set[int]]] = {}
+
+    def lookup(self, field: str, value: str | int) -> set[int]:
+        """
+        Return the positions of the movies whose field holds the value.
+
+        Parameters
+        ----------
+        field : str
+            One of "title", "director", "composer", "year" or "cast".
+        value : str or int
+            Value to look up.
+
+        Returns
+        -------
+        set[int]
+            Posting set of movie positions; must not be modified.
+
+        """
+        if field not in self.postings:
+            self.postings[field] = self._build(field)
+        return self.postings[field].get(value, set())
+
+    def query(self, criteria: list[tuple[str, str | int]]) -> list[int]:
+        """
+        Return the sorted positions of the movies matching all criteria.
+
+        Posting sets are intersected from the most selective one, stopping as soon as the result is empty.
+
+        Parameters
+        ----------
+        criteria : list[tuple[str, str | int]]
+            Non-empty list of (field, value) pairs that must all match.
+
+        Returns
+        -------
+        list[int]
+            Positions of the matching movies, in increasing order.
+
+        """
+        postings = sorted((self.lookup(field, value) for field, value in criteria), key=len)
+        positions = set(postings[0])
+        for posting in postings[1:]:
+            if not positions:
+                break
+            positions.intersection_update(posting)
+        return sorted(positions)
+
+    def _build(self, field: str) -> dict[str | int, set[int]]:
+        """Build the posting sets of one field."""
+        postings: dict[str | int, set[int]] = defaultdict(set)
+        if field == "cast":
+            for position, movie in enumerate(self.movies):
+                for actor in movie.cast:
+                    postings[actor].add(position)
+        elif field in INDEXED_FIELDS:
+            for position, movie in enumerate(self.movies):
+                postings[getattr(movie, field)].add(position)
+        else:
+            raise ValueError(f"Unknown indexed field '{field}', expected one of {', '.join(INDEXED_FIELDS)}.")
+        # Plain dict so that lookups of unknown values do not create empty postings
+        return dict(postings)
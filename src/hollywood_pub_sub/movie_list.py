@@ -0,0 +1,148 @@
+"""Module defining MovieList, a list of movies that tracks its own modifications."""
+
+from collections.abc import Callable
+
+from hollywood_pub_sub.movie import Movie
+
+
+MovieObserver = Callable[[list[Movie], list[Movie]], None]
+
+
+class MovieList(list[Movie]):
+    """
+    List of Movie instances counting its modifications.
+
+    Every in-place modification (item assignment, deletion, append, shuffle,
+    sort...) increments `version`, which lets derived data such as indexes
+    know when they must be rebuilt without rescanning the movies.
+
+    Observers registered with `add_observer` are also called after each
+    modification with the movies added to and removed from the list, which
+    lets derived data such as aggregates be updated incrementally. Reordering
+    (sort, reverse) notifies observers with no added or removed movie, so that
+    they can follow the version.
+
+    Attributes
+    ----------
+    version : int
+        Number of modifications since the list was created.
+
+    """
+
+    # Class-level defaults, used while unpickling or copying adds items before restoring the instance state
+    version = 0
+    _observers: list[MovieObserver] = []
+
+    def __init__(self, *args):
+        """Initialize a MovieList with the same arguments as a list."""
+        super().__init__(*args)
+        self.version = 0
+        self._observers: list[MovieObserver] = []
+
+    def __getstate__(self) -> dict:
+        """Return the state to pickle or copy, without the observers of this list."""
+        return {"version": self.version}
+
+    def __setstate__(self, state: dict) -> None:
+        """Restore a pickled or copied state, with no observer."""
+        self.version = state["version"]
+        self._observers = []
+
+    def add_observer(self, observer: MovieObserver) -> None:
+        """
+        Register a callback notified of the movies added and removed by each modification.
+
+        Parameters
+        ----------
+        observer : Callable[[list[Movie], list[Movie]], None]
+            Function called with the added movies, then the removed movies.
+
+        """
+        self._observers.append(observer)
+
+    def remove_observer(self, observer: MovieObserver) -> None:
+        """Unregister a callback registered with `add_observer`."""
+        self._observers.remove(observer)
+
+    def __setitem__(self, index, value):
+        """Assign an item or a slice, then bump the version."""
+        if isinstance(index, slice):
+            value = list(value)
+            removed, added = self[index], value
+        else:
+            removed, added = [self[index]], [value]
+        super().__setitem__(index, value)
+        self._modified(added, removed)
+
+    def __delitem__(self, index):
+        """Delete an item or a slice, then bump the version."""
+        removed = self[index] if isinstance(index, slice) else [self[index]]
+        super().__delitem__(index)
+        self._modified([], removed)
+
+    def __iadd__(self, other):
+        """Extend the list in place, then bump the version."""
+        added = list(other)
+        result = super().__iadd__(added)
+        self._modified(added, [])
+        return result
+
+    def __imul__(self, count):
+        """Repeat the list in place, then bump the version."""
+        before = list(self)
+        result = super().__imul__(count)
+        if count < 1:
+            self._modified([], before)
+        else:
+            self._modified(before * (count - 1), [])
+        return result
+
+    def append(self, movie: Movie) -> None:
+        """Append a movie, then bump the version."""
+        super().append(movie)
+        self._modified([movie], [])
+
+    def extend(self, movies) -> None:
+        """Extend the list with movies, then bump the version."""
+        added = list(movies)
+        super().extend(added)
+        self._modified(added, [])
+
+    def insert(self, index: int, movie: Movie) -> None:
+        """Insert a movie, then bump the version."""
+        super().insert(index, movie)
+        self._modified([movie], [])
+
+    def pop(self, index: int = -1) -> Movie:
+        """Remove and return a movie, then bump the version."""
+        movie = super().pop(index)
+        self._modified([], [movie])
+        return movie
+
+    def remove(self, movie: Movie) -> None:
+        """Remove the first occurrence of a movie, then bump the version."""
+        removed = self[self.index(movie)]
+        super().remove(movie)
+        self._modified([], [removed])
+
+    def clear(self) -> None:
+        """Remove every movie, then bump the version."""
+        removed = list(self)
+        super().clear()
+        self._modified([], removed)
+
+    def sort(self, *args, **kwargs) -> None:
+        """Sort the movies in place, then bump the version."""
+        super().sort(*args, **kwargs)
+        self._modified([], [])
+
+    def reverse(self) -> None:
+        """Reverse the movies in place, then bump the version."""
+        super().reverse()
+        self._modified([], [])
+
+    def _modified(self, added: list[Movie], removed: list[Movie]) -> None:
+        """Bump the version and notify the observers."""
+        self.version += 1
+        for observer in self._observers:
+            observer(added, removed)
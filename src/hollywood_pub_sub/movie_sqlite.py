@@ -0,0 +1,144 @@
+"""Module defining the normalized SQLite schema of movie databases and how to write movies to it."""
+
+from collections.abc import Iterable
+from itertools import islice
+from pathlib import Path
+import sqlite3
+
+from hollywood_pub_sub.movie import Movie
+
+
+SQLITE_SUFFIXES = (".sqlite", ".sqlite3")
+MOVIE_TABLES = frozenset({"people", "movies", "cast_members"})
+INSERT_BATCH_SIZE = 10_000
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS people (
+    id INTEGER PRIMARY KEY,
+    name TEXT NOT NULL UNIQUE
+);
+CREATE TABLE IF NOT EXISTS movies (
+    id INTEGER PRIMARY KEY,
+    title TEXT NOT NULL,
+    director_id INTEGER NOT NULL REFERENCES people (id),
+    composer_id INTEGER NOT NULL REFERENCES people (id),
+    year INTEGER NOT NULL
+);
+CREATE TABLE IF NOT EXISTS cast_members (
+    movie_id INTEGER NOT NULL REFERENCES movies (id),
+    position INTEGER NOT NULL,
+    person_id INTEGER NOT NULL REFERENCES people (id),
+    PRIMARY KEY (movie_id, position)
+) WITHOUT ROWID;
+CREATE INDEX IF NOT EXISTS movies_title ON movies (title);
+CREATE INDEX IF NOT EXISTS movies_director ON movies (director_id);
+CREATE INDEX IF NOT EXISTS movies_composer ON movies (composer_id);
+CREATE INDEX IF NOT EXISTS movies_year ON movies (year);
+CREATE INDEX IF NOT EXISTS cast_members_person ON cast_members (person_id, movie_id);
+"""
+
+
+def connect(path: Path) -> sqlite3.Connection:
+    """
+    Open a movie database, creating its tables and indexes if the file is empty.
+
+    Parameters
+    ----------
+    path : Path
+        Path to the SQLite file.
+
+    Returns
+    -------
+    sqlite3.Connection
+        Connection to the database.
+
+    Raises
+    ------
+    ValueError
+        If the file is another SQLite database, which is left untouched.
+
+    """
+    connection = sqlite3.connect(path)
+    try:
+        tables = {name for (name,) in connection.execute("SELECT name FROM sqlite_master WHERE type = 'table'")}
+    except sqlite3.DatabaseError as e:
+        connection.close()
+        raise ValueError(f"{path} is not a SQLite database") from e
+    if tables and not MOVIE_TABLES <= tables:
+        connection.close()
+        raise ValueError(f"{path} is not a movie database")
+    connection.executescript(SCHEMA)
+    return connection
+
+
+def insert_movies(connection: sqlite3.Connection, movies: Iterable[Movie], batch_size: int = INSERT_BATCH_SIZE) -> int:
+    """
+    Append movies to a movie database, in batches within a single transaction.
+
+    Movies get consecutive ids following the last one, starting at 1.
+
+    Parameters
+    ----------
+    connection : sqlite3.Connection
+        Connection to a database opened with `connect`.
+    movies : Iterable[Movie]
+        Movies to insert, in order; they are only iterated once.
+    batch_size : int
+        Number of movies inserted per batch.
+
+    Returns
+    -------
+    int
+        Number of inserted movies.
+
+    """
+    person_ids: dict[str, int] = dict(connection.execute("SELECT name, id FROM people"))
+
+    def person_id(name: str) -> int:
+        if name not in person_ids:
+            person_ids[name] = connection.execute("INSERT INTO people (name) VALUES (?)", (name,)).lastrowid
+        return person_ids[name]
+
+    (next_id,) = connection.execute("SELECT COALESCE(MAX(id), 0) + 1 FROM movies").fetchone()
+    count = 0
+    movies = iter(movies)
+    with connection:
+        while batch := list(islice(movies, batch_size)):
+            ids = range(next_id + count, next_id + count + len(batch))
+            connection.executemany(
+                "INSERT INTO movies (id, title, director_id, composer_id, year) VALUES (?, ?, ?, ?, ?)",
+                [
+                    (movie_id, movie.title, person_id(movie.director), person_id(movie.composer), movie.year)
+                    for movie_id, movie in zip(ids, batch, strict=True)
+                ],
+            )
+            connection.executemany(
+                "INSERT INTO cast_members (movie_id, position, person_id) VALUES (?, ?, ?)",
+                [
+                    (movie_id, position, person_id(actor))
+                    for movie_id, movie in zip(ids, batch, strict=True)
+                    for position, actor in enumerate(movie.cast)
+                ],
+            )
+            count += len(batch)
+    return count
+
+
+def write_movies_sqlite(movies: Iterable[Movie], path: Path) -> None:
+    """
+    Write movies to a new SQLite movie database, replacing any existing file.
+
+    Parameters
+    ----------
+    movies : Iterable[Movie]
+        Movies to write, in order.
+    path : Path
+        Path of the SQLite file to create.
+
+    """
+    path.unlink(missing_ok=True)
+    connection = connect(path)
+    try:
+        insert_movies(connection, movies)
+    finally:
+        connection.close()
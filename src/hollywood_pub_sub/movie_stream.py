@@ -0,0 +1,155 @@
+"""Module defining MovieStream, a bounded producer/consumer stream of movies, and sliding-window shuffling."""
+
+from collections.abc import Iterable, Iterator
+import queue
+import random
+import threading
+from typing import Self
+
+from hollywood_pub_sub.movie import Movie
+
+
+DEFAULT_STREAM_SIZE = 64
+POLL_INTERVAL = 0.1
+
+_DONE = object()
+
+
+class _Failure:
+    """Exception raised by the producer, to be re-raised by the consumer."""
+
+    def __init__(self, error: BaseException):
+        """Wrap the exception."""
+        self.error = error
+
+
+class MovieStream(Iterator[Movie]):
+    """
+    Iterator over movies produced by a background thread through a bounded queue.
+
+    The producer iterates `movies` (e.g. a database build) and blocks when
+    `maxsize` movies are waiting, so memory stays bounded whatever the
+    number of movies. An exception raised by the producer is re-raised by
+    the consumer. Closing the stream, explicitly or by leaving its context,
+    stops the producer and closes `movies` if it is a generator.
+
+    Parameters
+    ----------
+    movies : Iterable[Movie]
+        Movies to produce.
+    maxsize : int
+        Maximum number of produced movies not consumed yet. Defaults to 64.
+
+    Attributes
+    ----------
+    produced : int
+        Number of movies produced so far.
+
+    """
+
+    def __init__(self, movies: Iterable[Movie], maxsize: int = DEFAULT_STREAM_SIZE):
+        """Start producing movies in a background thread."""
+        if maxsize < 1:
+            raise ValueError("maxsize must be at least 1")
+        self.produced = 0
+        self._queue: queue.Queue = queue.Queue(maxsize=maxsize)
+        self._stopped = threading.Event()
+        self._finished = False
+        self._thread = threading.Thread(target=self._produce, args=(movies,), name="movie-stream", daemon=True)
+        self._thread.start()
+
+    def __next__(self) -> Movie:
+        """Return the next movie, waiting for the producer if needed."""
+        if self._finished:
+            raise StopIteration
+        item = self._queue.get()
+        if item is _DONE or isinstance(item, _Failure):
+            self._finished = True
+            self._thread.join()
+            if item is _DONE:
+                raise StopIteration
+            raise item.error
+        return item
+
+    def close(self) -> None:
+        """Stop the producer and wait for it to finish."""
+        self._stopped.set()
+        self._finished = True
+        # Unblock a producer waiting for room in the queue
+        while self._thread.is_alive():
+            try:
+                self._queue.get(timeout=POLL_INTERVAL)
+            except queue.Empty:
+                pass
+        self._thread.join()
+
+    def __enter__(self) -> Self:
+        """Return the stream."""
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        """Close the stream."""
+        self.close()
+
+    def _produce(self, movies: Iterable[Movie]) -> None:
+        """Put the movies in the queue until they are exhausted or the stream is closed."""
+        iterator = iter(movies)
+        end: object = _DONE
+        try:
+            for movie in iterator:
+                if not self._put(movie):
+                    return
+                self.produced += 1
+        except BaseException as e:
+            end = _Failure(e)
+        finally:
+            if hasattr(iterator, "close"):
+                iterator.close()
+        self._put(end)
+
+    def _put(self, item: object) -> bool:
+        """Put an item in the queue, waiting for room; return False if the stream was closed meanwhile."""
+        while not self._stopped.is_set():
+            try:
+                self._queue.put(item, timeout=POLL_INTERVAL)
+                return True
+            except queue.Full:
+                pass
+        return False
+
+
+def window_shuffle(movies: Iterable[Movie], window: int, rng: random.Random | None = None) -> Iterator[Movie]:
+    """
+    Shuffle movies on the fly, each movie being drawn among the next `window` ones.
+
+    Only `window` movies are held at a time, so the movies can be consumed
+    while they are still being produced. A window at least as large as the
+    number of movies gives a uniform shuffle.
+
+    Parameters
+    ----------
+    movies : Iterable[Movie]
+        Movies to shuffle.
+    window : int
+        Number of movies among which each yielded movie is drawn.
+    rng : random.Random, optional
+        Random generator. Defaults to the `random` module.
+
+    Yields
+    ------
+    Movie
+        The movies, in shuffled order.
+
+    """
+    if window < 1:
+        raise ValueError("window must be at least 1")
+    randrange, shuffle = (rng.randrange, rng.shuffle) if rng is not None else (random.randrange, random.shuffle)
+    buffer: list[Movie] = []
+    for movie in movies:
+        buffer.append(movie)
+        if len(buffer) == window:
+            index = randrange(window)
+            buffer[index], buffer[-1] = buffer[-1], buffer[index]
+            yield buffer.pop()
+    shuffle(buffer)
+    yield from buffer
@@ -0,0 +1,228 @@
+"""Module defining MovieTable, a columnar store of movies, and MovieView, a lightweight view of one of its rows."""
+
+from collections.abc import Iterable
+from typing import Any
+
+import numpy as np
+
+from hollywood_pub_sub.movie import Movie
+from hollywood_pub_sub.movie_aggregates import MovieAggregates
+
+
+class MovieTable:
+    """
+    Columnar (struct-of-arrays) store of movies.
+
+    Director, composer and cast names are interned once in a shared
+    vocabulary, and each movie is a row of integer columns. The cast of all
+    movies is stored in CSR layout: the cast of row `i` is
+    `cast_ids[cast_offsets[i]:cast_offsets[i + 1]]`.
+
+    Attributes
+    ----------
+    names : list[str]
+        Interned director, composer and cast names, indexed by id.
+    name_ids : dict[str, int]
+        Id of each interned name.
+    titles : list[str]
+        Title of each movie.
+    directors : np.ndarray
+        Director name id of each movie.
+    composers : np.ndarray
+        Composer name id of each movie.
+    years : np.ndarray
+        Release year of each movie.
+    cast_offsets : np.ndarray
+        Start of the cast of each movie in `cast_ids`, plus the total number of cast entries.
+    cast_ids : np.ndarray
+        Name ids of the cast entries of all movies.
+
+    """
+
+    def __init__(self, movies: Iterable[Movie] = ()):
+        """
+        Build the table from movies.
+
+        Parameters
+        ----------
+        movies : Iterable[Movie]
+            Movies to store, in order.
+
+        """
+        self.names: list[str] = []
+        self.name_ids: dict[str, int] = {}
+        self.titles: list[str] = []
+        directors: list[int] = []
+        composers: list[int] = []
+        years: list[int] = []
+        cast_ids: list[int] = []
+        cast_offsets = [0]
+        for movie in movies:
+            self.titles.append(movie.title)
+            directors.append(self._intern(movie.director))
+            composers.append(self._intern(movie.composer))
+            years.append(movie.year)
+            cast_ids.extend(self._intern(actor) for actor in movie.cast)
+            cast_offsets.append(len(cast_ids))
+
+        self.directors = np.asarray(directors, dtype=np.uint32)
+        self.composers = np.asarray(composers, dtype=np.uint32)
+        self.years = np.asarray(years, dtype=np.int32)
+        self.cast_offsets = np.asarray(cast_offsets, dtype=np.int64)
+        self.cast_ids = np.asarray(cast_ids, dtype=np.uint32)
+        self._cast_rows: np.ndarray | None = None
+        self._title_rows: dict[str, list[int]] | None = None
+
+    def __len__(self) -> int:
+        """Return the number of movies."""
+        return len(self.titles)
+
+    def cast(self, row: int) -> list[str]:
+        """Return the cast names of a row."""
+        start, stop = self.cast_offsets[row : row + 2].tolist()
+        return [self.names[name_id] for name_id in self.cast_ids[start:stop].tolist()]
+
+    def aggregates(self) -> MovieAggregates:
+        """Return the aggregates of the table movies, computed on the columns."""
+        return MovieAggregates.from_columns(self.names.__getitem__, self.composers, self.directors, self.years)
+
+    def select(
+        self,
+        title: str | None = None,
+        director: str | None = None,
+        composer: str | None = None,
+        year: int | None = None,
+        cast: list[str] | None = None,
+    ) -> np.ndarray:
+        """
+        Return the rows matching all the given criteria, computed on the columns.
+
+        Parameters
+        ----------
+        title : str, optional
+            Exact title to match.
+        director : str, optional
+            Exact director name to match.
+        composer : str, optional
+            Exact composer name to match.
+        year : int, optional
+            Release year to match.
+        cast : list[str], optional
+            Cast members that must all appear in the movie.
+
+        Returns
+        -------
+        np.ndarray
+            Matching rows, in increasing order.
+
+        """
+        mask = np.ones(len(self), dtype=bool)
+        if title is not None:
+            title_mask = np.zeros(len(self), dtype=bool)
+            title_mask[self._rows_of_title(title)] = True
+            mask &= title_mask
+        for column, name in ((self.directors, director), (self.composers, composer)):
+            if name is not None:
+                mask &= column == self.name_ids.get(name, -1)
+        if year is not None:
+            mask &= self.years == year
+        for actor in cast or ():
+            actor_mask = np.zeros(len(self), dtype=bool)
+            actor_mask[self._entry_rows()[self.cast_ids == self.name_ids.get(actor, -1)]] = True
+            mask &= actor_mask
+        return np.flatnonzero(mask)
+
+    def _intern(self, name: str) -> int:
+        """Return the id of a name, adding it to the vocabulary if needed."""
+        name_id = self.name_ids.get(name)
+        if name_id is None:
+            name_id = self.name_ids[name] = len(self.names)
+            self.names.append(name)
+        return name_id
+
+    def _entry_rows(self) -> np.ndarray:
+        """Return the row of each cast entry, computed once."""
+        if self._cast_rows is None:
+            self._cast_rows = np.repeat(np.arange(len(self)), np.diff(self.cast_offsets))
+        return self._cast_rows
+
+    def _rows_of_title(self, title: str) -> list[int]:
+        """Return the rows holding a title, through an index built on the first title lookup."""
+        if self._title_rows is None:
+            self._title_rows = {}
+            for row, row_title in enumerate(self.titles):
+                self._title_rows.setdefault(row_title, []).append(row)
+        return self._title_rows.get(title, [])
+
+
+class MovieView:
+    """
+    Read-only view of one movie of a MovieTable.
+
+    Exposes the same attributes as Movie, read from the table columns on
+    access, so that a view only costs a reference to the table and a row.
+
+    Parameters
+    ----------
+    table : MovieTable
+        Table holding the movie.
+    row : int
+        Row of the movie in the table.
+
+    """
+
+    __slots__ = ("table", "row")
+
+    def __init__(self, table: MovieTable, row: int):
+        """Initialize a view of one row."""
+        self.table = table
+        self.row = row
+
+    @property
+    def title(self) -> str:
+        """Return the title of the movie."""
+        return self.table.titles[self.row]
+
+    @property
+    def director(self) -> str:
+        """Return the director of the movie."""
+        return self.table.names[self.table.directors[self.row]]
+
+    @property
+    def composer(self) -> str:
+        """Return the composer of the movie."""
+        return self.table.names[self.table.composers[self.row]]
+
+    @property
+    def year(self) -> int:
+        """Return the release year of the movie."""
+        return int(self.table.years[self.row])
+
+    @property
+    def cast(self) -> list[str]:
+        """Return the cast of the movie."""
+        return self.table.cast(self.row)
+
+    def model_dump(self) -> dict[str, Any]:
+        """Return the fields of the movie as a dict, like Movie.model_dump."""
+        return {
+            "title": self.title,
+            "director": self.director,
+            "composer": self.composer,
+            "cast": self.cast,
+            "year": self.year,
+        }
+
+    def to_movie(self) -> Movie:
+        """Return a standalone Movie copy of the view."""
+        return Movie(**self.model_dump())
+
+    def __eq__(self, other) -> bool:
+        """Compare fields with another view or Movie."""
+        if not isinstance(other, MovieView | Movie):
+            return NotImplemented
+        return self.model_dump() == other.model_dump()
+
+    def __repr__(self) -> str:
+        """Return a representation similar to Movie."""
+        return f"MovieView({', '.join(f'{field}={value!r}' for field, value in self.model_dump().items())})"
@@ -0,0 +1,120 @@
+"""Module defining PersonIdTable, a persistent table resolving composer names to TMDb person ids."""
+
+import json
+from pathlib import Path
+import threading
+
+from hollywood_pub_sub.atomic_file import atomic_write
+from hollywood_pub_sub.logger import logger
+
+
+PERSON_ID_TABLE_VERSION = 1
+
+
+class PersonIdTable:
+    """
+    Persistent, versioned table of the TMDb person ids of composers.
+
+    The table is a JSON file holding its format `version`, the `ids`
+    resolved by previous builds (null for names without a matching person),
+    and manual `overrides` for ambiguous names, which always take precedence.
+    New resolutions are kept in memory and written in bulk by `save`. A
+    file written with another format version is ignored, except for its
+    overrides.
+
+    Parameters
+    ----------
+    path : Path
+        Path to the JSON file, created by `save` if needed.
+    overrides : dict[str, int], optional
+        Manual ids, added to the overrides of the file.
+
+    Attributes
+    ----------
+    path : Path
+        Path to the JSON file.
+    ids : dict[str, int | None]
+        Resolved ids by name.
+    overrides : dict[str, int]
+        Manual ids by name.
+
+    """
+
+    def __init__(self, path: Path, overrides: dict[str, int] | None = None):
+        """Load the table file if it exists."""
+        self.path = Path(path)
+        self.ids: dict[str, int | None] = {}
+        self.overrides: dict[str, int] = {}
+        self._dirty = False
+        self._lock = threading.Lock()
+        if self.path.exists():
+            self._load()
+        if overrides and self.overrides | overrides != self.overrides:
+            self.overrides.update(overrides)
+            self._dirty = True
+
+    def __contains__(self, name: str) -> bool:
+        """Return whether a name is resolved by the table."""
+        return name in self.overrides or name in self.ids
+
+    def get(self, name: str) -> int | None:
+        """
+        Return the person id of a name, from the overrides first.
+
+        Parameters
+        ----------
+        name : str
+            Name of the person.
+
+        Returns
+        -------
+        Optional[int]
+            TMDb person id, or None if the name is unknown or has no matching person.
+
+        """
+        if name in self.overrides:
+            return self.overrides[name]
+        return self.ids.get(name)
+
+    def record(self, name: str, person_id: int | None) -> None:
+        """
+        Record the resolution of a name, to be written by the next `save`.
+
+        Parameters
+        ----------
+        name : str
+            Name of the person.
+        person_id : int, optional
+            TMDb person id, or None if no person matches the name.
+
+        """
+        with self._lock:
+            if self.ids.get(name, ...) != person_id:
+                self.ids[name] = person_id
+                self._dirty = True
+
+    def save(self) -> None:
+        """Write the table atomically if it changed since it was loaded or saved."""
+        with self._lock:
+            if not self._dirty:
+                return
+            content = {
+                "version": PERSON_ID_TABLE_VERSION,
+                "ids": dict(sorted(self.ids.items())),
+                "overrides": dict(sorted(self.overrides.items())),
+            }
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            with atomic_write(self.path) as file:
+                json.dump(content, file, ensure_ascii=False, indent=4)
+            self._dirty = False
+
+    def _load(self) -> None:
+        """Read the table file."""
+        with self.path.open(encoding="utf-8") as file:
+            content = json.load(file)
+        self.overrides = {name: int(person_id) for name, person_id in content.get("overrides", {}).items()}
+        if content.get("version") != PERSON_ID_TABLE_VERSION:
+            logger.warning(f"⚠️ Ignoring person ids of {self.path}, written with version {content.get('version')}")
+            self._dirty = True
+            return
+        self.ids = content.get("ids", {})
@@ -1,6 +1,7 @@
 """Module defining Publisher, which publishes movies to subscribed callbacks."""
 
-from collections.abc import Callable
+from collections.abc import Callable, Iterable
+from concurrent.futures import Future, ThreadPoolExecutor, wait
 
 from hollywood_pub_sub.logger import logger
 from hollywood_pub_sub.movie import Movie
@@ -10,6 +11,23 @@ class Publisher:
     """
     Publisher class that publishes movies to subscribers.
 
+    Subscribers either listen to every movie (broadcast) or register under a
+    routing key, in which case they only receive the movies whose composer
+    matches that key. Keyed subscriptions are stored in a dict index so that
+    publishing a movie only reaches the interested callbacks.
+
+    By default callbacks run one after another on the caller thread. With
+    `max_workers`, they are fanned out to a pool of single-thread lanes: each
+    callback is pinned to one lane, so it receives movies in publication
+    order, while callbacks on different lanes run concurrently. Exceptions and
+    timeouts of pooled callbacks are logged and recorded in `failures`
+    instead of aborting the rest of the fan-out.
+
+    Movies can also be published in batches with `publish_many`: each
+    subscriber is called once with its share of the batch through the
+    `batch_callback` given when subscribing, or once per movie otherwise.
+    Batches preserve the publication order within each routing key only.
+
     Attributes
     ----------
     name : str
@@ -17,18 +35,30 @@ class Publisher:
     movies : List[Movie]
         List of Movie instances to publish.
     subscribers : List[Callable[[Movie], None]]
-        List of subscriber callback functions.
+        List of broadcast subscriber callback functions.
+    keyed_subscribers : Dict[str, List[Callable[[Movie], None]]]
+        Subscriber callback functions indexed by routing key (composer name).
+    max_workers : int, optional
+        Number of dispatch lanes, or None to run callbacks serially on the caller thread.
+    callback_timeout : float, optional
+        Maximum time, in seconds, a pooled publication waits for its callbacks.
+    failures : List[Tuple[Callable[[Movie], None], Movie | List[Movie], BaseException]]
+        Callback, movie or batch, and exception (or TimeoutError) of each failed pooled delivery.
 
     Methods
     -------
-    subscribe(callback: Callable[[Movie], None]) -> None
+    subscribe(callback: Callable[[Movie], None], key: str | None = None, batch_callback=None) -> None
         Register a subscriber callback to receive published movies.
     publish(movie: Movie) -> None
-        Publish a movie to all subscribers by calling their callbacks.
+        Publish a movie to the matching keyed subscribers and to all broadcast subscribers.
+    publish_many(movies: Iterable[Movie]) -> None
+        Publish a batch of movies, calling each subscriber once with its share of the batch.
+    close() -> None
+        Shut down the dispatch lanes.
 
     """
 
-    def __init__(self, movies: list[Movie]):
+    def __init__(self, movies: list[Movie], max_workers: int | None = None, callback_timeout: float | None = None):
         """
         Initialize Publisher.
 
@@ -38,12 +68,64 @@ class Publisher:
             Name of the publisher.
         movies : List[Movie]
             List of Movie instances to be published.
+        max_workers : int, optional
+            Number of dispatch lanes. Defaults to None, running callbacks serially on the caller thread.
+        callback_timeout : float, optional
+            Maximum time, in seconds, a pooled publication waits for its callbacks. Defaults to no limit.
+
+        Raises
+        ------
+        ValueError
+            If `max_workers` is not strictly positive.
 
         """
+        if max_workers is not None and max_workers < 1:
+            raise ValueError("Number of dispatch workers must be strictly positive.")
         self.movies = movies
         self.subscribers: list[Callable[[Movie], None]] = []
+        self.keyed_subscribers: dict[str, list[Callable[[Movie], None]]] = {}
+        self.max_workers = max_workers
+        self.callback_timeout = callback_timeout
+        self.failures: list[tuple[Callable[[Movie], None], Movie | list[Movie], BaseException]] = []
+        self._lanes: list[ThreadPoolExecutor] = [
+            ThreadPoolExecutor(max_workers=1, thread_name_prefix=f"publisher-lane-{idx}")
+            for idx in range(max_workers or 0)
+        ]
+        self._lane_of: dict[Callable[[Movie], None], int] = {}
+        self._batch_callbacks: dict[Callable[[Movie], None], Callable[[list[Movie]], None]] = {}
+
+    def __enter__(self) -> "Publisher":
+        """Return the publisher, to be closed when leaving the context."""
+        return self
 
-    def subscribe(self, callback: Callable[[Movie], None]) -> None:
+    def __exit__(self, *exc_info) -> None:
+        """Close the publisher."""
+        self.close()
+
+    @staticmethod
+    def routing_key(movie: Movie) -> str:
+        """
+        Return the routing key of a movie, i.e. its composer name.
+
+        Parameters
+        ----------
+        movie : Movie
+            Movie instance to route.
+
+        Returns
+        -------
+        str
+            Key used to look up keyed subscribers.
+
+        """
+        return movie.composer
+
+    def subscribe(
+        self,
+        callback: Callable[[Movie], None],
+        key: str | None = None,
+        batch_callback: Callable[[list[Movie]], None] | None = None,
+    ) -> None:
         """
         Subscribe a callback function to the publisher.
 
@@ -52,13 +134,29 @@ class Publisher:
         callback : Callable[[Movie], None]
             Function to be called when a movie is published.
             It should accept a single argument: the Movie instance.
+        key : str, optional
+            Routing key (composer name) the callback is interested in.
+            If omitted, the callback receives every published movie.
+        batch_callback : Callable[[List[Movie]], None], optional
+            Function called instead of `callback` with the movies of a `publish_many` batch.
+            If omitted, `callback` is called once per movie of the batch.
 
         """
-        self.subscribers.append(callback)
+        if batch_callback is not None:
+            self._batch_callbacks[callback] = batch_callback
+        if key is None:
+            self.subscribers.append(callback)
+        else:
+            self.keyed_subscribers.setdefault(key, []).append(callback)
+        if self._lanes:
+            # Round-robin pinning: a callback always runs on the same lane, hence in order
+            self._lane_of.setdefault(callback, len(self._lane_of) % len(self._lanes))
 
     def publish(self, movie: Movie) -> None:
         """
-        Publish a movie to all subscribers.
+        Publish a movie to its keyed subscribers, then to all broadcast subscribers.
+
+        In pooled mode, returns once every callback has completed or the callback timeout has elapsed.
 
         Parameters
         ----------
@@ -71,5 +169,93 @@ class Publisher:
             f"We are about to start shooting the movie {movie.title} ({movie.year})!\n"
             "Who wants to score it?"
         )
-        for callback in self.subscribers:
-            callback(movie)
+        callbacks = [*self.keyed_subscribers.get(self.routing_key(movie), ()), *self.subscribers]
+        self._dispatch([(callback, movie) for callback in callbacks], self._call)
+
+    def publish_many(self, movies: Iterable[Movie]) -> None:
+        """
+        Publish a batch of movies with a single log record and a single call per subscriber.
+
+        Movies are grouped by routing key: keyed subscribers receive the movies
+        of their composer, broadcast subscribers receive the whole batch, both
+        in publication order. Subscribers with a `batch_callback` receive
+        their batch through it; other callbacks are called once per movie.
+
+        There is no ordering across routing keys: the subscribers of a key are
+        called in the order of the key's first movie in the batch, so with
+        interleaved keys, a subscriber reaching a count earlier in the batch
+        may be called after another one. Use `publish` when the first
+        subscriber to react in publication order matters, e.g. to pick a winner.
+
+        Parameters
+        ----------
+        movies : Iterable[Movie]
+            Movie instances to publish, in publication order.
+
+        """
+        batch = list(movies)
+        if not batch:
+            return
+        batches_by_key: dict[str, list[Movie]] = {}
+        for movie in batch:
+            batches_by_key.setdefault(self.routing_key(movie), []).append(movie)
+
+        logger.info(
+            f"📣 Publisher: {len(batch)} movies are about to start shooting "
+            f"({len(batches_by_key)} composers wanted)! Who wants to score them?"
+        )
+        deliveries = [
+            (callback, key_batch)
+            for key, key_batch in batches_by_key.items()
+            for callback in self.keyed_subscribers.get(key, ())
+        ]
+        deliveries += [(callback, batch) for callback in self.subscribers]
+        self._dispatch(deliveries, self._call_with_batch)
+
+    def close(self) -> None:
+        """Shut down the dispatch lanes, waiting for running callbacks."""
+        for lane in self._lanes:
+            lane.shutdown(wait=True)
+
+    def _dispatch(
+        self,
+        deliveries: list[tuple[Callable[[Movie], None], Movie | list[Movie]]],
+        invoke: Callable[[Callable[[Movie], None], Movie | list[Movie]], None],
+    ) -> None:
+        """Invoke each delivery serially, or fan them out to the lanes and report failures."""
+        if not self._lanes:
+            for callback, subject in deliveries:
+                invoke(callback, subject)
+            return
+
+        futures: list[Future] = [
+            self._lanes[self._lane_of[callback]].submit(invoke, callback, subject) for callback, subject in deliveries
+        ]
+        wait(futures, timeout=self.callback_timeout)
+        for (callback, subject), future in zip(deliveries, futures, strict=True):
+            if not future.done():
+                self._report_failure(callback, subject, TimeoutError(f"timed out after {self.callback_timeout}s"))
+            elif future.exception() is not None:
+                self._report_failure(callback, subject, future.exception())
+
+    @staticmethod
+    def _call(callback: Callable[[Movie], None], movie: Movie) -> None:
+        """Call a subscriber callback with a single movie."""
+        callback(movie)
+
+    def _call_with_batch(self, callback: Callable[[Movie], None], batch: list[Movie]) -> None:
+        """Call a subscriber with a batch, through its batch callback if it has one."""
+        batch_callback = self._batch_callbacks.get(callback)
+        if batch_callback is not None:
+            batch_callback(batch)
+        else:
+            for movie in batch:
+                callback(movie)
+
+    def _report_failure(
+        self, callback: Callable[[Movie], None], subject: Movie | list[Movie], error: BaseException
+    ) -> None:
+        """Log and record a failed pooled delivery."""
+        self.failures.append((callback, subject, error))
+        what = f"batch of {len(subject)} movies" if isinstance(subject, list) else f"movie {subject.title}"
+        logger.warning(f"⚠️ Subscriber callback {callback!r} failed for {what}: {error!r}")
@@ -0,0 +1,152 @@
+"""Module defining TokenBucket, a thread-safe adaptive rate limiter for API requests."""
+
+from collections.abc import Callable
+import random
+import threading
+import time
+
+
+class TokenBucket:
+    """
+    Thread-safe token bucket limiting the rate of requests, adapting to server throttling.
+
+    Each request takes a token; tokens are refilled at `rate` per second up to
+    `burst`. When the server throttles requests, `throttle` halves the current
+    rate (down to `min_rate`) and may suspend every caller until a given
+    delay has elapsed; each successful request then raises the rate back by
+    `recovery` per second until the configured rate is reached.
+
+    Parameters
+    ----------
+    rate : float
+        Maximum sustained number of requests per second.
+    burst : int
+        Maximum number of requests sent without waiting.
+    min_rate : float
+        Lowest rate reached by successive throttles. Defaults to 1 request per second.
+    recovery : float
+        Rate increase after each successful request, in requests per second. Defaults to 0.5.
+    clock : Callable[[], float]
+        Monotonic clock, in seconds. Defaults to `time.monotonic`.
+    sleep : Callable[[float], None]
+        Function waiting for a duration, in seconds. Defaults to `time.sleep`.
+
+    Attributes
+    ----------
+    max_rate : float
+        Configured maximum rate.
+    rate : float
+        Current rate, lowered by throttles.
+    burst : int
+        Capacity of the bucket.
+    acquired : int
+        Number of tokens taken.
+    waited : int
+        Number of acquisitions that had to wait for a token.
+    throttled : int
+        Number of throttled responses reported.
+    retried : int
+        Number of retried requests reported.
+
+    """
+
+    def __init__(
+        self,
+        rate: float,
+        burst: int,
+        min_rate: float = 1.0,
+        recovery: float = 0.5,
+        clock: Callable[[], float] = time.monotonic,
+        sleep: Callable[[float], None] = time.sleep,
+    ):
+        """Initialize a full bucket."""
+        if rate <= 0 or burst < 1:
+            raise ValueError("rate must be strictly positive and burst at least 1")
+        self.max_rate = rate
+        self.rate = rate
+        self.burst = burst
+        self.min_rate = min(min_rate, rate)
+        self.recovery = recovery
+        self.acquired = 0
+        self.waited = 0
+        self.throttled = 0
+        self.retried = 0
+        self._clock = clock
+        self._sleep = sleep
+        self._tokens = float(burst)
+        self._updated = clock()
+        self._resume_at = 0.0
+        self._lock = threading.Lock()
+
+    def acquire(self) -> None:
+        """Take a token, waiting until one is available and any throttling pause is over."""
+        waited = False
+        while True:
+            with self._lock:
+                now = self._clock()
+                self._refill(now)
+                if now >= self._resume_at and self._tokens >= 1:
+                    self._tokens -= 1
+                    self.acquired += 1
+                    self.waited += waited
+                    return
+                delay = max(self._resume_at - now, (1 - self._tokens) / self.rate)
+            waited = True
+            self._sleep(delay)
+
+    def throttle(self, delay: float = 0.0) -> None:
+        """
+        Report a throttled response, halving the rate and pausing every caller.
+
+        Parameters
+        ----------
+        delay : float
+            Minimum time before the next request, e.g. from a `Retry-After` header, in seconds.
+
+        """
+        with self._lock:
+            now = self._clock()
+            self._refill(now)
+            self.throttled += 1
+            self.rate = max(self.min_rate, self.rate / 2)
+            # Drop the accumulated burst so that requests resume at the lowered rate
+            self._tokens = min(self._tokens, 0.0)
+            self._resume_at = max(self._resume_at, now + delay)
+
+    def succeed(self) -> None:
+        """Report a successful response, raising the rate back towards its maximum."""
+        with self._lock:
+            self.rate = min(self.max_rate, self.rate + self.recovery)
+
+    def record_retry(self) -> None:
+        """Count a retried request."""
+        with self._lock:
+            self.retried += 1
+
+    def _refill(self, now: float) -> None:
+        """Add the tokens earned since the last update."""
+        self._tokens = min(self.burst, self._tokens + (now - self._updated) * self.rate)
+        self._updated = now
+
+
+def backoff_delay(attempt: int, base: float, cap: float = 60.0) -> float:
+    """
+    Return a jittered exponential backoff delay.
+
+    Parameters
+    ----------
+    attempt : int
+        Number of the retry, starting at 0.
+    base : float
+        Delay of the first retry before jitter, in seconds.
+    cap : float
+        Maximum delay before jitter, in seconds.
+
+    Returns
+    -------
+    float
+        Delay drawn uniformly between half and all of `min(cap, base * 2 ** attempt)`.
+
+    """
+    delay = min(cap, base * 2**attempt)
+    return random.uniform(delay / 2, delay)
@@ -0,0 +1,184 @@
+"""Module running seeded Monte Carlo tournaments of the movie game across CPU cores."""
+
+from concurrent.futures import ProcessPoolExecutor
+import os
+
+import numpy as np
+from pydantic import BaseModel, PositiveInt, validate_call
+
+from hollywood_pub_sub.game_resolver import encode_composers, resolve_encoded
+from hollywood_pub_sub.movie_database import MovieDatabase
+
+
+# Encoded database shared by the games of a worker process, set once by _init_worker
+_worker_state: dict = {}
+
+
+class SimulationResult(BaseModel):
+    """
+    Aggregated outcome of a Monte Carlo tournament.
+
+    Attributes
+    ----------
+    n_games : int
+        Number of simulated games.
+    winning_threshold : int
+        Number of movies a composer had to collect to win.
+    max_movies_per_composer : int, optional
+        Maximum number of movies kept per composer, or None if the database was used as is.
+    win_probabilities : dict[str, float]
+        Share of games won by each composer, sorted by decreasing probability then by name.
+    no_winner_probability : float
+        Share of games in which nobody reached the threshold.
+    stopping_times : dict[int, int]
+        Number of games stopped after each number of publications, for games with a winner.
+    mean_stopping_time : float, optional
+        Mean number of publications of games with a winner, or None if there was none.
+
+    """
+
+    n_games: int
+    winning_threshold: int
+    max_movies_per_composer: int | None
+    win_probabilities: dict[str, float]
+    no_winner_probability: float
+    stopping_times: dict[int, int]
+    mean_stopping_time: float | None
+
+
+def cap_movies_per_composer(codes: np.ndarray, max_movies_per_composer: int) -> np.ndarray:
+    """
+    Keep only the first movies of each composer, in database order.
+
+    Parameters
+    ----------
+    codes : np.ndarray
+        Composer id of each movie of the database.
+    max_movies_per_composer : int
+        Maximum number of movies kept per composer.
+
+    Returns
+    -------
+    np.ndarray
+        Composer ids of the kept movies, in database order.
+
+    """
+    ranks = np.empty(codes.size, dtype=np.int64)
+    positions_by_composer = np.argsort(codes, kind="stable")
+    totals = np.bincount(codes)
+    group_starts = np.repeat(np.concatenate(([0], np.cumsum(totals)[:-1])), totals)
+    ranks[positions_by_composer] = np.arange(codes.size) - group_starts
+    return codes[ranks < max_movies_per_composer]
+
+
+def _init_worker(codes: np.ndarray, n_composers: int, winning_threshold: int) -> None:
+    """Store the encoded database once per worker process."""
+    _worker_state.update(codes=codes, n_composers=n_composers, winning_threshold=winning_threshold)
+
+
+def _play_games(entropy: int, start: int, stop: int) -> tuple[np.ndarray, np.ndarray]:
+    """
+    Play games `start` to `stop` of a tournament on the worker's encoded database.
+
+    Each game shuffles with its own seed, spawned from the tournament entropy and the game number.
+
+    Returns
+    -------
+    tuple[np.ndarray, np.ndarray]
+        Winner id and stopping index of each game, both set to -1 for games without winner.
+
+    """
+    codes = _worker_state["codes"]
+    winners = np.full(stop - start, -1, dtype=np.int64)
+    stop_indices = np.full(stop - start, -1, dtype=np.int64)
+    for offset, game in enumerate(range(start, stop)):
+        rng = np.random.default_rng(np.random.SeedSequence(entropy, spawn_key=(game,)))
+        winner, stop_index, _ = resolve_encoded(
+            rng.permutation(codes), _worker_state["winning_threshold"], _worker_state["n_composers"]
+        )
+        if winner is not None:
+            winners[offset] = winner
+            stop_indices[offset] = stop_index
+    return winners, stop_indices
+
+
+@validate_call
+def simulate(
+    movie_db: MovieDatabase,
+    n_games: PositiveInt,
+    winning_threshold: PositiveInt = 3,
+    max_movies_per_composer: PositiveInt | None = None,
+    seed: int | None = None,
+    max_workers: PositiveInt | None = None,
+) -> SimulationResult:
+    """
+    Play many seeded games on a movie database and aggregate their outcomes.
+
+    The database is encoded once as composer ids and handed to each worker
+    process when it starts; every game then shuffles these ids with its own
+    seed and is resolved in closed form, so results do not depend on the
+    number of workers.
+
+    Parameters
+    ----------
+    movie_db : MovieDatabase
+        Movie database the games are played on.
+    n_games : PositiveInt
+        Number of games to play.
+    winning_threshold : PositiveInt
+        Number of movies a composer must collect to win. Defaults to 3.
+    max_movies_per_composer : PositiveInt, optional
+        If provided, only the first movies of each composer are kept before playing.
+    seed : int, optional
+        Seed of the tournament. Defaults to fresh OS entropy.
+    max_workers : PositiveInt, optional
+        Number of worker processes. Defaults to the number of CPU cores; 1 plays in the current process.
+
+    Returns
+    -------
+    SimulationResult
+        Win probabilities and stopping time distribution of the tournament.
+
+    """
+    names, codes = encode_composers(movie_db.movies)
+    if max_movies_per_composer is not None and codes.size:
+        codes = cap_movies_per_composer(codes, max_movies_per_composer)
+
+    entropy = np.random.SeedSequence(seed).entropy
+    max_workers = max_workers or os.cpu_count() or 1
+    if max_workers == 1:
+        _init_worker(codes, len(names), winning_threshold)
+        winners, stop_indices = _play_games(entropy, 0, n_games)
+    else:
+        # A few chunks per worker balance the load while amortizing inter-process transfers
+        chunk_size = -(-n_games // (4 * max_workers))
+        starts = range(0, n_games, chunk_size)
+        with ProcessPoolExecutor(
+            max_workers=max_workers,
+            initializer=_init_worker,
+            initargs=(codes, len(names), winning_threshold),
+        ) as executor:
+            results = list(
+                executor.map(
+                    _play_games,
+                    [entropy] * len(starts),
+                    starts,
+                    [min(start + chunk_size, n_games) for start in starts],
+                )
+            )
+        winners = np.concatenate([chunk_winners for chunk_winners, _ in results])
+        stop_indices = np.concatenate([chunk_stop_indices for _, chunk_stop_indices in results])
+
+    won = winners >= 0
+    wins = np.bincount(winners[won], minlength=len(names))
+    ranking = sorted(np.flatnonzero(wins), key=lambda code: (-wins[code], names[code]))
+    stopping_times, counts = np.unique(stop_indices[won] + 1, return_counts=True)
+    return SimulationResult(
+        n_games=n_games,
+        winning_threshold=winning_threshold,
+        max_movies_per_composer=max_movies_per_composer,
+        win_probabilities={names[code]: wins[code] / n_games for code in ranking},
+        no_winner_probability=float(np.count_nonzero(~won)) / n_games,
+        stopping_times=dict(zip(stopping_times.tolist(), counts.tolist(), strict=True)),
+        mean_stopping_time=float(stopping_times @ counts / counts.sum()) if counts.size else None,
+    )
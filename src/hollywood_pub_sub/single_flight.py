@@ -0,0 +1,73 @@
+"""Module defining SingleFlight, which coalesces concurrent calls made for the same key."""
+
+from collections.abc import Callable, Hashable
+from concurrent.futures import Future
+import threading
+from typing import Any
+
+
+class SingleFlight:
+    """
+    Coalescer of concurrent calls: while a call for a key is in flight, other calls for the key wait for it.
+
+    Every caller gets the result of the single call, or its exception. Once
+    the call is over, the next call for the key runs again, so results are
+    shared but not cached.
+
+    Attributes
+    ----------
+    hits : int
+        Number of calls served by a call already in flight.
+    misses : int
+        Number of calls actually run.
+
+    """
+
+    def __init__(self):
+        """Initialize a coalescer with no call in flight."""
+        self.hits = 0
+        self.misses = 0
+        self._lock = threading.Lock()
+        self._in_flight: dict[Hashable, Future] = {}
+
+    def do(self, key: Hashable, function: Callable[..., Any], *args: Any) -> Any:
+        """
+        Call a function, unless a call for the same key is in flight, in which case wait for its result.
+
+        Parameters
+        ----------
+        key : Hashable
+            Key identifying equivalent calls.
+        function : Callable
+            Function to call.
+        *args : Any
+            Arguments of the function.
+
+        Returns
+        -------
+        Any
+            Result of the function.
+
+        """
+        with self._lock:
+            future = self._in_flight.get(key)
+            leader = future is None
+            if leader:
+                future = self._in_flight[key] = Future()
+                self.misses += 1
+            else:
+                self.hits += 1
+        if not leader:
+            return future.result()
+
+        try:
+            result = function(*args)
+        except BaseException as e:
+            future.set_exception(e)
+            raise
+        else:
+            future.set_result(result)
+            return result
+        finally:
+            with self._lock:
+                del self._in_flight[key]
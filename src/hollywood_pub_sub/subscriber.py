@@ -1,5 +1,7 @@
 """Subscriber module handling the Subscriber class that listens to published movies and tracks wins."""
 
+from collections.abc import Callable
+
 from hollywood_pub_sub.logger import logger
 from hollywood_pub_sub.movie import Movie
 
@@ -18,15 +20,25 @@ class Subscriber:
         Number of movies required to declare this subscriber as winner.
     movies_won : list[Movie]
         List of movies assigned to the composer.
+    on_win : Callable[[Subscriber], None], optional
+        Callback invoked once, with the subscriber itself, after the first movie received at or above
+        the winning threshold.
 
     """
 
-    def __init__(self, name: str, winning_threshold: int):
+    def __init__(
+        self,
+        name: str,
+        winning_threshold: int,
+        on_win: Callable[["Subscriber"], None] | None = None,
+    ):
         """Initialize a Subscriber."""
         self.name = name
         self.movies_count = 0
         self.winning_threshold = winning_threshold
         self.movies_won: list[Movie] = []
+        self.on_win = on_win
+        self._win_signalled = False
 
     def on_movie_published(self, movie: Movie) -> None:
         """
@@ -48,6 +60,34 @@ class Subscriber:
             )
             if self.has_won():
                 self.announce_win()
+                self._signal_win()
+
+    def on_movies_published(self, movies: list[Movie]) -> None:
+        """
+        Invoke callback when a batch of movies is published, logging a single record for the batch.
+
+        Parameters
+        ----------
+        movies : list[Movie]
+            Published movie objects, in publication order.
+
+        """
+        assigned = [movie for movie in movies if movie.composer == self.name]
+        if not assigned:
+            return
+        self.movies_count += len(assigned)
+        self.movies_won.extend(assigned)
+        logger.info(
+            f"✋ Subscriber composer {self.name}:\n"
+            + "\n".join(
+                f"Hi {movie.director}! I will take the assignment for the movie {movie.title} ({movie.year})!"
+                for movie in assigned
+            )
+            + f"\nTotal: {self.movies_count}"
+        )
+        if self.has_won():
+            self.announce_win()
+            self._signal_win()
 
     def has_won(self) -> bool:
         """Return True if movies_count >= winning_threshold, else False."""
@@ -64,3 +104,9 @@ class Subscriber:
             "🎞️  Filmography:\n" + "\n".join(filmography_lines)
         )
         logger.info(filmography_block)
+
+    def _signal_win(self) -> None:
+        """Invoke `on_win` the first time the subscriber has won, even with a threshold already met at creation."""
+        if self.on_win is not None and not self._win_signalled:
+            self._win_signalled = True
+            self.on_win(self)
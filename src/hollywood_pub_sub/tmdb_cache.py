@@ -0,0 +1,198 @@
+"""Module defining ResponseCache, a persistent on-disk cache of TMDb API responses."""
+
+from collections.abc import Callable, Mapping
+import json
+from pathlib import Path
+import sqlite3
+import threading
+import time
+
+
+EXCLUDED_PARAMS = frozenset({"api_key"})
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS responses (
+    key TEXT PRIMARY KEY,
+    body TEXT NOT NULL,
+    size INTEGER NOT NULL,
+    stored_at REAL NOT NULL,
+    accessed_at REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS responses_accessed_at ON responses (accessed_at);
+"""
+
+
+class CacheMissError(LookupError):
+    """Raised when an offline cache does not hold a requested response."""
+
+
+class ResponseCache:
+    """
+    Persistent cache of JSON responses, stored in a SQLite file.
+
+    Responses are keyed by endpoint and query parameters, sorted and without
+    the API key, so the cache can be shared between keys and committed as
+    test fixtures. Entries older than `ttl` are ignored, and the least
+    recently used entries are evicted when the cached bodies exceed
+    `max_bytes`. An `offline` cache never lets requests reach the network:
+    misses raise a CacheMissError.
+
+    Parameters
+    ----------
+    path : Path
+        Path to the SQLite file, created if needed.
+    ttl : float, optional
+        Lifetime of an entry, in seconds. Defaults to no expiry.
+    max_bytes : int, optional
+        Maximum total size of the cached bodies, in bytes. Defaults to no limit.
+    offline : bool
+        Whether requests missing from the cache must fail instead of being sent. Defaults to False.
+    clock : Callable[[], float]
+        Wall clock, in seconds. Defaults to `time.time`.
+
+    Attributes
+    ----------
+    path : Path
+        Path to the SQLite file.
+    ttl : float, optional
+        Lifetime of an entry, in seconds.
+    max_bytes : int, optional
+        Maximum total size of the cached bodies, in bytes.
+    offline : bool
+        Whether requests missing from the cache must fail.
+    hits : int
+        Number of responses served from the cache.
+    misses : int
+        Number of lookups not found or expired.
+
+    """
+
+    def __init__(
+        self,
+        path: Path,
+        ttl: float | None = None,
+        max_bytes: int | None = None,
+        offline: bool = False,
+        clock: Callable[[], float] = time.time,
+    ):
+        """Open the cache file, creating its table if needed."""
+        self.path = Path(path)
+        self.ttl = ttl
+        self.max_bytes = max_bytes
+        self.offline = offline
+        self.hits = 0
+        self.misses = 0
+        self._clock = clock
+        self._lock = threading.Lock()
+        # Shared by the worker threads, which are serialized by the lock
+        self._connection = sqlite3.connect(self.path, check_same_thread=False)
+        self._connection.executescript(SCHEMA)
+
+    @staticmethod
+    def key(endpoint: str, params: Mapping[str, str | int]) -> str:
+        """
+        Return the cache key of a request.
+
+        Parameters
+        ----------
+        endpoint : str
+            API endpoint path (e.g., "/search/person").
+        params : Mapping[str, str | int]
+            Query parameters; the API key is ignored.
+
+        Returns
+        -------
+        str
+            Endpoint followed by its normalized query parameters.
+
+        """
+        normalized = sorted((name, str(value)) for name, value in params.items() if name not in EXCLUDED_PARAMS)
+        return endpoint + "?" + json.dumps(normalized, ensure_ascii=False, separators=(",", ":"))
+
+    def get(self, endpoint: str, params: Mapping[str, str | int]) -> dict | None:
+        """
+        Return a cached response, or None if it is missing or expired.
+
+        Parameters
+        ----------
+        endpoint : str
+            API endpoint path.
+        params : Mapping[str, str | int]
+            Query parameters.
+
+        Returns
+        -------
+        Optional[dict]
+            Cached JSON response.
+
+        """
+        key = self.key(endpoint, params)
+        now = self._clock()
+        with self._lock:
+            row = self._connection.execute("SELECT body, stored_at FROM responses WHERE key = ?", (key,)).fetchone()
+            if row is None or (self.ttl is not None and now - row[1] > self.ttl):
+                self.misses += 1
+                return None
+            with self._connection:
+                self._connection.execute("UPDATE responses SET accessed_at = ? WHERE key = ?", (now, key))
+            self.hits += 1
+        return json.loads(row[0])
+
+    def put(self, endpoint: str, params: Mapping[str, str | int], payload: dict) -> None:
+        """
+        Store a response, evicting the least recently used entries beyond `max_bytes`.
+
+        Parameters
+        ----------
+        endpoint : str
+            API endpoint path.
+        params : Mapping[str, str | int]
+            Query parameters.
+        payload : dict
+            JSON response.
+
+        """
+        body = json.dumps(payload, ensure_ascii=False)
+        now = self._clock()
+        with self._lock, self._connection:
+            self._connection.execute(
+                "INSERT OR REPLACE INTO responses (key, body, size, stored_at, accessed_at) VALUES (?, ?, ?, ?, ?)",
+                (self.key(endpoint, params), body, len(body.encode()), now, now),
+            )
+            if self.max_bytes is not None:
+                self._evict()
+
+    def clear(self) -> None:
+        """Remove every entry."""
+        with self._lock, self._connection:
+            self._connection.execute("DELETE FROM responses")
+
+    def __len__(self) -> int:
+        """Return the number of entries, including expired ones."""
+        with self._lock:
+            (count,) = self._connection.execute("SELECT COUNT(*) FROM responses").fetchone()
+        return count
+
+    @property
+    def size(self) -> int:
+        """Return the total size of the cached bodies, in bytes."""
+        with self._lock:
+            (size,) = self._connection.execute("SELECT COALESCE(SUM(size), 0) FROM responses").fetchone()
+        return size
+
+    def close(self) -> None:
+        """Close the cache file."""
+        self._connection.close()
+
+    def _evict(self) -> None:
+        """Delete the least recently used entries until the bodies fit in `max_bytes`."""
+        (total,) = self._connection.execute("SELECT COALESCE(SUM(size), 0) FROM responses").fetchone()
+        if total <= self.max_bytes:
+            return
+        evicted = []
+        for key, size in self._connection.execute("SELECT key, size FROM responses ORDER BY accessed_at, rowid"):
+            if total <= self.max_bytes:
+                break
+            evicted.append((key,))
+            total -= size
+        self._connection.executemany("DELETE FROM responses WHERE key = ?", evicted)
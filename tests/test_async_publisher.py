@@ -0,0 +1,155 @@
+"""Unit tests for the AsyncPublisher class in hollywood_pub_sub."""
+
+import asyncio
+
+import pytest
+
+from hollywood_pub_sub.async_publisher import AsyncPublisher
+from hollywood_pub_sub.movie import Movie
+
+
+def make_movie(title: str, composer: str = "Hans Zimmer") -> Movie:
+    """Create a Movie instance with the given title and composer."""
+    return Movie(title=title, director="Christopher Nolan", composer=composer, cast=[], year=2010)
+
+
+def test_publish_to_plain_and_coroutine_subscribers():
+    """Test plain and coroutine callbacks both receive the published movies, with keyed routing."""
+    received = []
+
+    async def coroutine_callback(movie: Movie) -> None:
+        await asyncio.sleep(0)
+        received.append(("async", movie.title))
+
+    async def scenario():
+        async with AsyncPublisher(movies=[]) as publisher:
+            publisher.subscribe(lambda movie: received.append(("sync", movie.title)))
+            publisher.subscribe(coroutine_callback, key="Hans Zimmer")
+            await publisher.publish(make_movie("Inception"))
+            await publisher.publish(make_movie("Psycho", composer="Bernard Herrmann"))
+
+    asyncio.run(scenario())
+
+    assert sorted(received) == [("async", "Inception"), ("sync", "Inception"), ("sync", "Psycho")]
+
+
+def test_slow_subscriber_does_not_delay_fast_one():
+    """Test a slow subscriber does not stall publication nor the other subscribers."""
+    fast, slow = [], []
+
+    async def scenario():
+        gate = asyncio.Event()
+
+        async def slow_callback(movie: Movie) -> None:
+            await gate.wait()
+            slow.append(movie.title)
+
+        publisher = AsyncPublisher(movies=[], maxsize=10)
+        publisher.subscribe(slow_callback)
+        publisher.subscribe(lambda movie: fast.append(movie.title))
+        for title in ("A", "B", "C"):
+            await publisher.publish(make_movie(title))
+        await asyncio.sleep(0.01)
+
+        # The fast subscriber got everything while the slow one is still blocked
+        assert fast == ["A", "B", "C"]
+        assert slow == []
+
+        gate.set()
+        await publisher.close()
+
+    asyncio.run(scenario())
+
+    assert slow == ["A", "B", "C"]
+
+
+@pytest.mark.parametrize(
+    "backpressure, expected",
+    [("drop_oldest", ["A", "C", "D"]), ("drop_newest", ["A", "B", "C"])],
+)
+def test_drop_policies(backpressure, expected):
+    """Test drop policies keep the queue bounded and count dropped movies."""
+    received = []
+
+    async def scenario():
+        gate = asyncio.Event()
+
+        async def blocked_callback(movie: Movie) -> None:
+            await gate.wait()
+            received.append(movie.title)
+
+        publisher = AsyncPublisher(movies=[], maxsize=2, backpressure=backpressure)
+        publisher.subscribe(blocked_callback)
+        publisher.publish_nowait(make_movie("A"))
+        await asyncio.sleep(0)  # "A" is taken by the delivery task, which then waits on the gate
+        for title in ("B", "C", "D"):
+            publisher.publish_nowait(make_movie(title))
+
+        assert publisher.dropped == 1
+        gate.set()
+        await publisher.close()
+
+    asyncio.run(scenario())
+
+    assert received == expected
+
+
+def test_block_policy_waits_for_room():
+    """Test the block policy makes publish wait and publish_nowait raise when a queue is full."""
+
+    async def scenario():
+        gate = asyncio.Event()
+
+        async def blocked_callback(movie: Movie) -> None:
+            await gate.wait()
+
+        publisher = AsyncPublisher(movies=[], maxsize=1)
+        publisher.subscribe(blocked_callback)
+        publisher.publish_nowait(make_movie("A"))
+        await asyncio.sleep(0)
+        publisher.publish_nowait(make_movie("B"))
+
+        with pytest.raises(asyncio.QueueFull):
+            publisher.publish_nowait(make_movie("C"))
+
+        pending = asyncio.ensure_future(publisher.publish(make_movie("C")))
+        await asyncio.sleep(0.01)
+        assert not pending.done()
+
+        gate.set()
+        await pending
+        await publisher.close()
+
+    asyncio.run(scenario())
+
+
+def test_failing_callback_is_reported_and_delivery_continues(monkeypatch):
+    """Test an exception in a callback is logged without stopping later deliveries."""
+    import hollywood_pub_sub.async_publisher as async_publisher_module
+
+    warnings, received = [], []
+    monkeypatch.setattr(async_publisher_module.logger, "warning", warnings.append)
+
+    def flaky_callback(movie: Movie) -> None:
+        if movie.title == "A":
+            raise RuntimeError("boom")
+        received.append(movie.title)
+
+    async def scenario():
+        async with AsyncPublisher(movies=[]) as publisher:
+            publisher.subscribe(flaky_callback)
+            await publisher.publish(make_movie("A"))
+            await publisher.publish(make_movie("B"))
+
+    asyncio.run(scenario())
+
+    assert received == ["B"]
+    assert any("boom" in message for message in warnings)
+
+
+def test_invalid_configuration():
+    """Test invalid queue capacity and backpressure policy raise ValueError."""
+    with pytest.raises(ValueError, match="strictly positive"):
+        AsyncPublisher(movies=[], maxsize=0)
+    with pytest.raises(ValueError, match="Unknown backpressure policy"):
+        AsyncPublisher(movies=[], backpressure="drop_all")
@@ -0,0 +1,51 @@
+"""Unit tests for atomic_write."""
+
+import os
+from pathlib import Path
+import stat
+
+import pytest
+
+from hollywood_pub_sub.atomic_file import atomic_write
+
+
+def mode(path: Path) -> int:
+    """Return the permission bits of a file."""
+    return stat.S_IMODE(path.stat().st_mode)
+
+
+@pytest.mark.skipif(os.name != "posix", reason="POSIX permissions")
+def test_new_file_gets_default_permissions(tmp_path: Path) -> None:
+    """Test that a new file is written with the permissions allowed by the umask."""
+    umask = os.umask(0o022)
+    try:
+        path = tmp_path / "new.json"
+        with atomic_write(path) as file:
+            file.write("{}")
+    finally:
+        os.umask(umask)
+    assert path.read_text(encoding="utf-8") == "{}"
+    assert mode(path) == 0o644
+
+
+@pytest.mark.skipif(os.name != "posix", reason="POSIX permissions")
+def test_replaced_file_keeps_its_permissions(tmp_path: Path) -> None:
+    """Test that a replaced file keeps its permissions."""
+    path = tmp_path / "existing.json"
+    path.write_text("old", encoding="utf-8")
+    path.chmod(0o640)
+    with atomic_write(path) as file:
+        file.write("new")
+    assert path.read_text(encoding="utf-8") == "new"
+    assert mode(path) == 0o640
+
+
+def test_failed_write_leaves_file_untouched(tmp_path: Path) -> None:
+    """Test that an exception while writing keeps the previous content and removes the temporary file."""
+    path = tmp_path / "existing.json"
+    path.write_text("old", encoding="utf-8")
+    with pytest.raises(RuntimeError), atomic_write(path) as file:
+        file.write("partial")
+        raise RuntimeError("interrupted")
+    assert path.read_text(encoding="utf-8") == "old"
+    assert list(tmp_path.iterdir()) == [path]
@@ -0,0 +1,48 @@
+"""Unit tests for the BuildJournal checkpoint journal."""
+
+from pathlib import Path
+
+import pytest
+
+from hollywood_pub_sub.build_journal import BuildJournal
+
+
+PARAMETERS = {"max_movies_per_composer": 5}
+
+
+def test_records_are_reloaded(tmp_path: Path) -> None:
+    """Test that journaled credits and movies are available when reopening the journal."""
+    journal = BuildJournal(tmp_path / "build.jsonl", PARAMETERS)
+    journal.record_credits("Composer", [1, 2])
+    journal.record_credits("Unknown", None)
+    journal.record_movie(1, {"title": "Movie", "director": "Director", "cast": [], "year": 2000})
+    journal.close()
+
+    journal = BuildJournal(tmp_path / "build.jsonl", PARAMETERS)
+    assert journal.credits == {"Composer": [1, 2], "Unknown": None}
+    assert journal.movies == {1: {"title": "Movie", "director": "Director", "cast": [], "year": 2000}}
+    journal.discard()
+    assert not (tmp_path / "build.jsonl").exists()
+
+
+def test_truncated_last_record_is_ignored(tmp_path: Path) -> None:
+    """Test that a record cut by a crash is dropped, and that later records are appended after it."""
+    path = tmp_path / "build.jsonl"
+    journal = BuildJournal(path, PARAMETERS)
+    journal.record_credits("Composer", [1])
+    journal.close()
+    with path.open("a", encoding="utf-8") as file:
+        file.write('{"kind": "movie", "id": 1, "fie')
+
+    journal = BuildJournal(path, PARAMETERS)
+    assert journal.movies == {}
+    journal.record_movie(1, {"title": "Movie"})
+    journal.close()
+    assert BuildJournal(path, PARAMETERS).movies == {1: {"title": "Movie"}}
+
+
+def test_other_parameters_are_rejected(tmp_path: Path) -> None:
+    """Test that a journal cannot be resumed with other build parameters."""
+    BuildJournal(tmp_path / "build.jsonl", PARAMETERS).close()
+    with pytest.raises(ValueError):
+        BuildJournal(tmp_path / "build.jsonl", {"max_movies_per_composer": 10})
@@ -0,0 +1,100 @@
+"""Tests for the clocks pacing movie publications."""
+
+import pytest
+
+import hollywood_pub_sub.clock as clock_module
+from hollywood_pub_sub.clock import RateClock, RealTimeClock, VirtualClock, clock_factory
+
+
+class FakeTime:
+    """Fake monotonic time advanced only by sleep calls."""
+
+    def __init__(self):
+        """Start the fake time at an arbitrary origin."""
+        self.current = 100.0
+        self.sleeps: list[float] = []
+
+    def monotonic(self) -> float:
+        """Return the fake current time."""
+        return self.current
+
+    def sleep(self, seconds: float) -> None:
+        """Record the pause and advance the fake time."""
+        self.sleeps.append(seconds)
+        self.current += seconds
+
+
+@pytest.fixture
+def fake_time(monkeypatch) -> FakeTime:
+    """Replace the time module used by the clocks with a FakeTime."""
+    fake = FakeTime()
+    monkeypatch.setattr(clock_module, "time", fake)
+    return fake
+
+
+def test_virtual_clock_advances_without_sleeping(fake_time):
+    """Test the virtual clock keeps logical timestamps and never sleeps."""
+    clock = VirtualClock(interval=0.5)
+    assert [clock.tick() for _ in range(3)] == [0.5, 1.0, 1.5]
+    assert clock.now() == 1.5
+    assert fake_time.sleeps == []
+
+
+def test_real_time_clock_sleeps_fixed_interval(fake_time):
+    """Test the real-time clock pauses a fixed interval after each publication."""
+    clock = RealTimeClock(interval=0.5)
+    fake_time.current += 0.2  # time spent publishing
+    assert clock.tick() == pytest.approx(0.7)
+    assert fake_time.sleeps == [0.5]
+
+
+def test_rate_clock_catches_up_on_slow_publications(fake_time):
+    """Test the rate clock only sleeps until the next scheduled publication."""
+    clock = RateClock(rate=4)
+    fake_time.current += 0.1
+    assert clock.tick() == 0.25
+    assert fake_time.sleeps == [pytest.approx(0.15)]
+
+    # A publication slower than the period is not followed by any pause
+    fake_time.current += 0.4
+    assert clock.tick() == 0.5
+    assert fake_time.sleeps == [pytest.approx(0.15)]
+
+
+def test_rate_clock_start_resets_schedule(fake_time):
+    """Test that starting a rate clock after a slow setup paces publications from the start."""
+    clock = RateClock(rate=4)
+    fake_time.current += 10.0  # database loading
+    clock.start()
+    assert clock.now() == 0.0
+    assert clock.tick() == 0.25
+    assert fake_time.sleeps == [pytest.approx(0.25)]
+
+
+def test_clocks_restart_from_zero(fake_time):
+    """Test that starting the real-time and virtual clocks restarts their timestamps."""
+    real_time = RealTimeClock(interval=0.5)
+    virtual = VirtualClock(interval=0.5)
+    fake_time.current += 3.0
+    virtual.tick()
+    real_time.start()
+    virtual.start()
+    assert real_time.now() == 0.0
+    assert virtual.now() == 0.0
+
+
+@pytest.mark.parametrize(
+    "mode, expected_type",
+    [("realtime", RealTimeClock), ("rate", RateClock), ("virtual", VirtualClock)],
+)
+def test_clock_factory_modes(mode, expected_type):
+    """Test clock_factory builds the clock matching each mode."""
+    assert isinstance(clock_factory(mode=mode, rate=2.0), expected_type)
+
+
+def test_clock_factory_rejects_invalid_arguments():
+    """Test clock_factory raises ValueError for unknown modes and non-positive rates."""
+    with pytest.raises(ValueError, match="Unknown clock mode"):
+        clock_factory(mode="warp")
+    with pytest.raises(ValueError, match="strictly positive"):
+        clock_factory(mode="rate", rate=0)
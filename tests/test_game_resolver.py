@@ -0,0 +1,111 @@
+"""Tests for the closed-form game resolver."""
+
+import random
+
+import pytest
+
+from hollywood_pub_sub.game_resolver import resolve_game
+import hollywood_pub_sub.logger as logger_module
+from hollywood_pub_sub.movie import Movie
+from hollywood_pub_sub.publisher import Publisher
+from hollywood_pub_sub.subscriber import Subscriber
+
+
+def make_movie(title: str, composer: str) -> Movie:
+    """Create a Movie instance for the given composer."""
+    return Movie(title=title, director="Director", composer=composer, cast=[], year=2000)
+
+
+def play_with_publisher(movies: list[Movie], threshold: int) -> tuple[str | None, int | None, dict[str, int]]:
+    """Play the game by publishing movies to subscribers of the non-empty composers, as run_game does."""
+    winners: list[Subscriber] = []
+    publisher = Publisher(movies=movies)
+    subscribers = [
+        Subscriber(name=composer, winning_threshold=threshold, on_win=winners.append)
+        for composer in sorted({movie.composer for movie in movies if movie.composer})
+    ]
+    for subscriber in subscribers:
+        publisher.subscribe(subscriber.on_movie_published, key=subscriber.name)
+
+    for index, movie in enumerate(movies):
+        publisher.publish(movie)
+        if winners:
+            return winners[0].name, index, {s.name: s.movies_count for s in subscribers}
+    return None, None, {s.name: s.movies_count for s in subscribers}
+
+
+def test_resolve_game_simple_order():
+    """Test the winner is the composer whose k-th movie comes first."""
+    order = ["A", "B", "B", "A", "C", "A", "B"]
+    result = resolve_game(order, threshold=2)
+    assert result.winner == "B"
+    assert result.stop_index == 2
+    assert result.standings == {"B": 2, "A": 1, "C": 0}
+
+
+def test_resolve_game_without_winner():
+    """Test no winner is reported when nobody reaches the threshold."""
+    result = resolve_game(["A", "B", "A"], threshold=3)
+    assert result.winner is None
+    assert result.stop_index is None
+    assert result.standings == {"A": 2, "B": 1}
+
+
+def test_resolve_game_empty_order():
+    """Test an empty publication order has no winner."""
+    result = resolve_game([], threshold=1)
+    assert result.winner is None
+    assert result.standings == {}
+
+
+def test_resolve_game_ignores_empty_composers():
+    """Test movies without composer name count for nobody, as they have no subscriber in the game."""
+    result = resolve_game(["", "", "A", "A"], threshold=2)
+    assert result.winner == "A"
+    assert result.stop_index == 3
+    assert result.standings == {"A": 2}
+    assert resolve_game(["", ""], threshold=1).winner is None
+
+
+def test_resolve_game_rejects_invalid_threshold():
+    """Test a threshold below 1 raises a ValueError."""
+    with pytest.raises(ValueError, match="at least 1"):
+        resolve_game(["A"], threshold=0)
+
+
+@pytest.mark.parametrize("seed", range(20))
+@pytest.mark.parametrize("threshold", [1, 3, 5])
+def test_resolve_game_matches_publisher_path(monkeypatch, seed, threshold):
+    """Test the resolver gives the same outcome as publishing the movies to subscribers."""
+    monkeypatch.setattr(logger_module.logger, "disabled", True)
+    rng = random.Random(seed)
+    # Movies without composer name reach no subscriber
+    composers = ["", *(f"Composer {idx}" for idx in range(8))]
+    movies = [make_movie(f"Movie {idx}", rng.choice(composers)) for idx in range(30)]
+
+    winner, stop_index, counts = play_with_publisher(movies, threshold)
+    result = resolve_game(movies, threshold)
+
+    assert result.winner == winner
+    assert result.stop_index == stop_index
+    assert result.standings == counts
+
+
+def test_resolve_game_long_order_matches_reference():
+    """Test the resolver on an order longer than its first scanned prefix."""
+    rng = random.Random(0)
+    order = [f"Composer {rng.randrange(500)}" for _ in range(50_000)]
+    threshold = 60
+
+    counts: dict[str, int] = {}
+    expected_winner, expected_stop = None, None
+    for index, composer in enumerate(order):
+        counts[composer] = counts.get(composer, 0) + 1
+        if counts[composer] == threshold:
+            expected_winner, expected_stop = composer, index
+            break
+
+    result = resolve_game(order, threshold)
+    assert result.winner == expected_winner
+    assert result.stop_index == expected_stop
+    assert result.stop_index > 4096
@@ -1,5 +1,6 @@
 """Tests for the main module of hollywood_pub_sub."""
 
+from functools import partial
 from pathlib import Path
 import sys
 import types
@@ -7,7 +8,12 @@ from unittest.mock import MagicMock
 
 import pytest
 
+from hollywood_pub_sub.clock import VirtualClock
 import hollywood_pub_sub.main as main
+from hollywood_pub_sub.movie import Movie
+from hollywood_pub_sub.movie_database_from_binary import MovieDatabaseFromBinary
+from hollywood_pub_sub.movie_database_from_json import MovieDatabaseFromJSON
+from tests.tmdb_stub import TMDbStubServer
 
 
 @pytest.fixture
@@ -44,7 +50,7 @@ def fake_movie_db(fake_movies):
     """Provide a MagicMock simulating the movie database with movies and composers."""
     db = MagicMock()
     db.movies = fake_movies
-    db.composers = ["Composer1", "Composer2"]
+    db.aggregates.return_value.composers = ["Composer1", "Composer2"]
     return db
 
 
@@ -75,19 +81,17 @@ def test_run_game_runs_with_json(monkeypatch, fake_movie_db):
     fake_subscriber.has_won.return_value = False
     fake_subscriber.movies_count = 0
     # We will have one subscriber per composer
-    monkeypatch.setattr(main, "Subscriber", lambda name, winning_threshold: fake_subscriber)
+    monkeypatch.setattr(main, "Subscriber", lambda name, winning_threshold, on_win=None: fake_subscriber)
 
     # Patch logger to suppress output
     monkeypatch.setattr(main.logger, "info", MagicMock())
 
-    # Patch time.sleep to skip delay
-    monkeypatch.setattr(main.time, "sleep", lambda x: None)
-
     main.run_game(
         json_path=Path("fake.json"),
         api_key=None,
         max_movies_per_composer=2,
         winning_threshold=1,
+        clock=VirtualClock(),
     )
 
     # Assert publisher published all movies
@@ -96,6 +100,32 @@ def test_run_game_runs_with_json(monkeypatch, fake_movie_db):
     # Assert subscribers subscribed
     fake_publisher.subscribe.assert_called()  # subscribed at least once
 
+    # Assert the database was closed after the game
+    fake_movie_db.close.assert_called_once()
+
+
+def test_run_game_stops_at_first_winner(monkeypatch, fake_movie_db):
+    """Test run_game stops publishing as soon as a subscriber signals its win."""
+    monkeypatch.setattr(main, "movie_database_factory", lambda **kwargs: fake_movie_db)
+    monkeypatch.setattr(main.random, "shuffle", lambda movies: None)
+    monkeypatch.setattr(main.logger, "info", MagicMock())
+
+    published = []
+    original_publish = main.Publisher.publish
+
+    def spy_publish(self, movie):
+        published.append(movie.title)
+        original_publish(self, movie)
+
+    monkeypatch.setattr(main.Publisher, "publish", spy_publish)
+
+    main.run_game(json_path=Path("fake.json"), api_key=None, winning_threshold=1, clock=VirtualClock(interval=2.0))
+
+    # Composer1 wins with the very first movie, nothing else gets published
+    assert published == ["Movie1"]
+    main.logger.info.assert_any_call("🏆 Winner is subscriber composer Composer1 with 1 movies!")
+    main.logger.info.assert_any_call("⏱️ Game over at t=2.00s")
+
 
 def test_print_composers(monkeypatch):
     """Test print_composers outputs all composers."""
@@ -125,6 +155,102 @@ def test_main_run_command(monkeypatch):
     main.run_game.assert_called_once()
     args = main.run_game.call_args[1]
     assert args["api_key"] == "abc123"
+    assert isinstance(args["clock"], main.RealTimeClock)
+
+
+def test_main_run_command_virtual_clock(monkeypatch):
+    """Test the 'run' command builds the clock requested on the command line."""
+    monkeypatch.setattr(sys, "argv", ["prog", "run", "--api_key", "abc123", "--clock", "virtual", "--rate", "4"])
+    monkeypatch.setattr(main, "run_game", MagicMock())
+
+    main.main()
+
+    clock = main.run_game.call_args[1]["clock"]
+    assert isinstance(clock, VirtualClock)
+    assert clock.interval == 0.25
+
+
+@pytest.mark.parametrize(
+    "extra_args",
+    [
+        ["--api_key", "abc123", "--stream_window", "0"],
+        ["--api_key", "abc123", "--stream_window", "many"],
+        ["--json_path", "movies.json", "--stream_window", "4"],
+        ["--api_key", "abc123", "--winning_threshold", "0"],
+        ["--api_key", "abc123", "--winning_threshold", "-2"],
+    ],
+)
+def test_main_run_command_rejects_invalid_options(monkeypatch, extra_args):
+    """Test the 'run' command rejects stream windows and thresholds that are not positive or do not apply."""
+    monkeypatch.setattr(sys, "argv", ["prog", "run", *extra_args])
+    monkeypatch.setattr(main, "run_game", MagicMock())
+
+    with pytest.raises(SystemExit):
+        main.main()
+
+    main.run_game.assert_not_called()
+
+
+@pytest.mark.parametrize("rate", ["0", "-1", "fast"])
+def test_main_run_command_rejects_invalid_rate(monkeypatch, rate):
+    """Test the 'run' command rejects rates that are not strictly positive numbers."""
+    monkeypatch.setattr(sys, "argv", ["prog", "run", "--api_key", "abc123", "--rate", rate])
+    monkeypatch.setattr(main, "run_game", MagicMock())
+
+    with pytest.raises(SystemExit):
+        main.main()
+
+    main.run_game.assert_not_called()
+
+
+def test_main_simulate_command(monkeypatch):
+    """Test the main 'simulate' command parses args and calls run_simulation."""
+    monkeypatch.setattr(sys, "argv", ["prog", "simulate", "--api_key", "abc123", "--n_games", "50", "--seed", "1"])
+    monkeypatch.setattr(main, "run_simulation", MagicMock())
+
+    main.main()
+
+    main.run_simulation.assert_called_once()
+    args = main.run_simulation.call_args[1]
+    assert args["api_key"] == "abc123"
+    assert args["n_games"] == 50
+    assert args["seed"] == 1
+
+
+def test_main_simulate_command_rejects_invalid_threshold(monkeypatch):
+    """Test the 'simulate' command rejects a winning threshold that is not strictly positive."""
+    monkeypatch.setattr(sys, "argv", ["prog", "simulate", "--api_key", "abc123", "--winning_threshold", "0"])
+    monkeypatch.setattr(main, "run_simulation", MagicMock())
+
+    with pytest.raises(SystemExit):
+        main.main()
+
+    main.run_simulation.assert_not_called()
+
+
+def test_run_simulation_logs_probabilities(monkeypatch, fake_movies):
+    """Test run_simulation logs the win probabilities of the composers."""
+    movie_db = MovieDatabaseFromJSON([Movie(**vars(movie)) for movie in fake_movies])
+    monkeypatch.setattr(main, "movie_database_factory", lambda **kwargs: movie_db)
+    monkeypatch.setattr(main.logger, "info", MagicMock())
+
+    main.run_simulation(n_games=20, json_path=Path("fake.json"), api_key=None, winning_threshold=2, seed=0, workers=1)
+
+    logged = "\n".join(call.args[0] for call in main.logger.info.call_args_list)
+    assert "Composer1: 100.00%" in logged
+
+
+def test_run_simulation_closes_database(monkeypatch, fake_movies, tmp_path):
+    """Test run_simulation releases the resource held by the database once the games are simulated."""
+    path = tmp_path / "movies.bin"
+    MovieDatabaseFromJSON([Movie(**vars(movie)) for movie in fake_movies]).to_binary(path)
+    movie_db = MovieDatabaseFromBinary.from_binary(path)
+    monkeypatch.setattr(main, "movie_database_factory", lambda **kwargs: movie_db)
+    monkeypatch.setattr(main.logger, "info", MagicMock())
+
+    main.run_simulation(n_games=5, json_path=path, api_key=None, winning_threshold=2, seed=0, workers=1)
+
+    assert movie_db._source.closed
 
 
 def test_main_db_command(monkeypatch):
@@ -186,3 +312,23 @@ def test_validated_path_handling(monkeypatch, json_path_arg, expected_valid):
         with pytest.raises(SystemExit):
             main.main()
         mock_logger_error.assert_called()
+
+
+def test_run_game_streams_from_api(monkeypatch):
+    """Test run_game publishes movies fetched from the API while the fetching continues."""
+    movies = [
+        Movie(title=f"Movie{idx}", director="Dir", composer=f"Composer{idx % 2}", cast=[], year=2000)
+        for idx in range(6)
+    ]
+    monkeypatch.setattr(main.logger, "info", MagicMock())
+    with TMDbStubServer.from_movies(movies) as server:
+        monkeypatch.setattr(
+            main,
+            "MovieDatabaseFromAPI",
+            partial(main.MovieDatabaseFromAPI, composers=["Composer0", "Composer1"], BASE_URL=server.url),
+        )
+        main.run_game(api_key="fake-api-key", winning_threshold=3, clock=VirtualClock(), stream_window=2)
+
+    # Each composer has 3 of the 6 movies, so someone wins at the 5th or 6th publication
+    messages = [call.args[0] for call in main.logger.info.call_args_list]
+    assert any(message.startswith("🏆 Winner is subscriber composer Composer") for message in messages)
@@ -69,3 +69,33 @@ def test_movie_year_must_be_int_or_none():
             cast=["Actor 1"],
             year="Not a year",  # invalid type
         )
+
+
+def test_movie_ignores_environment(monkeypatch):
+    """Test that Movie fields are not read from environment variables."""
+    monkeypatch.setenv("TITLE", "From Env")
+    with pytest.raises(ValidationError):
+        Movie(director="Director", composer="Composer", cast=[], year=2000)
+
+
+def test_movie_validate_many():
+    """Test bulk validation of movies, including the extra fields check."""
+    data = [
+        {"title": f"Movie {idx}", "director": "Director", "composer": "Composer", "cast": ["Actor"], "year": 2000}
+        for idx in range(3)
+    ]
+    movies = Movie.validate_many(data)
+    assert movies == [Movie(**fields) for fields in data]
+    assert Movie.validate_many(iter(data)) == movies
+
+    data[1]["budget"] = 1
+    with pytest.raises(ValidationError):
+        Movie.validate_many(data)
+
+
+def test_movie_is_frozen():
+    """Test that movies cannot be modified, so that databases can cache indexes of their fields."""
+    movie = Movie(title="Jaws", director="Steven Spielberg", composer="John Williams", cast=[], year=1975)
+    with pytest.raises(ValidationError):
+        movie.composer = "Bernard Herrmann"
+    assert movie.model_copy(update={"composer": "Bernard Herrmann"}).composer == "Bernard Herrmann"
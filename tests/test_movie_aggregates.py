@@ -0,0 +1,64 @@
+"""Tests for MovieAggregates."""
+
+import numpy as np
+
+from hollywood_pub_sub.movie import Movie
+from hollywood_pub_sub.movie_aggregates import MovieAggregates
+
+
+def make_movie(title: str, director: str, composer: str, year: int) -> Movie:
+    """Build a movie with an empty cast."""
+    return Movie(title=title, director=director, composer=composer, cast=[], year=year)
+
+
+def test_counts_and_sorted_names():
+    """Test counts per composer, director and year, and the sorted name lists."""
+    movies = [
+        make_movie("Jaws", "Steven Spielberg", "John Williams", 1975),
+        make_movie("Star Wars", "George Lucas", "John Williams", 1977),
+        make_movie("Alien", "Ridley Scott", "Jerry Goldsmith", 1979),
+        make_movie("Close Encounters", "Steven Spielberg", "John Williams", 1977),
+    ]
+    aggregates = MovieAggregates(movies)
+    assert aggregates.composers == ["Jerry Goldsmith", "John Williams"]
+    assert aggregates.directors == ["George Lucas", "Ridley Scott", "Steven Spielberg"]
+    assert aggregates.composer_counts == {"John Williams": 3, "Jerry Goldsmith": 1}
+    assert aggregates.director_counts["Steven Spielberg"] == 2
+    assert aggregates.year_histogram == {1975: 1, 1977: 2, 1979: 1}
+    assert list(aggregates.year_histogram) == [1975, 1977, 1979]
+
+
+def test_incremental_updates():
+    """Test that adding and removing movies matches aggregating from scratch."""
+    jaws = make_movie("Jaws", "Steven Spielberg", "John Williams", 1975)
+    alien = make_movie("Alien", "Ridley Scott", "Jerry Goldsmith", 1979)
+    vertigo = make_movie("Vertigo", "Alfred Hitchcock", "Bernard Herrmann", 1958)
+    aggregates = MovieAggregates([jaws, alien])
+    assert aggregates.composers == ["Jerry Goldsmith", "John Williams"]
+
+    aggregates.update(added=[vertigo], removed=[alien])
+    expected = MovieAggregates([jaws, vertigo])
+    assert aggregates.composers == expected.composers == ["Bernard Herrmann", "John Williams"]
+    assert aggregates.directors == expected.directors
+    assert aggregates.composer_counts == expected.composer_counts
+    assert aggregates.director_counts == expected.director_counts
+    assert aggregates.year_histogram == expected.year_histogram
+
+
+def test_empty_names_are_not_listed():
+    """Test that empty composer names are counted but not listed, as before."""
+    aggregates = MovieAggregates([make_movie("Untitled", "Someone", "", 2000)])
+    assert aggregates.composers == []
+    assert aggregates.composer_counts[""] == 1
+
+
+def test_from_columns():
+    """Test aggregating integer-coded columns."""
+    names = ["John Williams", "Steven Spielberg", "George Lucas"]
+    aggregates = MovieAggregates.from_columns(
+        names.__getitem__, composers=np.array([0, 0]), directors=np.array([1, 2]), years=np.array([1975, 1977])
+    )
+    assert aggregates.composers == ["John Williams"]
+    assert aggregates.directors == ["George Lucas", "Steven Spielberg"]
+    assert aggregates.composer_counts == {"John Williams": 2}
+    assert aggregates.year_histogram == {1975: 1, 1977: 1}
@@ -1,13 +1,19 @@
 """Tests for the MovieDatabase class and its filtering and JSON export functionality."""
 
+import copy
 import json
 from pathlib import Path
+import pickle
+import random
 import tempfile
 
 import pytest
 
 from hollywood_pub_sub.movie import Movie
+from hollywood_pub_sub.movie_aggregates import MovieAggregates
 from hollywood_pub_sub.movie_database import MovieDatabase
+from hollywood_pub_sub.movie_database_from_json import MovieDatabaseFromJSON
+from hollywood_pub_sub.movie_list import MovieList
 
 
 # Concrete subclass for testing - not named Test* to avoid pytest collection
@@ -15,9 +21,9 @@ class ConcreteMovieDatabase(MovieDatabase):
     """Concrete subclass of MovieDatabase for testing purposes."""
 
     def __init__(self, movies):
-        """Initialize with a list of movies."""
+        """Initialize with movies, wrapping a plain list in a MovieList."""
         super().__init__()
-        self._movies = movies
+        self._movies = MovieList(movies) if type(movies) is list else movies
 
     @property
     def movies(self):
@@ -121,6 +127,96 @@ def test_filter_no_match(movie_db):
     assert filtered == []
 
 
+def reference_filter(movies, title=None, director=None, composer=None, year=None, cast=None):
+    """Filter movies with a linear scan, as a reference for the indexed filter."""
+    cast_filter = [cast] if isinstance(cast, str) else cast
+    return [
+        movie
+        for movie in movies
+        if not (title and movie.title != title)
+        and not (director and movie.director != director)
+        and not (composer and movie.composer != composer)
+        and not (year and movie.year != year)
+        and not (cast_filter and not all(actor in movie.cast for actor in cast_filter))
+    ]
+
+
+def test_filter_matches_linear_scan():
+    """Test the indexed filter returns exactly the movies, in order, of a linear scan."""
+    rng = random.Random(0)
+    actors = [f"Actor {idx}" for idx in range(15)]
+    movies = [
+        Movie(
+            title=f"Title {rng.randrange(40)}",
+            director=f"Director {rng.randrange(8)}",
+            composer=f"Composer {rng.randrange(6)}",
+            cast=rng.sample(actors, 3),
+            year=rng.randrange(1990, 2000),
+        )
+        for _ in range(200)
+    ]
+    db = ConcreteMovieDatabase(movies=movies)
+
+    for _ in range(200):
+        criteria = {
+            "title": rng.choice([None, f"Title {rng.randrange(40)}"]),
+            "director": rng.choice([None, f"Director {rng.randrange(9)}"]),
+            "composer": rng.choice([None, f"Composer {rng.randrange(7)}"]),
+            "year": rng.choice([None, 0, rng.randrange(1990, 2001)]),
+            "cast": rng.choice([None, [], rng.choice(actors), rng.sample(actors, 2)]),
+        }
+        assert db.filter(**criteria) == reference_filter(movies, **criteria)
+
+
+def test_filter_without_criteria_returns_all(movie_db):
+    """Test filtering without criteria returns a copy of all movies."""
+    filtered = movie_db.filter()
+    assert filtered == movie_db.movies
+    assert filtered is not movie_db.movies
+
+
+def test_plain_list_is_wrapped_in_movie_list(movie_db, sample_movies):
+    """Test a plain movie list is wrapped at construction, so that its modifications are tracked."""
+    assert isinstance(movie_db.movies, MovieList)
+    assert [m.year for m in movie_db.filter(director="Christopher Nolan")] == [2010, 2014, 2008]
+
+    movie_db.movies.reverse()
+    assert [m.year for m in movie_db.filter(director="Christopher Nolan")] == [2008, 2014, 2010]
+
+    movie_db.movies.append(
+        Movie(title="Tenet", director="Christopher Nolan", composer="Ludwig Göransson", cast=[], year=2020)
+    )
+    assert len(movie_db.filter(director="Christopher Nolan")) == 4
+
+
+def test_untracked_sequence_is_not_snapshotted(sample_movies):
+    """Test indexes and aggregates of a sequence without version are reused, and follow its replacement."""
+    db = ConcreteMovieDatabase(movies=tuple(sample_movies))
+    index, aggregates = db.movie_index(), db.aggregates()
+    assert db.movie_index() is index
+    assert db.aggregates() is aggregates
+    assert db._movie_index_key == db._aggregates_key == (None, len(sample_movies))
+
+    db._movies = tuple(sample_movies[:2])
+    assert db.filter(composer="Hans Zimmer") == sample_movies[:2]
+    assert db.aggregates().composer_counts == {"Hans Zimmer": 2}
+
+
+def test_filter_index_follows_movie_list_changes(sample_movies):
+    """Test indexes are rebuilt from the MovieList version, and reused while it is unchanged."""
+    movies = MovieList(sample_movies)
+    db = ConcreteMovieDatabase(movies=movies)
+    index = db.movie_index()
+    assert db.movie_index() is index
+
+    random.Random(1).shuffle(movies)
+    assert db.movie_index() is not index
+    assert db.filter(composer="Hans Zimmer") == [m for m in movies if m.composer == "Hans Zimmer"]
+
+    del movies[0]
+    assert db.filter(composer="Hans Zimmer") == [m for m in movies if m.composer == "Hans Zimmer"]
+
+
 def test_to_json_returns_string(movie_db):
     """Test to_json method returns JSON string when no path is given."""
     json_str = movie_db.to_json()
@@ -143,3 +239,123 @@ def test_to_json_writes_to_file(movie_db):
         assert isinstance(data, list)
         assert len(data) == len(movie_db.movies)
         assert data[0]["title"] == movie_db.movies[0].title
+
+
+@pytest.mark.parametrize("indent", [0, 2, 4])
+@pytest.mark.parametrize("batch_size", [1, 2, 1000])
+def test_iter_json_chunks_matches_json_dumps(sample_movies, indent, batch_size):
+    """Test that the streamed chunks concatenate to the same document as json.dumps, non-ASCII included."""
+    movies = [*sample_movies, Movie(title="Amélie", director="Jeunet", composer="Tiersen", cast=[], year=2001)]
+    db = ConcreteMovieDatabase(movies)
+    expected = json.dumps([movie.model_dump() for movie in movies], indent=indent, ensure_ascii=False)
+    chunks = list(db.iter_json_chunks(indent=indent, batch_size=batch_size))
+    assert "".join(chunks) == expected
+    assert len(chunks) == -(-len(movies) // batch_size) + 1
+
+
+def test_iter_json_chunks_empty():
+    """Test that an empty database exports an empty JSON array."""
+    assert "".join(ConcreteMovieDatabase([]).iter_json_chunks()) == json.dumps([], indent=4)
+
+
+def test_to_json_atomic(movie_db, tmp_path):
+    """Test that an atomic export replaces the target file and leaves no temporary file."""
+    path = tmp_path / "movies.json"
+    path.write_text("previous export", encoding="utf-8")
+    assert movie_db.to_json(path=path, atomic=True) is None
+    assert path.read_text(encoding="utf-8") == movie_db.to_json()
+    assert [p.name for p in tmp_path.iterdir()] == ["movies.json"]
+
+
+def test_to_json_atomic_failure_keeps_previous_file(tmp_path):
+    """Test that a failing atomic export leaves the previous file untouched."""
+    path = tmp_path / "movies.json"
+    path.write_text("previous export", encoding="utf-8")
+    db = ConcreteMovieDatabase([object()])  # Not a movie: serialization fails midway
+    with pytest.raises(AttributeError):
+        db.to_json(path=path, atomic=True)
+    assert path.read_text(encoding="utf-8") == "previous export"
+    assert [p.name for p in tmp_path.iterdir()] == ["movies.json"]
+
+
+def assert_aggregates_match(db):
+    """Check that the cached aggregates of a database match aggregates computed from scratch."""
+    expected = MovieAggregates(db.movies)
+    aggregates = db.aggregates()
+    assert aggregates.composers == expected.composers
+    assert aggregates.directors == expected.directors
+    assert aggregates.composer_counts == expected.composer_counts
+    assert aggregates.director_counts == expected.director_counts
+    assert aggregates.year_histogram == expected.year_histogram
+
+
+def test_aggregates_are_updated_incrementally(sample_movies):
+    """Test that aggregates follow every kind of MovieList modification without being rebuilt."""
+    movies = MovieList(sample_movies[:2])
+    db = ConcreteMovieDatabase(movies=movies)
+    aggregates = db.aggregates()
+
+    modifications = [
+        lambda: movies.append(sample_movies[3]),
+        lambda: movies.extend(sample_movies[4:]),
+        lambda: movies.insert(0, sample_movies[2]),
+        lambda: movies.__setitem__(1, sample_movies[3]),
+        lambda: movies.__setitem__(slice(0, 2), sample_movies[:1]),
+        lambda: movies.__delitem__(0),
+        lambda: movies.pop(),
+        lambda: movies.remove(movies[0]),
+        lambda: movies.__iadd__(sample_movies),
+        lambda: movies.__imul__(2),
+        lambda: random.Random(0).shuffle(movies),
+        lambda: movies.sort(key=lambda movie: movie.year),
+        lambda: movies.clear(),
+    ]
+    for modify in modifications:
+        modify()
+        assert db.aggregates() is aggregates
+        assert_aggregates_match(db)
+
+
+def test_aggregates_of_untracked_list_are_recomputed(sample_movies):
+    """Test that aggregates of a list without version are recomputed when the list is resized."""
+
+    class UntrackedList(list):
+        """List subclass, so that the database does not wrap it in a MovieList."""
+
+    movies = UntrackedList(sample_movies)
+    db = ConcreteMovieDatabase(movies=movies)
+    aggregates = db.aggregates()
+    assert db.aggregates() is aggregates
+
+    movies.pop()
+    assert db.aggregates() is not aggregates
+    assert_aggregates_match(db)
+
+
+def test_aggregates_follow_replaced_movie_list(sample_movies):
+    """Test that replacing the movie list detaches the aggregates from the former list."""
+    former = MovieList(sample_movies)
+    db = ConcreteMovieDatabase(movies=former)
+    aggregates = db.aggregates()
+
+    db._movies = MovieList(sample_movies[:1])
+    assert_aggregates_match(db)
+    former.clear()
+    assert aggregates.composer_counts == MovieAggregates(sample_movies).composer_counts
+    assert_aggregates_match(db)
+
+
+@pytest.mark.parametrize("database_class", [ConcreteMovieDatabase, MovieDatabaseFromJSON])
+@pytest.mark.parametrize(
+    "copy_database",
+    [copy.deepcopy, lambda db: db.model_copy(deep=True), lambda db: pickle.loads(pickle.dumps(db))],
+)
+def test_aggregates_of_copied_database_follow_its_movies(sample_movies, database_class, copy_database):
+    """Test that a copied database, whose movie list lost the observers, re-aggregates its modified movies."""
+    db = database_class(sample_movies)
+    db.aggregates()
+    copied = copy_database(db)
+    copied.movies.clear()
+    assert copied.aggregates().composers == []
+    assert_aggregates_match(copied)
+    assert_aggregates_match(db)
@@ -1,12 +1,15 @@
 """Tests for the movie_database_factory module."""
 
 from pathlib import Path
+import sqlite3
 from unittest.mock import patch
 
 import pytest
 
 from hollywood_pub_sub.movie_database_factory import movie_database_factory
+from hollywood_pub_sub.movie_database_from_binary import MovieDatabaseFromBinary
 from hollywood_pub_sub.movie_database_from_json import MovieDatabaseFromJSON
+from hollywood_pub_sub.movie_database_from_sqlite import MovieDatabaseFromSQLite
 
 
 @pytest.fixture
@@ -51,3 +54,38 @@ def test_factory_raises_without_json_or_api_key():
     """Test that factory raises ValueError if neither json_path nor api_key is provided."""
     with pytest.raises(ValueError, match="You must provide either a JSON path or a TMDb API key."):
         movie_database_factory(max_movies_per_composer=5)
+
+
+def test_factory_loads_from_binary(movie_database_json_path, tmp_path):
+    """Test factory returns MovieDatabaseFromBinary instance when the path has the .bin extension."""
+    binary_path = tmp_path / "movie_database.bin"
+    MovieDatabaseFromJSON.from_json(movie_database_json_path).to_binary(binary_path)
+    db = movie_database_factory(max_movies_per_composer=5, json_path=binary_path)
+    assert isinstance(db, MovieDatabaseFromBinary)
+    assert len(db.movies) > 0
+
+
+def test_factory_loads_from_sqlite(movie_database_json_path, tmp_path):
+    """Test factory returns MovieDatabaseFromSQLite instance when the path has the .sqlite extension."""
+    sqlite_path = tmp_path / "movie_database.sqlite"
+    MovieDatabaseFromJSON.from_json(movie_database_json_path).to_sqlite(sqlite_path)
+    db = movie_database_factory(max_movies_per_composer=5, json_path=sqlite_path)
+    assert isinstance(db, MovieDatabaseFromSQLite)
+    assert len(db.movies) > 0
+
+
+def test_factory_rejects_other_sqlite_files(tmp_path):
+    """Test factory refuses a SQLite file that is not a movie database, without adding tables to it."""
+    sqlite_path = tmp_path / "other.sqlite"
+    connection = sqlite3.connect(sqlite_path)
+    connection.execute("CREATE TABLE notes (text TEXT)")
+    connection.commit()
+    connection.close()
+
+    with pytest.raises(ValueError, match="not a movie database"):
+        movie_database_factory(max_movies_per_composer=5, json_path=sqlite_path)
+
+    connection = sqlite3.connect(sqlite_path)
+    tables = [name for (name,) in connection.execute("SELECT name FROM sqlite_master WHERE type = 'table'")]
+    connection.close()
+    assert tables == ["notes"]
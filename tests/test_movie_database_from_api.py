@@ -1,10 +1,19 @@
 """Unit tests for the MovieDatabaseFromAPI class in hollywood_pub_sub."""
 
+from concurrent.futures import ThreadPoolExecutor
+from datetime import UTC, date, datetime, timedelta
+from pathlib import Path
 from unittest.mock import MagicMock, patch
 
 import pytest
+import requests
 
-from hollywood_pub_sub.movie_database_from_api import MovieDatabaseFromAPI
+from hollywood_pub_sub.movie import Movie
+from hollywood_pub_sub.movie_database_from_api import MovieDatabaseFromAPI, _UpdatePlan
+from hollywood_pub_sub.movie_database_from_json import MovieDatabaseFromJSON
+from hollywood_pub_sub.person_id_table import PersonIdTable
+from hollywood_pub_sub.tmdb_cache import CacheMissError, ResponseCache
+from tests.tmdb_stub import TMDbStubServer
 
 
 @pytest.fixture
@@ -93,8 +102,8 @@ def test_build_populates_movies(
             {"id": 20, "job": "Composer", "title": "Fake Movie 2"},
         ]
     }
-    mock_get_movie_details.side_effect = [
-        {
+    movie_details = {
+        10: {
             "title": "Fake Movie 1",
             "release_date": "2005-01-01",
             "credits": {
@@ -102,7 +111,7 @@ def test_build_populates_movies(
                 "crew": [{"job": "Director", "name": "Director 1"}],
             },
         },
-        {
+        20: {
             "title": "Fake Movie 2",
             "release_date": "2007-02-02",
             "credits": {
@@ -110,7 +119,9 @@ def test_build_populates_movies(
                 "crew": [{"job": "Director", "name": "Director 2"}],
             },
         },
-    ]
+    }
+    # Details are fetched concurrently, so they are looked up by movie id rather than by call order
+    mock_get_movie_details.side_effect = movie_details.__getitem__
 
     # Instantiate after mocks are set to intercept _build calls inside __init__
     db = MovieDatabaseFromAPI(api_key=fake_api_key, max_movies_per_composer=2, composers=["Fake Composer"])
@@ -120,3 +131,418 @@ def test_build_populates_movies(
     assert db.movies[0].title == "Fake Movie 1"
     assert db.movies[1].composer == "Fake Composer"
     assert db.movies[1].title == "Fake Movie 2"
+
+
+def test_tmdb_get_uses_injected_session(fake_api_key: str) -> None:
+    """Test that requests go through the injected session, with the API key and timeout, without mutating params."""
+    session = MagicMock(spec=requests.Session)
+    session.get.return_value.json.return_value = {"results": []}
+    db = MovieDatabaseFromAPI(
+        api_key=fake_api_key, max_movies_per_composer=1, composers=["Hans Zimmer"], session=session, timeout=5
+    )
+    params = {"query": "Hans Zimmer"}
+    assert db.tmdb_get("/search/person", params) == {"results": []}
+    assert params == {"query": "Hans Zimmer"}
+    session.get.assert_called_with(
+        f"{db.BASE_URL}/search/person", params={"query": "Hans Zimmer", "api_key": fake_api_key}, timeout=5
+    )
+    db.close()
+    session.close.assert_not_called()
+
+
+@patch("hollywood_pub_sub.movie_database_from_api.MovieDatabaseFromAPI.tmdb_get")
+def test_default_session_is_pooled(mock_tmdb_get: MagicMock, fake_api_key: str) -> None:
+    """Test that the default session keeps a pool of the configured size."""
+    mock_tmdb_get.return_value = {}
+    db = MovieDatabaseFromAPI(api_key=fake_api_key, max_movies_per_composer=1, composers=["Hans Zimmer"], pool_size=20)
+    adapter = db.session.get_adapter(db.BASE_URL)
+    assert adapter._pool_maxsize == 20
+    assert db.session.headers["Connection"] == "keep-alive"
+    db.close()
+
+
+@pytest.fixture
+def fixture_movies() -> list[Movie]:
+    """Load the movies of the JSON fixture."""
+    path = Path("tests/fixtures/movie_database.json")
+    if not path.is_file():
+        pytest.skip(f"Fixture file not found: {path}")
+    return MovieDatabaseFromJSON.from_json(path).movies
+
+
+@pytest.mark.parametrize("max_workers", [1, 8])
+def test_build_from_stub_server_is_ordered(fixture_movies: list[Movie], max_workers: int) -> None:
+    """Test that a concurrent build returns the movies in composer then credit order, whatever the concurrency."""
+    composers = sorted({movie.composer for movie in fixture_movies}, reverse=True)
+    with TMDbStubServer.from_movies(fixture_movies, latency=0.01) as server:
+        db = MovieDatabaseFromAPI(
+            api_key="fake-api-key",
+            max_movies_per_composer=10,
+            composers=[*composers, "Unknown Composer"],
+            max_workers=max_workers,
+            rate_limit=1000,
+            BASE_URL=server.url,
+        )
+        db.close()
+    expected = [movie for composer in composers for movie in fixture_movies if movie.composer == composer]
+    assert db.movies == expected
+
+
+def test_build_fetches_shared_movies_once(fixture_movies: list[Movie]) -> None:
+    """Test that a movie credited to two composers is fetched once and kept for the first composer."""
+    first = fixture_movies[0]
+    second = next(movie for movie in fixture_movies if movie.composer != first.composer)
+    server = TMDbStubServer.from_movies([first, second])
+    # Also credit the first movie to the second composer, before their own movie
+    server.people[2]["crew"].insert(0, {"id": 1, "title": first.title, "job": "Music"})
+    with server:
+        db = MovieDatabaseFromAPI(
+            api_key="fake-api-key",
+            max_movies_per_composer=10,
+            composers=[first.composer, second.composer],
+            rate_limit=1000,
+            BASE_URL=server.url,
+        )
+        db.close()
+    assert db.movies == [first, second]
+    assert server.request_counts["movie"] == 2
+
+
+@pytest.fixture
+def stub_server() -> TMDbStubServer:
+    """Run a stand-in server holding a single movie."""
+    movie = Movie(title="Movie", director="Director", composer="Composer", cast=["Actor"], year=2000)
+    with TMDbStubServer.from_movies([movie]) as server:
+        yield server
+
+
+def test_tmdb_get_retries_throttled_requests(stub_server: TMDbStubServer, fake_api_key: str) -> None:
+    """Test that 429 responses are retried after Retry-After, slowing down and counted by the rate limiter."""
+    db = MovieDatabaseFromAPI(
+        api_key=fake_api_key, max_movies_per_composer=1, composers=["Nobody"], BASE_URL=stub_server.url
+    )
+    stub_server.fail_next(2, status=429, retry_after="0")
+    assert db.get_movie_details(1)["title"] == "Movie"
+    assert db.rate_limiter.throttled == 2
+    assert db.rate_limiter.retried == 2
+    assert db.rate_limiter.rate < db.rate_limit
+    db.close()
+
+
+def test_tmdb_get_retries_server_errors_with_backoff(stub_server: TMDbStubServer, fake_api_key: str) -> None:
+    """Test that server errors without Retry-After are retried with backoff, without throttling."""
+    db = MovieDatabaseFromAPI(
+        api_key=fake_api_key, max_movies_per_composer=1, composers=["Nobody"], backoff=0.01, BASE_URL=stub_server.url
+    )
+    stub_server.fail_next(1, status=500)
+    assert db.get_movie_details(1)["title"] == "Movie"
+    assert db.rate_limiter.throttled == 0
+    assert db.rate_limiter.retried == 1
+    db.close()
+
+
+def test_tmdb_get_gives_up_after_max_retries(stub_server: TMDbStubServer, fake_api_key: str) -> None:
+    """Test that a request still throttled after all retries raises an HTTPError."""
+    db = MovieDatabaseFromAPI(
+        api_key=fake_api_key, max_movies_per_composer=1, composers=["Nobody"], max_retries=2, BASE_URL=stub_server.url
+    )
+    stub_server.fail_next(3, status=503, retry_after="0")
+    with pytest.raises(requests.HTTPError):
+        db.get_movie_details(1)
+    assert db.rate_limiter.retried == 2
+    db.close()
+
+
+def test_tmdb_get_does_not_retry_client_errors(stub_server: TMDbStubServer, fake_api_key: str) -> None:
+    """Test that client errors such as 404 are raised without retrying."""
+    db = MovieDatabaseFromAPI(
+        api_key=fake_api_key, max_movies_per_composer=1, composers=["Nobody"], BASE_URL=stub_server.url
+    )
+    with pytest.raises(requests.HTTPError):
+        db.get_movie_details(404)
+    assert db.rate_limiter.retried == 0
+    db.close()
+
+
+def test_warm_cache_rebuild_is_offline(fixture_movies: list[Movie], tmp_path: Path) -> None:
+    """Test that a rebuild from a warm cache makes no request, and that offline misses fail."""
+    composers = sorted({movie.composer for movie in fixture_movies})
+    cache = ResponseCache(tmp_path / "tmdb_cache.sqlite")
+    with TMDbStubServer.from_movies(fixture_movies) as server:
+        cold_db = MovieDatabaseFromAPI(
+            api_key="fake-api-key", max_movies_per_composer=10, composers=composers, cache=cache, BASE_URL=server.url
+        )
+        cold_db.close()
+        requests_sent = server.request_counts.total()
+    cache.close()
+
+    offline_cache = ResponseCache(tmp_path / "tmdb_cache.sqlite", offline=True)
+    warm_db = MovieDatabaseFromAPI(
+        api_key="other-api-key",
+        max_movies_per_composer=10,
+        composers=composers,
+        cache=offline_cache,
+        BASE_URL="http://127.0.0.1:9",
+    )
+    assert warm_db.movies == cold_db.movies
+    assert offline_cache.hits == requests_sent
+    with pytest.raises(CacheMissError):
+        warm_db.search_person("Unknown Composer")
+    warm_db.close()
+    offline_cache.close()
+
+
+def test_interrupted_build_resumes_from_journal(fixture_movies: list[Movie], tmp_path: Path) -> None:
+    """Test that a build interrupted midway is resumed from its journal without fetching finished work again."""
+    composers = sorted({movie.composer for movie in fixture_movies})
+    journal_path = tmp_path / "build.jsonl"
+    get_movie_details = MovieDatabaseFromAPI.get_movie_details
+    calls = []
+
+    def interrupted_get_movie_details(self: MovieDatabaseFromAPI, movie_id: int) -> dict:
+        calls.append(movie_id)
+        if len(calls) > 3:
+            raise KeyboardInterrupt
+        return get_movie_details(self, movie_id)
+
+    parameters = {"api_key": "fake-api-key", "max_movies_per_composer": 10, "composers": composers, "max_workers": 1}
+    with TMDbStubServer.from_movies(fixture_movies) as server:
+        with (
+            patch.object(MovieDatabaseFromAPI, "get_movie_details", interrupted_get_movie_details),
+            pytest.raises(KeyboardInterrupt),
+        ):
+            MovieDatabaseFromAPI(**parameters, journal_path=journal_path, BASE_URL=server.url)
+        assert journal_path.exists()
+        server.request_counts.clear()
+
+        db = MovieDatabaseFromAPI(**parameters, journal_path=journal_path, BASE_URL=server.url)
+        db.close()
+
+    # Composers are fetched a few ahead of their movies, so only the first ones were journaled
+    assert server.request_counts["movie"] == len(fixture_movies) - 3
+    assert server.request_counts["search"] < len(composers)
+    assert db.movies == [movie for composer in composers for movie in fixture_movies if movie.composer == composer]
+    assert not journal_path.exists()
+
+
+def test_streamed_build_yields_before_fetching_ends(fixture_movies: list[Movie]) -> None:
+    """Test that streaming yields the first movie long before the build ends, and that closing stops fetching."""
+    composers = sorted({movie.composer for movie in fixture_movies})
+    with TMDbStubServer.from_movies(fixture_movies, latency=0.05) as server:
+        db = MovieDatabaseFromAPI(
+            api_key="fake-api-key",
+            max_movies_per_composer=10,
+            composers=composers,
+            max_workers=1,
+            streaming=True,
+            BASE_URL=server.url,
+        )
+        assert db.movies == []
+        assert server.request_counts.total() == 0
+
+        with db.stream(maxsize=2) as stream:
+            first = next(stream)
+        db.close()
+        # Search, credits and details of the first movie, plus the few requests already queued when closing
+        assert server.request_counts.total() < len(fixture_movies)
+
+    assert first == next(movie for movie in fixture_movies if movie.composer == composers[0])
+    assert db.movies == []
+
+
+def test_person_id_table_skips_searches(fixture_movies: list[Movie], tmp_path: Path) -> None:
+    """Test that composers resolved by a previous build, or overridden, are not searched again."""
+    composers = sorted({movie.composer for movie in fixture_movies})
+    path = tmp_path / "person_ids.json"
+    with TMDbStubServer.from_movies(fixture_movies) as server:
+        parameters = {"api_key": "fake-api-key", "max_movies_per_composer": 10, "BASE_URL": server.url}
+        first_db = MovieDatabaseFromAPI(**parameters, composers=composers, person_ids=PersonIdTable(path))
+        assert server.request_counts["search"] == len(composers)
+        server.request_counts.clear()
+
+        # The override sends the unknown composer to the first person of the stand-in server
+        person_ids = PersonIdTable(path, overrides={"Unknown Composer": 1})
+        second_db = MovieDatabaseFromAPI(
+            **parameters, composers=[*composers, "Unknown Composer"], person_ids=person_ids
+        )
+        assert server.request_counts["search"] == 0
+        first_db.close()
+        second_db.close()
+
+    first_composer_movies = [movie for movie in first_db.movies if movie.composer == server.people[1]["name"]]
+    assert second_db.movies == first_db.movies
+    assert first_composer_movies
+
+
+def test_concurrent_detail_requests_are_coalesced(stub_server: TMDbStubServer, fake_api_key: str) -> None:
+    """Test that concurrent requests for the same movie details send a single HTTP request."""
+    db = MovieDatabaseFromAPI(
+        api_key=fake_api_key, max_movies_per_composer=1, composers=["Nobody"], BASE_URL=stub_server.url
+    )
+    stub_server.latency = 0.2
+    with ThreadPoolExecutor(max_workers=8) as executor:
+        results = list(executor.map(db.get_movie_details, [1] * 8))
+    db.close()
+
+    assert all(result == results[0] for result in results)
+    assert stub_server.request_counts["movie"] == 1
+    assert (db.single_flight.hits, db.single_flight.misses) == (7, 1)
+
+
+SYNCED_AT = datetime(2026, 10, 16, 12, tzinfo=UTC)
+
+
+@pytest.fixture
+def update_movies() -> list[Movie]:
+    """Provide two movies of a first composer and one of a second composer."""
+    return [
+        Movie(title="First", director="Director", composer="Composer A", cast=["Actor"], year=2000),
+        Movie(title="Second", director="Director", composer="Composer A", cast=["Actor"], year=2001),
+        Movie(title="Third", director="Director", composer="Composer B", cast=["Actor"], year=2002),
+    ]
+
+
+def test_update_refetches_changed_ids_only(update_movies: list[Movie]) -> None:
+    """Test that an update replaces changed movies and reconciles changed composers, fetching only their ids."""
+    with TMDbStubServer.from_movies(update_movies) as server:
+        db = MovieDatabaseFromAPI(
+            api_key="fake-api-key",
+            max_movies_per_composer=10,
+            composers=["Composer A", "Composer B"],
+            rate_limit=1000,
+            BASE_URL=server.url,
+        )
+        # The second movie gets another director, and the second composer scores a new movie instead of theirs
+        server.movies[2]["credits"]["crew"][0]["name"] = "New Director"
+        new_movie = Movie(title="Fourth", director="Director", composer="Composer B", cast=["Actor"], year=2003)
+        server.movies[4] = TMDbStubServer.from_movies([new_movie]).movies[1] | {"id": 4}
+        server.people[2]["crew"] = [{"id": 4, "title": "Fourth", "job": "Original Music Composer"}]
+        server.record_change("movie", 2, date(2026, 10, 16))
+        server.record_change("person", 2, date(2026, 10, 16))
+        server.record_change("movie", 99, date(2026, 10, 16))
+        server.request_counts.clear()
+        db.aggregates()
+
+        report = db.update(since=SYNCED_AT - timedelta(days=1), until=SYNCED_AT)
+        db.close()
+
+    assert db.movies == [
+        update_movies[0],
+        update_movies[1].model_copy(update={"director": "New Director"}),
+        new_movie,
+    ]
+    assert report.model_dump() == {
+        "synced_at": SYNCED_AT,
+        "changed_people": 1,
+        "changed_movies": 1,
+        "updated": 1,
+        "added": 1,
+        "removed": 1,
+    }
+    assert server.request_counts == {"changes": 2, "search": 2, "credits": 2, "movie": 2}
+    assert db.aggregates().year_counts == {2000: 1, 2001: 1, 2003: 1}
+
+
+def test_update_patches_another_database_from_cache(update_movies: list[Movie], tmp_path: Path) -> None:
+    """Test that an update without changes serves the unchanged credits from the cache and keeps the database."""
+    database = MovieDatabaseFromJSON(list(update_movies))
+    cache = ResponseCache(tmp_path / "tmdb_cache.sqlite")
+    with TMDbStubServer.from_movies(update_movies) as server:
+        api = MovieDatabaseFromAPI(
+            api_key="fake-api-key",
+            max_movies_per_composer=10,
+            composers=["Composer A", "Composer B"],
+            rate_limit=1000,
+            cache=cache,
+            streaming=True,
+            BASE_URL=server.url,
+        )
+        api.update(since=SYNCED_AT - timedelta(days=1), database=database, until=SYNCED_AT)
+        server.request_counts.clear()
+        # A period of 30 days is read through three windows of at most 14 days
+        report = api.update(since=SYNCED_AT - timedelta(days=30), database=database, until=SYNCED_AT)
+        api.close()
+
+    assert database.movies == update_movies
+    assert api.movies == []
+    assert (report.updated, report.added, report.removed) == (0, 0, 0)
+    assert server.request_counts == {"changes": 6}
+
+
+def test_get_changes_reads_every_page(stub_server: TMDbStubServer, fake_api_key: str) -> None:
+    """Test that the change feed is read page by page."""
+    for movie_id in range(1, 151):
+        stub_server.record_change("movie", movie_id, date(2026, 10, 15))
+    stub_server.record_change("movie", 151, date(2026, 9, 1))
+    db = MovieDatabaseFromAPI(
+        api_key=fake_api_key, max_movies_per_composer=1, composers=["Nobody"], BASE_URL=stub_server.url
+    )
+    assert db.get_changes("movie", SYNCED_AT - timedelta(days=1), SYNCED_AT) == set(range(1, 151))
+    assert db.get_changes("person", SYNCED_AT - timedelta(days=1), SYNCED_AT) == set()
+    db.close()
+    assert stub_server.request_counts["changes"] == 3
+
+
+def test_offline_cache_cannot_refresh(tmp_path: Path, fake_api_key: str) -> None:
+    """Test that refreshing a response through an offline cache fails, even if the response is cached."""
+    cache = ResponseCache(tmp_path / "tmdb_cache.sqlite", offline=True)
+    cache.put("/movie/1", {"append_to_response": "credits"}, {"title": "Movie"})
+    db = MovieDatabaseFromAPI(
+        api_key=fake_api_key, max_movies_per_composer=1, composers=["Nobody"], cache=cache, streaming=True
+    )
+    assert db.get_movie_details(1) == {"title": "Movie"}
+    with pytest.raises(CacheMissError, match="Cannot refresh"):
+        db.get_movie_details(1, refresh=True)
+
+
+def test_update_follows_title_changes_with_cached_credits(update_movies: list[Movie], tmp_path: Path) -> None:
+    """Test that successive title changes are applied although the cached credits keep the first title."""
+    cache = ResponseCache(tmp_path / "tmdb_cache.sqlite")
+    with TMDbStubServer.from_movies(update_movies) as server:
+        db = MovieDatabaseFromAPI(
+            api_key="fake-api-key",
+            max_movies_per_composer=10,
+            composers=["Composer A", "Composer B"],
+            rate_limit=1000,
+            cache=cache,
+            BASE_URL=server.url,
+        )
+        for day, title in ((date(2026, 10, 15), "Renamed"), (date(2026, 10, 16), "Renamed Again")):
+            server.movies[3]["title"] = title
+            server.people[2]["crew"][0]["title"] = title
+            server.record_change("movie", 3, day)
+            db.update(since=datetime.combine(day, datetime.min.time(), UTC), until=SYNCED_AT)
+        db.close()
+
+    assert [movie.title for movie in db.movies] == ["First", "Second", "Renamed Again"]
+
+
+def test_update_plan_matches_renamed_movie_among_same_titles() -> None:
+    """Test that a renamed movie replaces the same-title movie whose director and year match, not the first one."""
+    movies = [
+        Movie(title="T", director="D1", composer="C", cast=[], year=2000),
+        Movie(title="T", director="D2", composer="C", cast=[], year=2001),
+    ]
+    plan = _UpdatePlan(movies, changed_movies={2})
+    plan.add_credits("C", [{"id": 2, "title": "Cached Title"}], changed=False)
+    renamed = {"title": "T renamed", "director": "D2", "cast": [], "year": 2001}
+
+    assert plan.apply(movies, {2: renamed}) == (1, 0)
+    assert movies == [
+        Movie(title="T", director="D1", composer="C", cast=[], year=2000),
+        Movie(title="T renamed", director="D2", composer="C", cast=[], year=2001),
+    ]
+
+
+def test_update_plan_leaves_ambiguous_renamed_movie_unmatched() -> None:
+    """Test that a renamed movie matching the director and year of several movies is not applied."""
+    movies = [Movie(title=title, director="D", composer="C", cast=[], year=2000) for title in ("T", "U")]
+    plan = _UpdatePlan(list(movies), changed_movies={2})
+    assert plan.match(Movie(title="V", director="D", composer="C", cast=[], year=2000)) is None
+
+
+def test_update_rejects_naive_datetimes(fake_api_key: str) -> None:
+    """Test that an update refuses naive datetimes, which cannot be compared with the current time."""
+    db = MovieDatabaseFromAPI(api_key=fake_api_key, max_movies_per_composer=1, composers=["Nobody"], streaming=True)
+    with pytest.raises(ValueError, match="timezone-aware"):
+        db.update(since=datetime(2026, 10, 15))
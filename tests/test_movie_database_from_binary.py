@@ -0,0 +1,124 @@
+"""Test module for the binary movie database format and MovieDatabaseFromBinary."""
+
+from pathlib import Path
+import random
+
+import pytest
+
+from hollywood_pub_sub.movie import Movie
+from hollywood_pub_sub.movie_database_from_binary import MovieDatabaseFromBinary
+from hollywood_pub_sub.movie_database_from_json import MovieDatabaseFromJSON
+
+
+@pytest.fixture
+def json_db() -> MovieDatabaseFromJSON:
+    """Load the movie database JSON fixture."""
+    path = Path("tests/fixtures/movie_database.json")
+    if not path.is_file():
+        pytest.skip(f"Fixture file not found: {path}")
+    return MovieDatabaseFromJSON.from_json(path)
+
+
+@pytest.fixture
+def binary_path(json_db, tmp_path) -> Path:
+    """Write the JSON fixture movies to a binary file."""
+    path = tmp_path / "movie_database.bin"
+    json_db.to_binary(path)
+    return path
+
+
+def test_round_trip(json_db, binary_path):
+    """Movies read from the binary file equal the movies written."""
+    binary_db = MovieDatabaseFromBinary.from_binary(binary_path)
+    assert len(binary_db.movies) == len(json_db.movies)
+    assert list(binary_db.movies) == json_db.movies
+    assert binary_db.composers == json_db.composers
+    assert binary_db.to_json() == json_db.to_json()
+
+
+def test_movies_are_built_lazily_and_cached(binary_path):
+    """A movie is only built on first access, and the same instance is returned afterwards."""
+    binary_db = MovieDatabaseFromBinary.from_binary(binary_path)
+    movie = binary_db.movies[3]
+    assert isinstance(movie, Movie)
+    assert binary_db.movies[3] is movie
+    assert sum(isinstance(slot, Movie) for slot in binary_db.movies._slots) == 1
+
+
+def test_movies_can_be_shuffled_and_filtered(json_db, binary_path):
+    """The lazy list supports in-place shuffling, and filtering follows its modifications."""
+    binary_db = MovieDatabaseFromBinary.from_binary(binary_path)
+    assert binary_db.filter(composer="John Williams") == json_db.filter(composer="John Williams")
+
+    random.Random(0).shuffle(binary_db.movies)
+    expected = [movie for movie in binary_db.movies if movie.composer == "John Williams"]
+    assert binary_db.filter(composer="John Williams") == expected
+
+
+def test_filter_on_records_builds_only_matches(json_db, binary_path):
+    """Filtering the unmodified list matches the JSON database and only builds the matching movies."""
+    binary_db = MovieDatabaseFromBinary.from_binary(binary_path)
+    sample = json_db.movies[4]
+    criteria = [
+        {"composer": sample.composer},
+        {"director": sample.director, "year": sample.year},
+        {"title": sample.title},
+        {"cast": sample.cast[:2]},
+        {"composer": sample.composer, "cast": sample.cast[0]},
+        {"composer": "Nobody", "year": 0},
+        {"title": "Not a title"},
+    ]
+    for kwargs in criteria:
+        assert binary_db.filter(**kwargs) == json_db.filter(**kwargs)
+    built = sum(isinstance(slot, Movie) for slot in binary_db.movies._slots)
+    assert built == len({id(movie) for kwargs in criteria for movie in binary_db.filter(**kwargs)})
+    assert built < len(binary_db.movies)
+    assert binary_db._movie_index is None
+
+    binary_db.close()
+    with pytest.raises(ValueError):
+        binary_db.filter(composer=sample.composer)
+
+
+def test_empty_database(tmp_path):
+    """An empty database round-trips."""
+    path = tmp_path / "empty.bin"
+    MovieDatabaseFromJSON([]).to_binary(path)
+    binary_db = MovieDatabaseFromBinary.from_binary(path)
+    assert len(binary_db.movies) == 0
+    assert binary_db.composers == []
+
+
+@pytest.mark.parametrize("content", [b"", b"not a movie database at all, really not", None])
+def test_invalid_file(binary_path, content):
+    """Files that are not complete binary movie databases raise a ValueError."""
+    if content is None:
+        # Truncated file
+        content = binary_path.read_bytes()[:-1]
+    binary_path.write_bytes(content)
+    with pytest.raises(ValueError):
+        MovieDatabaseFromBinary.from_binary(binary_path)
+
+
+def test_aggregates(json_db, binary_path):
+    """Aggregates computed on the records match the movies, and follow modifications of the list."""
+    binary_db = MovieDatabaseFromBinary.from_binary(binary_path)
+    assert binary_db.aggregates().composer_counts == json_db.aggregates().composer_counts
+    assert binary_db.aggregates().year_histogram == json_db.aggregates().year_histogram
+    assert all(isinstance(slot, int) for slot in binary_db.movies._slots)
+
+    removed = binary_db.movies.pop(0)
+    json_db.movies.remove(removed)
+    assert binary_db.aggregates().director_counts == json_db.aggregates().director_counts
+
+
+def test_close(json_db, binary_path):
+    """Closing the database releases the map; built movies stay accessible, others raise a ValueError."""
+    with MovieDatabaseFromBinary.from_binary(binary_path) as binary_db:
+        first = binary_db.movies[0]
+        binary_db.aggregates()
+    assert binary_db._source.closed
+    assert binary_db.movies[0] == first == json_db.movies[0]
+    with pytest.raises(ValueError):
+        binary_db.movies[1]
+    binary_db.close()
@@ -4,7 +4,8 @@ from pathlib import Path
 
 import pytest
 
-from hollywood_pub_sub.movie_database_from_json import MovieDatabaseFromJSON
+from hollywood_pub_sub.movie_database_from_json import MovieDatabaseFromJSON, MovieRecordError
+from hollywood_pub_sub.movie_list import MovieList
 
 
 @pytest.fixture
@@ -118,3 +119,74 @@ def test_composers_property_consistency(movie_db):
     all_composers = set(m.composer for m in movie_db.movies)
     composers_property = set(movie_db.composers)
     assert all_composers == composers_property
+
+
+@pytest.mark.parametrize("chunk_size", [1, 7, 65536])
+def test_iter_json_matches_from_json(movie_db, movie_db_json_path, chunk_size):
+    """Streaming the fixture yields the same movies as loading it whole, whatever the chunk size."""
+    assert list(MovieDatabaseFromJSON.iter_json(movie_db_json_path, chunk_size=chunk_size)) == movie_db.movies
+    streamed_db = MovieDatabaseFromJSON.from_json_stream(movie_db_json_path, chunk_size=chunk_size)
+    assert streamed_db.movies == movie_db.movies
+    assert isinstance(streamed_db.movies, MovieList)
+
+
+def test_iter_json_empty_array(tmp_path):
+    """An empty array yields no movies."""
+    path = tmp_path / "empty.json"
+    path.write_text(" [ ] ")
+    assert list(MovieDatabaseFromJSON.iter_json(path)) == []
+
+
+def test_iter_json_reports_offset_of_invalid_record(tmp_path):
+    """The error of an invalid record gives its index and byte offset, after the valid ones were yielded."""
+    valid = (
+        '{"title": "Amélie", "director": "Jean-Pierre Jeunet", "composer": "Yann Tiersen", "cast": [], "year": 2001}'
+    )
+    invalid = '{"title": "Bad", "director": "D", "composer": "C", "cast": [], "year": 2001, "budget": 1}'
+    content = f"[\n  {valid},\n  {invalid}\n]"
+    path = tmp_path / "movies.json"
+    path.write_text(content, encoding="utf-8")
+
+    movies = MovieDatabaseFromJSON.iter_json(path, chunk_size=5)
+    assert next(movies).title == "Amélie"
+    with pytest.raises(MovieRecordError) as excinfo:
+        next(movies)
+    assert excinfo.value.index == 1
+    assert excinfo.value.offset == content.encode("utf-8").index(invalid.encode("utf-8"))
+
+
+@pytest.mark.parametrize(
+    "content",
+    ['{"title": "Not an array"}', '[{"title": "Truncated"', '[{"title": "A"} {"title": "B"}]', "[1, 2,"],
+)
+def test_iter_json_malformed(tmp_path, content):
+    """Malformed files raise a MovieRecordError."""
+    path = tmp_path / "movies.json"
+    path.write_text(content)
+    with pytest.raises(MovieRecordError):
+        list(MovieDatabaseFromJSON.iter_json(path))
+
+
+@pytest.mark.parametrize("chunk_size", [3, 1 << 16])
+@pytest.mark.parametrize("array", ["[]", None])
+def test_iter_json_rejects_trailing_data(tmp_path, movie_db, chunk_size, array):
+    """Data after the closing bracket raises a MovieRecordError at its offset, as from_json rejects it."""
+    if array is None:
+        array = movie_db.to_json()
+    content = f"{array} \n xyz"
+    path = tmp_path / "movies.json"
+    path.write_text(content, encoding="utf-8")
+
+    with pytest.raises(ValueError):
+        MovieDatabaseFromJSON.from_json(path)
+    with pytest.raises(MovieRecordError, match="after the JSON array") as excinfo:
+        list(MovieDatabaseFromJSON.iter_json(path, chunk_size=chunk_size))
+    assert excinfo.value.offset == content.encode("utf-8").index(b"xyz")
+    assert excinfo.value.index == (0 if array == "[]" else len(movie_db.movies))
+
+
+def test_iter_json_accepts_trailing_whitespace(tmp_path):
+    """Whitespace after the closing bracket is allowed."""
+    path = tmp_path / "movies.json"
+    path.write_text("[]\n\n  \t")
+    assert list(MovieDatabaseFromJSON.iter_json(path, chunk_size=1)) == []
@@ -0,0 +1,108 @@
+"""Test module for the SQLite movie database and MovieDatabaseFromSQLite."""
+
+from pathlib import Path
+
+import pytest
+
+from hollywood_pub_sub.movie import Movie
+from hollywood_pub_sub.movie_database_from_json import MovieDatabaseFromJSON
+from hollywood_pub_sub.movie_database_from_sqlite import MovieDatabaseFromSQLite
+
+
+@pytest.fixture
+def json_path() -> Path:
+    """Return path to JSON fixture or skip test if not found."""
+    path = Path("tests/fixtures/movie_database.json")
+    if not path.is_file():
+        pytest.skip(f"Fixture file not found: {path}")
+    return path
+
+
+@pytest.fixture
+def json_db(json_path) -> MovieDatabaseFromJSON:
+    """Load the movie database JSON fixture."""
+    return MovieDatabaseFromJSON.from_json(json_path)
+
+
+@pytest.fixture
+def sqlite_db(json_path, tmp_path) -> MovieDatabaseFromSQLite:
+    """Import the JSON fixture into a SQLite database."""
+    database = MovieDatabaseFromSQLite.from_json(json_path, tmp_path / "movie_database.sqlite")
+    yield database
+    database.close()
+
+
+def test_round_trip(json_db, sqlite_db):
+    """Movies read from the SQLite database equal the imported movies, in order."""
+    assert len(sqlite_db.movies) == len(json_db.movies)
+    assert list(sqlite_db.movies) == json_db.movies
+    assert sqlite_db.composers == json_db.composers
+    assert sqlite_db.to_json() == json_db.to_json()
+
+
+def test_to_sqlite(json_db, tmp_path):
+    """MovieDatabase.to_sqlite writes a database readable by MovieDatabaseFromSQLite."""
+    path = tmp_path / "exported.sqlite"
+    json_db.to_sqlite(path)
+    sqlite_db = MovieDatabaseFromSQLite(path=path)
+    assert list(sqlite_db.movies) == json_db.movies
+    sqlite_db.close()
+
+
+def test_movies_sequence(json_db, sqlite_db):
+    """The movie sequence supports positive and negative indexes and slices."""
+    assert sqlite_db.movies[0] == json_db.movies[0]
+    assert sqlite_db.movies[-1] == json_db.movies[-1]
+    assert sqlite_db.movies[2:5] == json_db.movies[2:5]
+    assert sqlite_db.movies[::-3] == json_db.movies[::-3]
+    assert sqlite_db.movies[5:2] == []
+    with pytest.raises(IndexError):
+        sqlite_db.movies[len(json_db.movies)]
+
+
+@pytest.mark.parametrize(
+    "criteria",
+    [
+        {},
+        {"composer": "John Williams"},
+        {"director": "Steven Spielberg", "composer": "John Williams"},
+        {"year": 1977},
+        {"cast": "Harrison Ford"},
+        {"cast": ["Harrison Ford", "Mark Hamill"]},
+        {"title": "Not a movie"},
+        {"composer": ""},
+    ],
+)
+def test_filter_matches_json_database(json_db, sqlite_db, criteria):
+    """Indexed SQL filtering returns the same movies as the in-memory filter."""
+    assert sqlite_db.filter(**criteria) == json_db.filter(**criteria)
+
+
+def test_filter_uses_indexes(sqlite_db):
+    """Filtering by composer is served by an index rather than a full table scan."""
+    plan = sqlite_db.connection.execute(
+        "EXPLAIN QUERY PLAN SELECT id FROM movies WHERE composer_id = (SELECT id FROM people WHERE name = ?)",
+        ("John Williams",),
+    ).fetchall()
+    assert any("movies_composer" in row[-1] for row in plan)
+
+
+def test_add_movies_refreshes_aggregates(sqlite_db):
+    """Adding movies is visible in the movies, filters and aggregates."""
+    composers = sqlite_db.composers
+    movie = Movie(title="New Movie", director="New Director", composer="New Composer", cast=["A", "B"], year=2030)
+    assert sqlite_db.add_movies([movie]) == 1
+    assert sqlite_db.movies[-1] == movie
+    assert sqlite_db.filter(composer="New Composer") == [movie]
+    assert sqlite_db.composers == sorted([*composers, "New Composer"])
+    assert sqlite_db.aggregates().year_counts[2030] == 1
+
+
+def test_empty_database(tmp_path):
+    """An empty database has no movies and no composers."""
+    sqlite_db = MovieDatabaseFromSQLite.from_sqlite(tmp_path / "empty.sqlite")
+    assert len(sqlite_db.movies) == 0
+    assert list(sqlite_db.movies) == []
+    assert sqlite_db.composers == []
+    assert sqlite_db.to_json() == "[]"
+    sqlite_db.close()
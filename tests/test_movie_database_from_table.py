@@ -0,0 +1,118 @@
+"""Test module for MovieTable, MovieView and MovieDatabaseFromTable."""
+
+from pathlib import Path
+import random
+
+import pytest
+
+from hollywood_pub_sub.movie import Movie
+from hollywood_pub_sub.movie_database_from_json import MovieDatabaseFromJSON
+from hollywood_pub_sub.movie_database_from_table import MovieDatabaseFromTable
+from hollywood_pub_sub.movie_table import MovieTable, MovieView
+
+
+@pytest.fixture
+def json_db() -> MovieDatabaseFromJSON:
+    """Load the movie database JSON fixture."""
+    path = Path("tests/fixtures/movie_database.json")
+    if not path.is_file():
+        pytest.skip(f"Fixture file not found: {path}")
+    return MovieDatabaseFromJSON.from_json(path)
+
+
+@pytest.fixture
+def table_db(json_db) -> MovieDatabaseFromTable:
+    """Build a table-backed database from the JSON fixture movies."""
+    return MovieDatabaseFromTable.from_movies(json_db.movies)
+
+
+def test_views_match_movies(json_db, table_db):
+    """Views expose the same fields as the movies they were built from."""
+    assert table_db.movies == json_db.movies
+    assert all(isinstance(view, MovieView) for view in table_db.movies)
+    assert [view.to_movie() for view in table_db.movies] == json_db.movies
+    assert table_db.to_json() == json_db.to_json()
+
+
+def test_names_are_interned(table_db):
+    """Each name is stored once in the shared vocabulary."""
+    table = table_db.table
+    assert len(table.names) == len(set(table.names))
+    assert sorted(table.names) == sorted(
+        {name for view in table_db.movies for name in (view.director, view.composer, *view.cast)}
+    )
+
+
+def test_composers(json_db, table_db):
+    """Composers are read from the composer column."""
+    assert table_db.composers == json_db.composers
+
+
+@pytest.mark.parametrize(
+    "criteria",
+    [
+        {},
+        {"composer": "John Williams"},
+        {"director": "Orson Welles"},
+        {"year": 1983},
+        {"title": "Citizen Kane"},
+        {"cast": "Harrison Ford"},
+        {"cast": ["Harrison Ford", "Sean Connery"]},
+        {"composer": "John Williams", "year": 1981},
+        {"composer": "Unknown Composer"},
+        {"cast": "Unknown Actor"},
+        {"composer": "", "year": 0},
+    ],
+)
+def test_filter_matches_movie_database_filter(json_db, table_db, criteria):
+    """Filtering on the columns gives the same movies as MovieDatabase.filter."""
+    assert table_db.filter(**criteria) == json_db.filter(**criteria)
+
+
+def test_movies_can_be_shuffled(table_db):
+    """The list of views supports in-place shuffling, without changing the table."""
+    titles = list(table_db.table.titles)
+    random.Random(0).shuffle(table_db.movies)
+    assert sorted(view.title for view in table_db.movies) == sorted(titles)
+    assert table_db.table.titles == titles
+
+
+def test_empty_table():
+    """An empty table has no movies, composers nor matches."""
+    table_db = MovieDatabaseFromTable(table=MovieTable())
+    assert table_db.movies == []
+    assert table_db.composers == []
+    assert table_db.filter(composer="John Williams") == []
+
+
+def test_view_equality():
+    """A view equals a Movie with the same fields."""
+    movie = Movie(title="Jaws", director="Steven Spielberg", composer="John Williams", cast=["Roy Scheider"], year=1975)
+    view = MovieView(MovieTable([movie]), 0)
+    assert view == movie
+    assert view != movie.model_copy(update={"year": 1976})
+
+
+def test_aggregates(json_db, table_db):
+    """Aggregates computed on the columns match the movies, and follow modifications of the views."""
+    assert table_db.aggregates().composer_counts == json_db.aggregates().composer_counts
+    assert table_db.aggregates().directors == json_db.aggregates().directors
+
+    del table_db.movies[:3]
+    del json_db.movies[:3]
+    assert table_db.aggregates().year_histogram == json_db.aggregates().year_histogram
+    assert table_db.composers == json_db.composers
+
+
+def test_filter_follows_modified_movies(table_db):
+    """Filtering reflects movies added to or removed from the list, and returns the listed views."""
+    first = table_db.movies[0]
+    assert table_db.filter(title=first.title)[0] is first
+
+    added = Movie(title="Added", director="Director", composer="New Composer", cast=[], year=2000)
+    table_db.movies.append(added)
+    assert table_db.filter(composer="New Composer") == [added]
+    assert "New Composer" in table_db.composers
+
+    del table_db.movies[0]
+    assert first not in table_db.filter(title=first.title)
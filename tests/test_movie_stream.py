@@ -0,0 +1,95 @@
+"""Unit tests for MovieStream and window_shuffle."""
+
+from collections.abc import Iterator
+import random
+import threading
+
+import pytest
+
+from hollywood_pub_sub.movie import Movie
+from hollywood_pub_sub.movie_stream import MovieStream, window_shuffle
+
+
+def make_movies(count: int) -> list[Movie]:
+    """Build distinct movies."""
+    return [
+        Movie(title=f"Movie {idx}", director="Director", composer="Composer", cast=[], year=2000)
+        for idx in range(count)
+    ]
+
+
+def test_stream_yields_movies_in_order() -> None:
+    """Test that a stream yields every produced movie, in order."""
+    movies = make_movies(100)
+    with MovieStream(movies, maxsize=4) as stream:
+        assert list(stream) == movies
+        assert stream.produced == 100
+        assert next(stream, None) is None
+
+
+def test_stream_is_bounded() -> None:
+    """Test that the producer never gets more than maxsize movies ahead of the consumer."""
+    consumed = 0
+    ahead = []
+
+    def produce() -> Iterator[Movie]:
+        for movie in make_movies(50):
+            ahead.append(produced_count[0] - consumed)
+            produced_count[0] += 1
+            yield movie
+
+    produced_count = [0]
+    with MovieStream(produce(), maxsize=5) as stream:
+        for _ in stream:
+            consumed += 1
+    assert max(ahead) <= 5 + 1
+
+
+def test_stream_reraises_producer_errors() -> None:
+    """Test that an exception raised while producing is raised by the consumer after the produced movies."""
+
+    def produce() -> Iterator[Movie]:
+        yield from make_movies(2)
+        raise RuntimeError("fetch failed")
+
+    with MovieStream(produce()) as stream:
+        assert next(stream).title == "Movie 0"
+        assert next(stream).title == "Movie 1"
+        with pytest.raises(RuntimeError, match="fetch failed"):
+            next(stream)
+
+
+def test_closing_stream_stops_producer() -> None:
+    """Test that closing a stream early stops and closes the producing generator."""
+    closed = threading.Event()
+
+    def produce() -> Iterator[Movie]:
+        try:
+            while True:
+                yield from make_movies(10)
+        finally:
+            closed.set()
+
+    stream = MovieStream(produce(), maxsize=2)
+    assert next(stream).title == "Movie 0"
+    stream.close()
+    assert closed.is_set()
+    assert next(stream, None) is None
+
+
+@pytest.mark.parametrize("window", [1, 3, 10, 1000])
+def test_window_shuffle_is_a_bounded_permutation(window: int) -> None:
+    """Test that window shuffling yields every movie once, never earlier than window positions ahead."""
+    movies = make_movies(100)
+    shuffled = list(window_shuffle(iter(movies), window, rng=random.Random(0)))
+    assert sorted(shuffled, key=movies.index) == movies
+    # Only the first window movies can be yielded first, and so on
+    assert all(movies.index(movie) < position + window for position, movie in enumerate(shuffled))
+    if window == 1:
+        assert shuffled == movies
+
+
+def test_window_shuffle_rejects_empty_window() -> None:
+    """Test that the window must hold at least one movie."""
+    with pytest.raises(ValueError):
+        list(window_shuffle(make_movies(3), 0))
@@ -0,0 +1,63 @@
+"""Unit tests for the PersonIdTable persistent resolution table."""
+
+import json
+from pathlib import Path
+
+from hollywood_pub_sub.person_id_table import PERSON_ID_TABLE_VERSION, PersonIdTable
+
+
+def test_resolutions_are_saved_in_bulk(tmp_path: Path) -> None:
+    """Test that recorded ids are only written by save, then reloaded."""
+    path = tmp_path / "person_ids.json"
+    table = PersonIdTable(path)
+    table.record("Hans Zimmer", 947)
+    table.record("Nobody", None)
+    assert not path.exists()
+    table.save()
+
+    table = PersonIdTable(path)
+    assert "Hans Zimmer" in table and table.get("Hans Zimmer") == 947
+    assert "Nobody" in table and table.get("Nobody") is None
+    assert "Somebody" not in table
+
+
+def test_overrides_take_precedence(tmp_path: Path) -> None:
+    """Test that manual overrides win over resolved ids and are kept in the file."""
+    path = tmp_path / "person_ids.json"
+    table = PersonIdTable(path, overrides={"John Williams": 491})
+    table.record("John Williams", 1234)
+    table.save()
+
+    table = PersonIdTable(path)
+    assert table.get("John Williams") == 491
+    assert json.loads(path.read_text())["overrides"] == {"John Williams": 491}
+
+
+def test_other_version_is_ignored(tmp_path: Path) -> None:
+    """Test that ids written with another format version are ignored, but not the overrides."""
+    path = tmp_path / "person_ids.json"
+    path.write_text(
+        json.dumps({"version": PERSON_ID_TABLE_VERSION + 1, "ids": {"A": 1}, "overrides": {"B": 2}}), encoding="utf-8"
+    )
+    table = PersonIdTable(path)
+    assert "A" not in table
+    assert table.get("B") == 2
+    table.save()
+    assert json.loads(path.read_text())["version"] == PERSON_ID_TABLE_VERSION
+
+
+def test_known_overrides_do_not_rewrite_the_file(tmp_path: Path) -> None:
+    """Test that passing overrides already in the file does not make save rewrite it."""
+    path = tmp_path / "person_ids.json"
+    PersonIdTable(path, overrides={"John Williams": 491}).save()
+    # Saving replaces the file with a new one
+    inode = path.stat().st_ino
+
+    table = PersonIdTable(path, overrides={"John Williams": 491})
+    table.save()
+    assert path.stat().st_ino == inode
+
+    table = PersonIdTable(path, overrides={"John Williams": 492})
+    table.save()
+    assert table.get("John Williams") == 492
+    assert json.loads(path.read_text())["overrides"] == {"John Williams": 492}
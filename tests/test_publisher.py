@@ -1,7 +1,13 @@
 """Unit tests for the Publisher class in hollywood_pub_sub."""
 
+import threading
+
+import pytest
+
 from hollywood_pub_sub.movie import Movie
+import hollywood_pub_sub.publisher as publisher_module
 from hollywood_pub_sub.publisher import Publisher
+from hollywood_pub_sub.subscriber import Subscriber
 
 
 def test_subscribe_and_publish(monkeypatch):
@@ -90,3 +96,190 @@ def test_no_subscribers_publish():
 
     # Call publish with no subscribers — should run silently without errors
     publisher.publish(movie)
+
+
+def test_keyed_subscribers_only_receive_matching_movies():
+    """Test keyed subscribers only receive movies routed to their key while broadcast subscribers receive all."""
+    zimmer_movie = Movie(
+        title="Dune",
+        director="Denis Villeneuve",
+        composer="Hans Zimmer",
+        cast=["Timothée Chalamet"],
+        year=2021,
+    )
+    shore_movie = Movie(
+        title="The Fly",
+        director="David Cronenberg",
+        composer="Howard Shore",
+        cast=["Jeff Goldblum"],
+        year=1986,
+    )
+    publisher = Publisher(movies=[zimmer_movie, shore_movie])
+
+    calls = []
+    publisher.subscribe(lambda m: calls.append(("zimmer", m.title)), key="Hans Zimmer")
+    publisher.subscribe(lambda m: calls.append(("shore", m.title)), key="Howard Shore")
+    publisher.subscribe(lambda m: calls.append(("all", m.title)))
+
+    publisher.publish(zimmer_movie)
+    publisher.publish(shore_movie)
+
+    # Keyed callbacks are called before broadcast ones, each only for its own composer
+    assert calls == [
+        ("zimmer", "Dune"),
+        ("all", "Dune"),
+        ("shore", "The Fly"),
+        ("all", "The Fly"),
+    ]
+
+
+def test_publish_with_unknown_key_reaches_broadcast_only():
+    """Test publishing a movie whose composer has no keyed subscriber only reaches broadcast subscribers."""
+    movie = Movie(
+        title="Psycho",
+        director="Alfred Hitchcock",
+        composer="Bernard Herrmann",
+        cast=["Anthony Perkins"],
+        year=1960,
+    )
+    publisher = Publisher(movies=[movie])
+
+    calls = []
+    publisher.subscribe(lambda m: calls.append("keyed"), key="John Williams")
+    publisher.subscribe(lambda m: calls.append("all"))
+
+    publisher.publish(movie)
+
+    assert calls == ["all"]
+
+
+def test_pooled_publish_keeps_order_per_subscriber():
+    """Test pooled dispatch delivers movies to each subscriber in publication order."""
+    movies = [
+        Movie(title=f"Movie {idx}", director="Director", composer="Composer", cast=[], year=2000) for idx in range(20)
+    ]
+    received = {"cb1": [], "cb2": [], "cb3": []}
+
+    with Publisher(movies=movies, max_workers=2) as publisher:
+        for name, titles in received.items():
+            publisher.subscribe(
+                lambda m, titles=titles: titles.append(m.title), key="Composer" if name == "cb1" else None
+            )
+        for movie in movies:
+            publisher.publish(movie)
+
+    for titles in received.values():
+        assert titles == [movie.title for movie in movies]
+
+
+def test_pooled_publish_reports_failures_without_aborting(monkeypatch):
+    """Test pooled dispatch records exceptions and timeouts while other callbacks still run."""
+    monkeypatch.setattr(publisher_module.logger, "warning", lambda msg: None)
+    movie = Movie(title="Jaws", director="Steven Spielberg", composer="John Williams", cast=[], year=1975)
+    release = threading.Event()
+    calls = []
+
+    def failing(m):
+        raise RuntimeError("boom")
+
+    def hanging(m):
+        release.wait(timeout=5)
+
+    with Publisher(movies=[movie], max_workers=3, callback_timeout=0.05) as publisher:
+        publisher.subscribe(failing)
+        publisher.subscribe(hanging)
+        publisher.subscribe(lambda m: calls.append(m.title))
+        publisher.publish(movie)
+        release.set()
+
+    assert calls == ["Jaws"]
+    errors = {callback: error for callback, _, error in publisher.failures}
+    assert isinstance(errors[failing], RuntimeError)
+    assert isinstance(errors[hanging], TimeoutError)
+
+
+def test_publisher_rejects_invalid_pool_size():
+    """Test a non-positive number of dispatch workers raises ValueError."""
+    with pytest.raises(ValueError, match="strictly positive"):
+        Publisher(movies=[], max_workers=0)
+
+
+def test_publish_many_groups_batches_by_key():
+    """Test publish_many calls each subscriber once with its share of the batch through its batch callback."""
+    movies = [
+        Movie(title="Jaws", director="Steven Spielberg", composer="John Williams", cast=[], year=1975),
+        Movie(title="Vertigo", director="Alfred Hitchcock", composer="Bernard Herrmann", cast=[], year=1958),
+        Movie(title="Star Wars", director="George Lucas", composer="John Williams", cast=[], year=1977),
+    ]
+
+    class BatchSubscriber:
+        def __init__(self):
+            self.batches = []
+
+        def on_movie_published(self, movie):
+            raise AssertionError("Single-movie callback must not be used when a batch callback exists")
+
+        def on_movies_published(self, batch):
+            self.batches.append([movie.title for movie in batch])
+
+    williams = BatchSubscriber()
+    single_calls = []
+    publisher = Publisher(movies=movies)
+    publisher.subscribe(williams.on_movie_published, key="John Williams", batch_callback=williams.on_movies_published)
+    publisher.subscribe(lambda m: single_calls.append(m.title))
+    # Batch callbacks are given explicitly, so they need not be bound methods
+    herrmann = BatchSubscriber()
+    herrmann_calls = []
+    publisher.subscribe(lambda m: herrmann_calls.append(m.title), key="Bernard Herrmann")
+    publisher.subscribe(
+        lambda m: None, key="Bernard Herrmann", batch_callback=lambda batch: herrmann.on_movies_published(batch)
+    )
+
+    publisher.publish_many(movies)
+
+    assert williams.batches == [["Jaws", "Star Wars"]]
+    assert herrmann.batches == [["Vertigo"]]
+    assert herrmann_calls == ["Vertigo"]
+    # Callbacks without batch callback keep receiving one movie at a time
+    assert single_calls == ["Jaws", "Vertigo", "Star Wars"]
+
+
+def test_publish_many_orders_movies_within_keys_only():
+    """Test interleaved keys: each key keeps publication order, but keys are delivered by first appearance."""
+    movies = [
+        Movie(title=f"Movie {idx}", director="Director", composer=composer, cast=[], year=2000)
+        for idx, composer in enumerate("ABBAA")
+    ]
+
+    def play(publish):
+        publisher = Publisher(movies=movies)
+        winners = []
+        subscribers = [Subscriber(name=name, winning_threshold=2, on_win=winners.append) for name in "AB"]
+        for subscriber in subscribers:
+            publisher.subscribe(
+                subscriber.on_movie_published, key=subscriber.name, batch_callback=subscriber.on_movies_published
+            )
+        publish(publisher)
+        return [winner.name for winner in winners], {s.name: [m.title for m in s.movies_won] for s in subscribers}
+
+    batch_winners, batch_movies = play(lambda publisher: publisher.publish_many(movies))
+    single_winners, single_movies = play(lambda publisher: [publisher.publish(movie) for movie in movies])
+
+    assert batch_movies == single_movies == {"A": ["Movie 0", "Movie 3", "Movie 4"], "B": ["Movie 1", "Movie 2"]}
+    # B crosses the threshold first in publication order, which only movie-by-movie publication reflects
+    assert single_winners == ["B", "A"]
+    assert batch_winners == ["A", "B"]
+
+
+def test_publish_many_logs_once(monkeypatch):
+    """Test publish_many emits a single log record for the whole batch."""
+    records = []
+    monkeypatch.setattr(publisher_module.logger, "info", records.append)
+    movies = [
+        Movie(title=f"Movie {idx}", director="Director", composer="Composer", cast=[], year=2000) for idx in range(10)
+    ]
+
+    Publisher(movies=movies).publish_many(movies)
+
+    assert len(records) == 1
+    assert "10 movies" in records[0]
@@ -0,0 +1,77 @@
+"""Unit tests for the TokenBucket rate limiter and backoff delays."""
+
+import pytest
+
+from hollywood_pub_sub.rate_limiter import TokenBucket, backoff_delay
+
+
+class FakeClock:
+    """Clock advancing only when sleeping."""
+
+    def __init__(self):
+        """Start at time 0."""
+        self.now = 0.0
+        self.sleeps: list[float] = []
+
+    def __call__(self) -> float:
+        """Return the current time."""
+        return self.now
+
+    def sleep(self, delay: float) -> None:
+        """Advance the time by the delay."""
+        self.sleeps.append(delay)
+        self.now += delay
+
+
+@pytest.fixture
+def clock() -> FakeClock:
+    """Provide a fake clock."""
+    return FakeClock()
+
+
+def test_burst_then_rate(clock: FakeClock) -> None:
+    """Test that a burst of requests goes through at once, then requests are spaced by 1 / rate."""
+    bucket = TokenBucket(rate=10, burst=3, clock=clock, sleep=clock.sleep)
+    for _ in range(3):
+        bucket.acquire()
+    assert clock.now == 0
+    bucket.acquire()
+    assert clock.now == pytest.approx(0.1)
+    assert bucket.acquired == 4
+    assert bucket.waited == 1
+
+
+def test_throttle_pauses_and_halves_rate(clock: FakeClock) -> None:
+    """Test that a throttle pauses requests for the given delay and halves the rate."""
+    bucket = TokenBucket(rate=10, burst=5, clock=clock, sleep=clock.sleep)
+    bucket.throttle(delay=2.0)
+    assert bucket.rate == 5
+    bucket.acquire()
+    assert clock.now >= 2.0
+    assert bucket.throttled == 1
+
+
+def test_rate_recovers_after_successes(clock: FakeClock) -> None:
+    """Test that successes raise the rate back, without exceeding the configured maximum."""
+    bucket = TokenBucket(rate=4, burst=1, min_rate=1, recovery=1, clock=clock, sleep=clock.sleep)
+    for _ in range(3):
+        bucket.throttle()
+    assert bucket.rate == 1
+    for _ in range(10):
+        bucket.succeed()
+    assert bucket.rate == 4
+
+
+def test_invalid_parameters() -> None:
+    """Test that non-positive rates and empty buckets are rejected."""
+    with pytest.raises(ValueError):
+        TokenBucket(rate=0, burst=1)
+    with pytest.raises(ValueError):
+        TokenBucket(rate=1, burst=0)
+
+
+@pytest.mark.parametrize("attempt", [0, 1, 5, 20])
+def test_backoff_delay_is_jittered_and_capped(attempt: int) -> None:
+    """Test that backoff delays double with each attempt, are jittered and capped."""
+    delay = min(10.0, 0.5 * 2**attempt)
+    assert delay / 2 <= backoff_delay(attempt, base=0.5, cap=10.0) <= delay
@@ -0,0 +1,69 @@
+"""Tests for the Monte Carlo tournament simulation."""
+
+import numpy as np
+import pytest
+
+from hollywood_pub_sub.movie import Movie
+from hollywood_pub_sub.movie_database_from_json import MovieDatabaseFromJSON
+from hollywood_pub_sub.simulation import cap_movies_per_composer, simulate
+
+
+@pytest.fixture
+def movie_db() -> MovieDatabaseFromJSON:
+    """Return a small movie database with uneven composer filmographies."""
+    composers = ["A"] * 6 + ["B"] * 4 + ["C"] * 2
+    return MovieDatabaseFromJSON(
+        [
+            Movie(title=f"Movie {idx}", director="Director", composer=composer, cast=[], year=2000)
+            for idx, composer in enumerate(composers)
+        ]
+    )
+
+
+def test_cap_movies_per_composer_keeps_first_movies():
+    """Test only the first movies of each composer are kept, in database order."""
+    codes = np.array([0, 1, 0, 2, 0, 1, 0])
+    np.testing.assert_array_equal(cap_movies_per_composer(codes, 2), [0, 1, 0, 2, 1])
+
+
+def test_simulate_aggregates_results(movie_db):
+    """Test win probabilities and stopping times are consistent with the number of games."""
+    result = simulate(movie_db, n_games=500, winning_threshold=3, seed=42, max_workers=1)
+
+    assert result.n_games == 500
+    assert set(result.win_probabilities) <= {"A", "B"}  # C only has 2 movies
+    assert sum(result.win_probabilities.values()) + result.no_winner_probability == pytest.approx(1.0)
+    assert list(result.win_probabilities) == sorted(result.win_probabilities, key=result.win_probabilities.get)[::-1]
+    assert sum(result.stopping_times.values()) == 500
+    assert 3 <= result.mean_stopping_time <= 12
+
+
+def test_simulate_cap_can_prevent_any_win(movie_db):
+    """Test capping filmographies below the threshold leaves every game without a winner."""
+    result = simulate(movie_db, n_games=50, winning_threshold=3, max_movies_per_composer=2, seed=0, max_workers=1)
+
+    assert result.win_probabilities == {}
+    assert result.no_winner_probability == 1.0
+    assert result.mean_stopping_time is None
+
+
+def test_simulate_ignores_movies_without_composer():
+    """Test movies without composer name never win, as the game has no subscriber for them."""
+    movie_db = MovieDatabaseFromJSON(
+        [
+            Movie(title=f"Movie {idx}", director="Director", composer=composer, cast=[], year=2000)
+            for idx, composer in enumerate([""] * 8 + ["A"] * 2)
+        ]
+    )
+    result = simulate(movie_db, n_games=200, winning_threshold=2, seed=0, max_workers=1)
+
+    assert set(result.win_probabilities) == {"A"}
+    assert result.win_probabilities["A"] == 1.0
+
+
+def test_simulate_is_reproducible_across_workers(movie_db):
+    """Test seeded tournaments give the same results in process and across worker processes."""
+    serial = simulate(movie_db, n_games=200, winning_threshold=2, seed=7, max_workers=1)
+    parallel = simulate(movie_db, n_games=200, winning_threshold=2, seed=7, max_workers=2)
+
+    assert serial == parallel
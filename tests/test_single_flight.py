@@ -0,0 +1,58 @@
+"""Unit tests for the SingleFlight call coalescer."""
+
+from concurrent.futures import ThreadPoolExecutor
+import threading
+
+import pytest
+
+from hollywood_pub_sub.single_flight import SingleFlight
+
+
+def test_concurrent_calls_share_one_result() -> None:
+    """Test that calls made while the first one is in flight share its result, and that later calls run again."""
+    single_flight = SingleFlight()
+    release = threading.Event()
+    calls = []
+
+    def fetch(key: int) -> dict:
+        calls.append(key)
+        release.wait(timeout=5)
+        return {"id": key}
+
+    with ThreadPoolExecutor(max_workers=8) as executor:
+        futures = [executor.submit(single_flight.do, "key", fetch, 1) for _ in range(8)]
+        # Let every caller join the call in flight before it completes
+        while single_flight.hits + single_flight.misses < 8:
+            threading.Event().wait(0.01)
+        release.set()
+        results = [future.result() for future in futures]
+
+    assert calls == [1]
+    assert all(result is results[0] for result in results)
+    assert (single_flight.hits, single_flight.misses) == (7, 1)
+
+    assert single_flight.do("key", fetch, 2) == {"id": 2}
+    assert single_flight.misses == 2
+
+
+def test_exceptions_are_shared() -> None:
+    """Test that callers waiting for a failing call get its exception."""
+    single_flight = SingleFlight()
+    started = threading.Event()
+    release = threading.Event()
+
+    def fail() -> None:
+        started.set()
+        release.wait(timeout=5)
+        raise ValueError("not found")
+
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        leader = executor.submit(single_flight.do, "key", fail)
+        started.wait(timeout=5)
+        follower = executor.submit(single_flight.do, "key", fail)
+        while single_flight.hits < 1:
+            threading.Event().wait(0.01)
+        release.set()
+        for future in (leader, follower):
+            with pytest.raises(ValueError, match="not found"):
+                future.result()
@@ -93,3 +93,61 @@ def test_announce_win_logs(monkeypatch):
 
     # Check that the filmography entry is logged correctly
     assert any("1) Spartacus (1960) by Stanley Kubrick" in msg for msg in logged_messages)
+
+
+def test_on_win_called_once_when_crossing_threshold(monkeypatch):
+    """Test that the on_win callback is called exactly once, when the subscriber crosses its threshold."""
+    winners = []
+    sub = Subscriber(name="Hans Zimmer", winning_threshold=2, on_win=winners.append)
+    monkeypatch.setattr(sub, "announce_win", lambda: None)
+
+    sub.on_movie_published(make_movie(title="Movie 1", composer="Hans Zimmer"))
+    assert winners == []
+
+    sub.on_movie_published(make_movie(title="Movie 2", composer="Hans Zimmer"))
+    assert winners == [sub]
+
+    # Further movies do not signal the win again
+    sub.on_movie_published(make_movie(title="Movie 3", composer="Hans Zimmer"))
+    assert winners == [sub]
+
+
+def test_on_movies_published_batch(monkeypatch):
+    """Test that a batch is counted like individual publications and signals the win once."""
+    import hollywood_pub_sub.subscriber as subscriber_module
+
+    logged_messages = []
+    monkeypatch.setattr(subscriber_module.logger, "info", logged_messages.append)
+    winners = []
+    sub = Subscriber(name="Hans Zimmer", winning_threshold=2, on_win=winners.append)
+
+    movies = [
+        make_movie(title="Movie 1", composer="Hans Zimmer"),
+        make_movie(title="Movie 2", composer="Other Composer"),
+        make_movie(title="Movie 3", composer="Hans Zimmer"),
+        make_movie(title="Movie 4", composer="Hans Zimmer"),
+    ]
+    sub.on_movies_published(movies)
+
+    assert sub.movies_count == 3
+    assert [movie.title for movie in sub.movies_won] == ["Movie 1", "Movie 3", "Movie 4"]
+    assert winners == [sub]
+    # One record for the assignments, one for the win announcement
+    assert len(logged_messages) == 2
+
+    sub.on_movies_published([make_movie(title="Movie 5", composer="Hans Zimmer")])
+    assert winners == [sub]
+
+
+def test_on_win_called_with_threshold_already_met(monkeypatch):
+    """Test that a subscriber whose threshold is met from the start signals its win on its first movie."""
+    winners = []
+    sub = Subscriber(name="Hans Zimmer", winning_threshold=0, on_win=winners.append)
+    batch_sub = Subscriber(name="Hans Zimmer", winning_threshold=-1, on_win=winners.append)
+    monkeypatch.setattr(sub, "announce_win", lambda: None)
+    monkeypatch.setattr(batch_sub, "announce_win", lambda: None)
+
+    sub.on_movie_published(make_movie(title="Movie 1", composer="Hans Zimmer"))
+    batch_sub.on_movies_published([make_movie(title="Movie 1", composer="Hans Zimmer")])
+    sub.on_movie_published(make_movie(title="Movie 2", composer="Hans Zimmer"))
+    assert winners == [sub, batch_sub]
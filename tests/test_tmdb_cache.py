@@ -0,0 +1,77 @@
+"""Unit tests for the ResponseCache on-disk cache of TMDb responses."""
+
+from pathlib import Path
+
+import pytest
+
+from hollywood_pub_sub.tmdb_cache import ResponseCache
+
+
+class FakeClock:
+    """Settable wall clock."""
+
+    def __init__(self):
+        """Start at time 0."""
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        """Return the current time."""
+        return self.now
+
+
+@pytest.fixture
+def clock() -> FakeClock:
+    """Provide a fake clock."""
+    return FakeClock()
+
+
+def test_round_trip_and_persistence(tmp_path: Path) -> None:
+    """Test that responses are returned after reopening the cache, and counted as hits or misses."""
+    cache = ResponseCache(tmp_path / "cache.sqlite")
+    assert cache.get("/movie/1", {"append_to_response": "credits"}) is None
+    cache.put("/movie/1", {"append_to_response": "credits"}, {"title": "Movie"})
+    cache.close()
+
+    cache = ResponseCache(tmp_path / "cache.sqlite")
+    assert cache.get("/movie/1", {"append_to_response": "credits"}) == {"title": "Movie"}
+    assert (cache.hits, cache.misses) == (1, 0)
+    cache.close()
+
+
+def test_key_ignores_api_key_and_param_order() -> None:
+    """Test that keys do not depend on the API key or on the order and type of parameters."""
+    assert ResponseCache.key("/search/person", {"query": "A", "page": 1, "api_key": "secret"}) == ResponseCache.key(
+        "/search/person", {"page": "1", "query": "A"}
+    )
+    assert "secret" not in ResponseCache.key("/search/person", {"api_key": "secret"})
+    assert ResponseCache.key("/movie/1", {}) != ResponseCache.key("/movie/2", {})
+
+
+def test_ttl(tmp_path: Path, clock: FakeClock) -> None:
+    """Test that entries older than the TTL are ignored."""
+    cache = ResponseCache(tmp_path / "cache.sqlite", ttl=10, clock=clock)
+    cache.put("/movie/1", {}, {"title": "Movie"})
+    clock.now = 10
+    assert cache.get("/movie/1", {}) == {"title": "Movie"}
+    clock.now = 11
+    assert cache.get("/movie/1", {}) is None
+    cache.close()
+
+
+def test_lru_eviction(tmp_path: Path, clock: FakeClock) -> None:
+    """Test that the least recently used entries are evicted beyond the size cap."""
+    payload = {"title": "x" * 80}
+    cache = ResponseCache(tmp_path / "cache.sqlite", max_bytes=250, clock=clock)
+    for movie_id in range(3):
+        clock.now += 1
+        cache.put(f"/movie/{movie_id}", {}, payload)
+    assert len(cache) == 2
+    # Reading movie 1 makes movie 2 the least recently used one
+    clock.now += 1
+    assert cache.get("/movie/1", {}) == payload
+    clock.now += 1
+    cache.put("/movie/3", {}, payload)
+    assert cache.get("/movie/1", {}) == payload
+    assert cache.get("/movie/2", {}) is None
+    assert cache.size <= 250
+    cache.close()
@@ -0,0 +1,275 @@
+"""Module providing TMDbStubServer, a local stand-in for the TMDb API serving a fixed catalogue of movies."""
+
+from collections import Counter
+from collections.abc import Iterable
+from datetime import date, timedelta
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+import json
+import re
+import threading
+import time
+from typing import Self
+from urllib.parse import parse_qs, urlsplit
+
+from hollywood_pub_sub.movie import Movie
+
+
+COMPOSER_JOB = "Original Music Composer"
+CHANGES_PAGE_SIZE = 100
+
+
+class TMDbStubServer:
+    """
+    Local HTTP server answering the TMDb endpoints used by MovieDatabaseFromAPI.
+
+    The server runs in a background thread and serves `/search/person`,
+    `/person/{id}/movie_credits` and `/movie/{id}` from in-memory data, and
+    the `/person/changes` and `/movie/changes` feeds from the changes
+    registered with `record_change`, optionally waiting `latency` seconds
+    before each answer to simulate the network. Requests are counted per
+    endpoint kind, and failures such as throttling can be queued with
+    `fail_next`.
+
+    Parameters
+    ----------
+    people : dict[int, dict]
+        Person payloads by id, each with `name`, `known_for_department`, `popularity` and `crew` credits.
+    movies : dict[int, dict]
+        Movie detail payloads by id, including their `credits`.
+    latency : float
+        Delay before each answer, in seconds.
+
+    Attributes
+    ----------
+    people : dict[int, dict]
+        Person payloads by id.
+    movies : dict[int, dict]
+        Movie detail payloads by id.
+    latency : float
+        Delay before each answer, in seconds.
+    changes : dict[str, dict[int, date]]
+        Date of the last change of each changed id, by kind (`person`, `movie`).
+    request_counts : Counter[str]
+        Number of requests served per endpoint kind (`search`, `credits`, `movie`, `changes`).
+
+    """
+
+    def __init__(self, people: dict[int, dict], movies: dict[int, dict], latency: float = 0.0):
+        """Initialize the server data; call `start` or use it as a context manager to serve it."""
+        self.people = people
+        self.movies = movies
+        self.latency = latency
+        self.changes: dict[str, dict[int, date]] = {"person": {}, "movie": {}}
+        self.request_counts: Counter[str] = Counter()
+        self._failures: list[tuple[int, str | None]] = []
+        self._lock = threading.Lock()
+        self._server: ThreadingHTTPServer | None = None
+        self._thread: threading.Thread | None = None
+
+    @classmethod
+    def from_movies(cls, movies: Iterable[Movie], latency: float = 0.0) -> Self:
+        """
+        Build a server whose catalogue holds the given movies, credited to their composers.
+
+        Parameters
+        ----------
+        movies : Iterable[Movie]
+            Movies to serve; they get ids 1, 2, ... in order.
+        latency : float
+            Delay before each answer, in seconds.
+
+        Returns
+        -------
+        Self
+            A server, not started yet.
+
+        """
+        people: dict[int, dict] = {}
+        person_ids: dict[str, int] = {}
+        details: dict[int, dict] = {}
+        for movie_id, movie in enumerate(movies, start=1):
+            if movie.composer not in person_ids:
+                person_ids[movie.composer] = len(person_ids) + 1
+                people[person_ids[movie.composer]] = {
+                    "name": movie.composer,
+                    "known_for_department": "Sound",
+                    "popularity": 1.0,
+                    "crew": [],
+                }
+            people[person_ids[movie.composer]]["crew"].append(
+                {"id": movie_id, "title": movie.title, "job": COMPOSER_JOB}
+            )
+            details[movie_id] = {
+                "id": movie_id,
+                "title": movie.title,
+                "release_date": f"{movie.year}-01-01",
+                "credits": {
+                    "cast": [{"name": actor} for actor in movie.cast],
+                    "crew": [
+                        {"job": "Director", "name": movie.director},
+                        {"job": COMPOSER_JOB, "name": movie.composer},
+                    ],
+                },
+            }
+        return cls(people=people, movies=details, latency=latency)
+
+    @property
+    def url(self) -> str:
+        """Return the base URL of the running server, to be used as `BASE_URL`."""
+        host, port = self._server.server_address[:2]
+        return f"http://{host}:{port}"
+
+    def start(self) -> Self:
+        """Start serving on a free local port in a background thread."""
+        self._server = ThreadingHTTPServer(("127.0.0.1", 0), _TMDbStubHandler)
+        self._server.daemon_threads = True
+        self._server.stub = self
+        self._thread = threading.Thread(target=self._server.serve_forever, daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self) -> None:
+        """Stop the server and wait for its thread."""
+        if self._server is not None:
+            self._server.shutdown()
+            self._server.server_close()
+            self._thread.join()
+            self._server = None
+
+    def __enter__(self) -> Self:
+        """Start the server."""
+        return self.start()
+
+    def __exit__(self, *exc_info) -> None:
+        """Stop the server."""
+        self.stop()
+
+    def fail_next(self, count: int, status: int = 429, retry_after: str | None = None) -> None:
+        """
+        Answer the next requests with an error instead of their payload.
+
+        Parameters
+        ----------
+        count : int
+            Number of requests to fail.
+        status : int
+            HTTP status of the failures. Defaults to 429 (Too Many Requests).
+        retry_after : str, optional
+            Value of the `Retry-After` header of the failures.
+
+        """
+        with self._lock:
+            self._failures.extend([(status, retry_after)] * count)
+
+    def record_change(self, kind: str, item_id: int, day: date) -> None:
+        """
+        Register a change, listed by the change feed of its kind.
+
+        Parameters
+        ----------
+        kind : str
+            Kind of the changed item, `person` or `movie`.
+        item_id : int
+            Id of the changed person or movie.
+        day : date
+            Date of the change.
+
+        """
+        with self._lock:
+            self.changes[kind][item_id] = day
+
+    def pop_failure(self) -> tuple[int, str | None] | None:
+        """Return the next queued failure as a status and `Retry-After` value, or None."""
+        with self._lock:
+            return self._failures.pop(0) if self._failures else None
+
+    def handle(self, path: str, params: dict[str, str]) -> tuple[int, dict]:
+        """
+        Answer a request.
+
+        Parameters
+        ----------
+        path : str
+            Endpoint path, e.g. `/movie/3`.
+        params : dict[str, str]
+            Query parameters.
+
+        Returns
+        -------
+        tuple[int, dict]
+            HTTP status and JSON payload.
+
+        """
+        if path == "/search/person":
+            self._count("search")
+            query = params.get("query", "").casefold()
+            results = [
+                {key: value for key, value in person.items() if key != "crew"} | {"id": person_id}
+                for person_id, person in self.people.items()
+                if person["name"].casefold() == query
+            ]
+            return 200, {"results": results}
+        if match := re.fullmatch(r"/(person|movie)/changes", path):
+            self._count("changes")
+            return 200, self._changes_page(match[1], params)
+        if match := re.fullmatch(r"/person/(\d+)/movie_credits", path):
+            self._count("credits")
+            person = self.people.get(int(match[1]))
+            return (200, {"crew": person["crew"]}) if person else (404, {"status_message": "Not found"})
+        if match := re.fullmatch(r"/movie/(\d+)", path):
+            self._count("movie")
+            details = self.movies.get(int(match[1]))
+            return (200, details) if details else (404, {"status_message": "Not found"})
+        return 404, {"status_message": "Unknown endpoint"}
+
+    def _changes_page(self, kind: str, params: dict[str, str]) -> dict:
+        """Return the requested page of the ids of a kind changed between `start_date` and `end_date`, included."""
+        end = date.fromisoformat(params["end_date"]) if "end_date" in params else date.today()
+        start = date.fromisoformat(params["start_date"]) if "start_date" in params else end - timedelta(days=1)
+        page = int(params.get("page", 1))
+        with self._lock:
+            ids = sorted(item_id for item_id, day in self.changes[kind].items() if start <= day <= end)
+        results = [{"id": item_id, "adult": False} for item_id in ids]
+        return {
+            "results": results[(page - 1) * CHANGES_PAGE_SIZE : page * CHANGES_PAGE_SIZE],
+            "page": page,
+            "total_pages": max(1, -(-len(results) // CHANGES_PAGE_SIZE)),
+            "total_results": len(results),
+        }
+
+    def _count(self, kind: str) -> None:
+        """Count a request of the given kind."""
+        with self._lock:
+            self.request_counts[kind] += 1
+
+
+class _TMDbStubHandler(BaseHTTPRequestHandler):
+    """Request handler delegating to the TMDbStubServer attached to its server."""
+
+    protocol_version = "HTTP/1.1"
+
+    def do_GET(self) -> None:
+        """Answer a GET request with JSON after the simulated latency."""
+        stub: TMDbStubServer = self.server.stub
+        if stub.latency:
+            time.sleep(stub.latency)
+        headers = {"Content-Type": "application/json"}
+        if failure := stub.pop_failure():
+            status, retry_after = failure
+            payload = {"status_message": "Request failed"}
+            if retry_after is not None:
+                headers["Retry-After"] = retry_after
+        else:
+            url = urlsplit(self.path)
+            params = {key: values[-1] for key, values in parse_qs(url.query).items()}
+            status, payload = stub.handle(url.path, params)
+        body = json.dumps(payload).encode()
+        self.send_response(status)
+        for name, value in headers.items():
+            self.send_header(name, value)
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format: str, *args) -> None:
+        """Silence the default request logging."""